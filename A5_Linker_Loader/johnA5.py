@@ -12,17 +12,28 @@ sys.path.append(repo_home_path)
 from Modules.ErrorLogHandler import ErrorLogHandler
 from Modules.LinkerLoader import LinkerLoader
 
+# Scan object files in a process pool once there are at least this many of them.
+PARALLEL_THRESHOLD = 16
+
 def main():
     # Get all the input files from the command line and put them into a list.
     # They can be many files, from 1 to n.
-    input_files = sys.argv[1:]
+    # An optional --cache=DIR argument enables the incremental link cache.
+    cache_dir = None
+    input_files = []
+    for argument in sys.argv[1:]:
+        if argument.startswith("--cache="):
+            cache_dir = argument.split("=", 1)[1]
+        else:
+            input_files.append(argument)
     
     # If no input files are provided, use a default list of files.
     if not input_files:
         input_files = ['prog1.obj', 'prog2.obj', 'prog3.obj']
     
     # Create an instance of the LinkerLoader class.
-    linker_loader = LinkerLoader(input_files)
+    linker_loader = LinkerLoader(input_files, parallel=len(input_files) >= PARALLEL_THRESHOLD,
+                                 cache_dir=cache_dir)
     linker_loader.run()
 
 if __name__ == "__main__":
@@ -70,6 +70,10 @@ class AssemblerPass1:
         # Symbol Table
         self.symbol_table = SymbolTable()
         self.literal_table = LiteralTableList(logger=self.logger)
+        self.closed_literal_pool = []
+        # EQU and ORG operands are compiled once and re-evaluated from the cache
+        self.expression_parser = ExpressionParser(None, self.literal_table, self.logger)
+        self.expression_evaluator = ExpressionEvaluator(None, self.symbol_table, self.literal_table, self.logger)
         
         self.program_name = None
         self.program_start_address = 0
@@ -195,7 +199,11 @@ class AssemblerPass1:
                 self.add_line_to_generated_file(source_line)
             else:
                 line_number -= 1
+                self.write_closed_literal_pool(source_line.line_number)
                 continue
+
+            # An LTORG closes a literal pool; its literals follow the LTORG line.
+            self.write_closed_literal_pool(source_line.line_number)
             
         # Add literal code lines to the generated file
         line_for_literals = line_number
@@ -237,7 +245,8 @@ class AssemblerPass1:
             return
         
         # if there is a symbol in the label field, process it
-        if source_line.label:
+        # (an EQU label takes the value of its expression, set by directive_EQU)
+        if source_line.label and source_line.opcode_mnemonic.upper() != "EQU":
             self.process_label_field(source_line)
             
         # if theres an opcode mnemonic, process it
@@ -364,8 +373,8 @@ class AssemblerPass1:
                             _error_message = f"Invalid character literal value: {literal_value}"
                             self.logger.log_error(_error_message)
                             raise ValueError(_error_message)
-                        literal_value = ''.join(f"{ord(c):02X}" for c in literal_value)
-                        literal_length = len(literal_value) // 2  # Two characters per byte
+                        literal_value = encode_character_literal(literal_value)
+                        literal_length = len(literal_value)
     
                     elif prefix == "0X":
                         # Handle hexadecimal literals
@@ -377,7 +386,8 @@ class AssemblerPass1:
                             _error_message = f"Hexadecimal value length is not valid (must be even): {literal_value}"
                             self.logger.log_error(_error_message)
                             raise ValueError(_error_message)
-                        literal_length = len(literal_value) // 2  # Two characters per byte
+                        literal_value = bytes.fromhex(literal_value)
+                        literal_length = len(literal_value)
     
                     else:
                         raise ValueError(f"Invalid literal format: {literal_name}")
@@ -403,14 +413,37 @@ class AssemblerPass1:
             
     def assign_addresses_to_literals(self):
         """
-        Assigns addresses to all literals in the literal table.
+        Closes the current literal pool at the location counter, assigning
+        addresses to the literals used since the previous pool only.
+
+        :return: The literals of the pool.
         """
         current_address = self.location_counter.get_current_address_int()
-        self.literal_table.update_addresses(start_address=current_address)
-        # Update the location counter based on total literal size
-        total_literal_size = self.literal_table.get_total_size()
-        self.location_counter.increment_by_decimal(total_literal_size)
-        self.logger.log_action(f"Assigned addresses to literals starting from {hex(current_address)}.")
+        pool = self.literal_table.close_pool(current_address)
+        # Move the location counter past the pool
+        pool_size = sum(int(literal.length) for literal in pool)
+        self.location_counter.increment_by_decimal(pool_size)
+        self.logger.log_action(f"Assigned addresses to {len(pool)} literals starting from {hex(current_address)}.")
+        return pool
+
+    def write_closed_literal_pool(self, line_number: int):
+        """
+        Writes a literal line for each literal of the pool closed by the last
+        LTORG, numbered like the LTORG line.
+
+        :param line_number: The line number of the LTORG line.
+        """
+        for literal in self.closed_literal_pool:
+            source_line = SourceCodeLine(
+                line_number = line_number,
+                line_text = str(literal),
+                label = "*",
+                opcode_mnemonic = literal.name,
+                instruction_length = literal.length,
+                address = literal.address
+            )
+            self.add_line_to_generated_file(source_line)
+        self.closed_literal_pool = []
 
     def display_literal_table(self):
         """
@@ -473,13 +506,14 @@ class AssemblerPass1:
         Also update the address of the literals in the literal table.
         """
         line_number = line_for_literals
-        for literal in self.literal_table.get_literals():
+        # The last pool: literals used since the final LTORG. Pooled literals share their
+        # owner's bytes and address, so only owners are pending.
+        for literal in self.literal_table.close_pool(self.location_counter.get_current_address_int()):
             try:
                 # self.process_literal(literal.name)
                 line_number += 1
                 literal_as_string = str(literal)
                 literal_name = (literal.name)
-                literal_value = (literal.value)
                 literal_length = (literal.length)
                 
                 # Create a new source code line
@@ -730,12 +764,17 @@ class AssemblerPass1:
         """
         label = source_line.label
         expression = source_line.operands.strip()
+        if not label:
+            Error = f"Missing label for EQU directive: '{expression}'"
+            self.logger.log_error(Error)
+            source_line.add_error(Error)
+            return
     
         try:
             # Evaluate the expression
-            value = self.evaluate_EQU_expression(expression)
+            value, relocatable = self.evaluate_EQU_expression(expression)
             # Create a SymbolData instance
-            symbol_data = SymbolData(symbol=label, value=value, rflag=True)
+            symbol_data = SymbolData(symbol=label, value=value, rflag=relocatable)
             # Insert the symbol into the symbol table
             self.symbol_table.insert(symbol_data)
             self.logger.log_action(f"Set symbol '{label}' to value {value:X} with EQU directive.")
@@ -744,35 +783,49 @@ class AssemblerPass1:
             self.logger.log_error(Error)
             source_line.add_error(Error)
 
-    def evaluate_EQU_expression(self, expression: str) -> int:
+    def evaluate_EQU_expression(self, expression: str) -> tuple:
         """
-        Evaluates an expression and returns its value.
+        Evaluates an expression and returns its value and relocatability.
+        '*' in the expression is the current location counter.
 
         :param expression: The expression to evaluate.
-        :return: The evaluated value as an integer.
+        :return: (value, relocatable) with the value as an integer.
         """
         try:
-            if expression.split()[0] == '*':
-                value = self.location_counter.get_current_address_int()
-                # # Replace '*' with the current address
-                # expression = expression.replace('*', str(self.location_counter.get_current_address_int()))
-            elif expression.startswith('#'):
-                value = int(expression[1:], 10)
+            if expression.startswith('#'):
+                value, relocatable = int(expression[1:], 10), False
             # else if the expression is not empty
             elif expression != '':
-                # use parse line in Expression parser to parse the operands
-                Expression_Evaluator = ExpressionEvaluator(self.symbol_table, self.literal_table, self.logger)
-                ExpressionParser = ExpressionParser(self.symbol_table, self.literal_table, self.logger)
-                parsed_expression = ExpressionParser.parse_line(expression)
-                # Evaluate the parsed expression
-                value = Expression_Evaluator.evaluate_expression(parsed_expression)
+                value, relocatable = self.evaluate_compiled_expression(expression)
 
             if not isinstance(value, int):
                 raise ValueError("Expression did not evaluate to an integer.")
-            return value
+            return value, relocatable
         except Exception as e:
             raise ValueError(f"Invalid expression: {expression}. Error: {e}")
     
+    def evaluate_compiled_expression(self, expression: str) -> tuple:
+        """
+        Evaluates an expression through the cached compiled form, so an operand
+        seen before is not parsed again. '*' is the current location counter.
+
+        :param expression: The expression to evaluate.
+        :return: (value, relocatable) for the expression.
+        :raises ValueError: If the expression cannot be parsed or evaluated.
+        """
+        compiled = self.expression_parser.compile_line(expression)
+        if compiled is None:
+            raise ValueError(f"Could not parse expression '{expression}'.")
+        evaluated = self.expression_evaluator.evaluate_expression(
+            compiled, location=self.location_counter.get_current_address_int())
+        if evaluated['error']:
+            raise ValueError(evaluated['error'])
+        if not isinstance(evaluated['value'], int):
+            raise ValueError("Expression did not evaluate to an integer.")
+        if evaluated['external_references']:
+            raise ValueError("External symbols have no value until the program is linked.")
+        return evaluated['value'], evaluated['relocatable']
+
     def directive_ORG(self, source_line: SourceCodeLine):
         """
         Handles the ORG directive.
@@ -781,12 +834,7 @@ class AssemblerPass1:
     
         try:
             # Evaluate the expression
-        
-            Expression_Evaluator = ExpressionEvaluator(self.symbol_table, self.literal_table, self.logger)
-            ExpressionParser = ExpressionParser(self.symbol_table, self.literal_table, self.logger)
-            parsed_expression = ExpressionParser.parse_line(expression)
-            # Evaluate the parsed expression
-            value = Expression_Evaluator.evaluate_expression(parsed_expression)
+            value, _ = self.evaluate_compiled_expression(expression)
             # Set the location counter to the evaluated value
             self.location_counter.set_start_address(value)
             self.logger.log_action(f"Set location counter to {value:X} with ORG directive.")
@@ -805,6 +853,7 @@ class AssemblerPass1:
             if operand:
                 symbol_data = SymbolData(symbol=operand, value=0, rflag=False)
                 self.symbol_table.insert(symbol_data)
+                self.expression_evaluator.add_external_symbol(operand)
                 self.logger.log_action(f"Declared external reference '{operand}' with EXTREF directive.")
         # Set instruction length to 0
         source_line.instruction_length = 0
@@ -827,7 +876,7 @@ class AssemblerPass1:
         """
         Handles the LTORG directive.
         """
-        self.assign_addresses_to_literals()
+        self.closed_literal_pool = self.assign_addresses_to_literals()
         # Set instruction length to 0
         source_line.instruction_length = 0
         
@@ -48,6 +48,8 @@ class AssemblerPass2:
         - character_literal_prefix (str): Prefix for character literals.
         - hex_literal_prefix (str): Prefix for hexadecimal literals.
         - file_explorer (FileExplorer): Handles file operations.
+        - use_table_snapshots (bool): Load/save binary .sym/.lit table snapshots in the main program's
+          directory, where the .obj and .lst files are written. Off unless asked for.
         - location_counter (LocationCounter): Manages current address and program length.
         - object_code_generator (ObjectCodeGenerator): Generates object codes.
         - text_record_manager (TextRecordManager): Manages text records.
@@ -67,6 +69,7 @@ class AssemblerPass2:
                  allow_error_lines_in_generated_document: bool = True,
                  Listing_File_Extension: str = "lst",
                  Object_Program_File_Extension: str = "obj",
+                 use_table_snapshots: bool = False,
                  ):
         
         self.int_file = int_filename
@@ -95,6 +98,11 @@ class AssemblerPass2:
         self.symbol_table = SymbolTable(logger=self.logger)
         #self.symbol_table_driver = SymbolTableDriver(logger=self.logger)
         self.literal_table = LiteralTableList(logger=self.logger)
+        # Directive operands are compiled once and re-evaluated from the cache
+        self.expression_parser = ExpressionParser(None, self.literal_table, self.logger)
+        self.expression_evaluator = ExpressionEvaluator(None, self.symbol_table, self.literal_table, self.logger)
+        # Listing lines of each LTORG pool, keyed by the LTORG's .int line number
+        self.literal_pool_lines = {}
         
         self.program_name = None
         self.program_start_address = 0
@@ -121,6 +129,7 @@ class AssemblerPass2:
         self.hex_literal_prefix = hex_literal_prefix or '0X'
         
         self.allow_error_lines_in_generated_document = allow_error_lines_in_generated_document
+        self.use_table_snapshots = use_table_snapshots
         
         self.run()
         
@@ -155,7 +164,9 @@ class AssemblerPass2:
             literal_table=self.literal_table,
             opcode_handler=self.opcode_handler,
             logger=self.logger,
-            location_counter=self.location_counter  # Pass LocationCounter
+            location_counter=self.location_counter,  # Pass LocationCounter
+            expression_parser=self.expression_parser,
+            expression_evaluator=self.expression_evaluator
         )
         self.text_record_manager = TextRecordManager(logger=self.logger, location_counter=self.location_counter)
         self.modification_record_manager = ModificationRecordManager(
@@ -217,13 +228,25 @@ class AssemblerPass2:
             symbol_table_passed=self.symbol_table,
             literal_table_passed=self.literal_table,
             logger=self.logger,
-            int_file_content=self.int_file_content
+            int_file_content=self.int_file_content,
+            snapshot_base=self.table_snapshot_base()
             )
         int_file_parser.parse_intermediate_file_content()
         self.int_source_code_lines = int_file_parser.parsed_code_lines
         
         self.logger.log_action(f"Parsed {len(self.int_source_code_lines)} source lines.")
     
+    def table_snapshot_base(self):
+        """
+        Returns the path prefix for the symbol/literal table snapshots, or None if
+        snapshots are disabled. Like the object program and listing, they are written
+        to the main program's directory.
+        """
+        if not self.use_table_snapshots:
+            return None
+        main_program_directory = os.path.dirname(os.path.realpath(sys.argv[0]))
+        return os.path.join(main_program_directory, self.int_file_name)
+
     def print_all_things(self):
         """
         Prints out the symbol table, literal table and the parsed content of the intermediate file.
@@ -274,9 +297,13 @@ class AssemblerPass2:
                 # Handle modification records if necessary
                 if self.object_code_generator.requires_modification(source_line):
                     modification_offset, modification_length = self.object_code_generator.get_modification_details(source_line)
-                    self.modification_record_manager.add_modification(
+                    external_references = self.object_code_generator.external_references
+                    self.add_modifications(
                         address=source_line.address + modification_offset,
-                        length=modification_length
+                        length=modification_length,
+                        external_references=external_references,
+                        # Format 4 addresses are relocated unless they only name external symbols
+                        relocatable=not external_references or self.object_code_generator.relocation_info == 'R'
                     )
             else:
                 self.logger.log_error(f"Failed to generate object code for line: {source_line}")
@@ -439,72 +466,23 @@ class AssemblerPass2:
             with open(self.listing_file, 'w') as file:
                 for source_line in self.int_source_code_lines:
                     if not source_line.has_errors():
+                        pool_lines = self.literal_pool_lines.get(source_line.line_number, [])
                         line_number += 1
                         source_line.line_number = line_number
                         file.write(str(source_line) + '\n')
+                        for pool_line in pool_lines:
+                            line_number += 1
+                            pool_line.line_number = line_number
+                            file.write(str(pool_line) + '\n')
             self.logger.log_action(f"Listing file successfully written to '{self.listing_file}'.")
         except IOError as e:
             self.logger.log_error(f"Failed to write listing file to '{self.listing_file}': {e}")
             
-        self.add_literals_at_end_of_program(line_number)
         self.add_symbol_table_to_output_file()
         self.add_literal_table_to_output_file()
             
             
     
-    def add_literals_at_end_of_program(self, line_for_literals: int):
-        """
-        Appends literals to the end of the program and updates their addresses.
-        """
-        try:
-            self.logger.log_action("Trying to add literals to the output.")
-            with open(self.listing_file, 'a') as file:
-                line_number = line_for_literals
-                self.logger.log_action(f"Starting line number for literals: {line_number}")
-                for literal in self.literal_table.get_literals():
-                    try:
-                        self.logger.log_action(f"Adding literal to the output: {literal}")
-                        line_number += 1
-                        literal_as_string = str(literal)
-                        literal_name = literal.name
-                        literal_length = literal.length
-                        literal_value = literal.value                       
-                        try:
-                            # Create a new source code line
-                            source_line = SourceCodeLine(
-                                line_number=line_number,
-                                line_text=literal_as_string,
-                                label="*",
-                                opcode_mnemonic=literal_name,
-                                instruction_length=literal_length,
-                                operands= " ",
-                                address = self.location_counter.get_current_address_int()
-                            )
-                            source_line.set_object_code_int_from_hex_string(literal_value)
-                            self.logger.log_action(f"Created new source line for literal: {source_line}")
-                        except Exception as e:
-                            _error = f"An error occurred while creating a source line for the literal: {e}"
-                            self.logger.log_error(_error)
-                            continue
-                        
-                        # Add the line to the generated file
-                        file.write(str(source_line) + '\n')
-                        self.logger.log_action(f"Added literal line to the output: {source_line}")
-                        
-                    except Exception as e:
-                        _error = f"An error occurred while adding literals to the output: {e}"
-                        self.logger.log_error(_error)
-                        line_number -= 1
-                        continue
-                    
-                    # Increment the location counter
-                    self.logger.log_action(f"Incrementing location counter by {literal_length}")
-                    self.location_counter.increment_by_decimal(int(literal_length))
-        except IOError as e:
-            self.logger.log_error(f"Failed to write listing file to '{self.listing_file}': {e}")
-        except Exception as e:
-            self.logger.log_error(f"An error occurred while adding literals to the output: {e}")
-        
     def add_symbol_table_to_output_file(self):
         """
         Adds the symbol table to the output.
@@ -575,28 +553,56 @@ class AssemblerPass2:
 
     def evaluate_expression(self, expression: str) -> int:
         """
-        Safely evaluates arithmetic expressions used in directives like EQU.
-
-        Restricts allowed characters and prevents execution of arbitrary code.
+        Evaluates expressions used in directives like EQU, ORG and WORD.
 
-        :param expression: The arithmetic expression to evaluate.
+        :param expression: The expression to evaluate.
         :return: The evaluated integer value, or None if evaluation fails.
         """
-        try:
-            # For simplicity, allow only digits, operators, and spaces
-            allowed_chars = "0123456789ABCDEFabcdef+-*/() "
-            if any(char not in allowed_chars for char in expression):
-                self.logger.log_error(f"Invalid characters in expression '{expression}'.")
-                return None
-            value = eval(expression, {"__builtins__": None}, {})
-            if isinstance(value, int):
-                return value
-            else:
-                self.logger.log_error(f"Expression '{expression}' did not evaluate to an integer.")
-                return None
-        except Exception as e:
-            self.logger.log_error(f"Failed to evaluate expression '{expression}': {e}")
-            return None
+        return self.evaluate_operand_expression(expression, allow_external=False)[0]
+
+    def evaluate_operand_expression(self, expression: str, allow_external: bool = True) -> tuple:
+        """
+        Evaluates an expression with the shared expression engine: terms may be
+        symbols, literals, numbers or '*' (the location counter), combined with
+        + - * / and parentheses. The compiled form is cached by its text.
+        EXTREF symbols count as 0 and are returned as (sign, symbol) pairs.
+
+        :param expression: The expression to evaluate.
+        :param allow_external: If False, an expression that uses an EXTREF symbol fails.
+        :return: (value, relocatable, external_references), or (None, None, []) if evaluation fails.
+        """
+        compiled = self.expression_parser.compile_line(expression)
+        if compiled is None:
+            self.logger.log_error(f"Failed to evaluate expression '{expression}'.")
+            return None, None, []
+        evaluated = self.expression_evaluator.evaluate_expression(
+            compiled, location=self.location_counter.get_current_address_int())
+        if evaluated['error']:
+            self.logger.log_error(f"Failed to evaluate expression '{expression}': {evaluated['error']}")
+            return None, None, []
+        if not isinstance(evaluated['value'], int):
+            self.logger.log_error(f"Expression '{expression}' did not evaluate to an integer.")
+            return None, None, []
+        if evaluated['external_references'] and not allow_external:
+            self.logger.log_error(f"Expression '{expression}' uses an external symbol, whose value is not known until linking.")
+            return None, None, []
+        return evaluated['value'], evaluated['relocatable'], evaluated['external_references']
+
+    def add_modifications(self, address: int, length: int, external_references: list, relocatable: bool):
+        """
+        Adds the modification records for one field: a program relocation record
+        if the value is relative to the program start, and a signed record for
+        each external symbol.
+
+        :param address: The address of the field.
+        :param length: The length of the field in half-bytes.
+        :param external_references: (sign, symbol) pairs of the EXTREF terms in the operand.
+        :param relocatable: Whether the field's value is relative to the program start.
+        """
+        if relocatable:
+            self.modification_record_manager.add_modification(address=address, length=length)
+        for sign, symbol in external_references:
+            self.modification_record_manager.add_modification(address=address, length=length, sign=sign, symbol=symbol)
 
     def reset(self):
         """
@@ -687,6 +693,8 @@ class AssemblerPass2:
             self.handle_base_directive(operands)
         elif directive == "NOBASE":
             self.handle_nobase_directive()
+        elif directive == "LTORG":
+            self.handle_ltorg_directive(source_line)
         else:
             self.logger.log_error(f"Unknown directive '{directive}' at line {source_line.line_number}.")
 
@@ -739,23 +747,49 @@ class AssemblerPass2:
             self.first_executable_address = self.program_start_address
             self.logger.log_action(f"Execution begins at program start address {self.first_executable_address}.")
 
-    def handle_ltorg_directive(self):
+        # Pass 1 closed the last literal pool at END
+        self.emit_literal_pool(source_line)
+
+    def handle_ltorg_directive(self, source_line: SourceCodeLine):
         """
-        Handles the LTORG directive by assigning addresses to literals and generating their object codes.
+        Handles the LTORG directive by emitting the literal pool Pass 1 placed here.
 
-        Iterates through unassigned literals, assigns addresses, generates object codes, and logs actions.
+        :param source_line: The SourceCodeLine object representing the LTORG directive.
         """
-        unassigned_literals = self.literal_table.get_unassigned_literals()
-        for literal in unassigned_literals:
-            literal.address = self.location_counter.get_current_address_int()
+        self.emit_literal_pool(source_line)
+
+    def emit_literal_pool(self, source_line: SourceCodeLine):
+        """
+        Emits the literal pool Pass 1 placed at an LTORG or END directive.
+
+        The pool is the run of pending literals whose addresses start at the
+        location counter. Each literal's bytes go straight into the text records,
+        and a listing line is kept for it to follow the directive's line.
+
+        :param source_line: The SourceCodeLine object of the LTORG or END directive.
+        """
+        pool_lines = []
+        for literal in self.literal_table.take_pool_at(self.location_counter.get_current_address_int()):
+            address = self.location_counter.get_current_address_int()
             object_code = self.object_code_generator.generate_object_code_for_literal(literal)
             if object_code:
-                self.text_record_manager.add_object_code(literal.address, object_code)
-                self.logger.log_action(f"Assigned address {literal.address} to literal '{literal.value}' with object code '{object_code}'.")
-                # Increment location counter by literal length
-                self.location_counter.increment_by_decimal(len(object_code) // 2)  # Assuming object code is hex string
+                self.text_record_manager.add_object_code(address, object_code)
+                pool_line = SourceCodeLine(
+                    line_number=source_line.line_number,
+                    line_text=str(literal),
+                    label="*",
+                    opcode_mnemonic=literal.name,
+                    instruction_length=literal.length,
+                    operands=" ",
+                    address=address
+                )
+                pool_line.set_object_code_int_from_int(literal.int_value)
+                pool_lines.append(pool_line)
+                self.logger.log_action(f"Emitted literal '{literal.name}' at address {address:X} with object code '{object_code}'.")
             else:
-                self.logger.log_error(f"Failed to generate object code for literal '{literal.value}'.")
+                self.logger.log_error(f"Failed to generate object code for literal '{literal.name}'.")
+            self.location_counter.increment_by_decimal(int(literal.length))
+        self.literal_pool_lines[source_line.line_number] = pool_lines
 
     def handle_equ_directive(self, source_line: SourceCodeLine):
         """
@@ -857,19 +891,22 @@ class AssemblerPass2:
         operand = source_line.operands.strip()
         self.logger.log_action(f"Handling WORD directive with operand '{operand}' at line {source_line.line_number}.")
 
-        try:
-            value = int(operand)
-            object_code = f"{value:06X}"
+        value, relocatable, external_references = self.evaluate_operand_expression(operand)
+        instruction_length = 3
+        if value is None:
+            error = f"Invalid operand '{operand}' for WORD directive at line {source_line.line_number}."
+            self.logger.log_error(error)
+            source_line.add_error(error)
+        else:
+            # A word is 24 bits; negative values are stored in two's complement
+            object_code = f"{value & 0xFFFFFF:06X}"
             source_line.set_object_code_int_from_hex_string(object_code)
             self.text_record_manager.add_object_code(source_line.address, object_code)
-            instruction_length = 3
-            self.location_counter.increment_by_decimal(instruction_length)
+            self.add_modifications(source_line.address, 6, external_references, relocatable)
             source_line.set_instruction_length(instruction_length)
             self.logger.log_action(f"Generated object code '{object_code}' for WORD directive.")
-        except ValueError:
-            error = f"Invalid operand '{operand}' for WORD directive at line {source_line.line_number}."
-            self.logger.log_error(error)
-            source_line.add_error(error)
+        # Pass 1 reserved the word either way
+        self.location_counter.increment_by_decimal(instruction_length)
 
     def handle_resb_directive(self, source_line: SourceCodeLine):
         """
@@ -914,19 +951,15 @@ class AssemblerPass2:
         operand = source_line.operands.strip()
         self.logger.log_action(f"Handling EQU directive with label '{label}' and operand '{operand}' at line {source_line.line_number}.")
 
-        if operand == '*':
-            value = self.location_counter.get_current_address_int()
-        else:
-            try:
-                value = self.evaluate_expression(operand)
-            except Exception as e:
-                error = f"Invalid expression '{operand}' in EQU directive at line {source_line.line_number}."
-                self.logger.log_error(error)
-                source_line.add_error(error)
-                return
+        value, relocatable, _ = self.evaluate_operand_expression(operand, allow_external=False)
+        if value is None:
+            error = f"Invalid expression '{operand}' in EQU directive at line {source_line.line_number}."
+            self.logger.log_error(error)
+            source_line.add_error(error)
+            return
 
         if label:
-            self.symbol_table.add_symbol(label, value)
+            self.symbol_table.insert_or_update(SymbolData(label, value, relocatable))
             self.logger.log_action(f"Assigned value {value:X} to symbol '{label}'.")
         else:
             error = f"Missing label in EQU directive at line {source_line.line_number}."
@@ -987,6 +1020,7 @@ class AssemblerPass2:
             symbol = symbol.strip()
             if symbol:
                 self.external_references.append(symbol)
+                self.expression_evaluator.add_external_symbol(symbol)
                 self.logger.log_action(f"Added '{symbol}' to external references.")
             else:
                 error = f"Invalid symbol in EXTREF directive at line {source_line.line_number}."
@@ -0,0 +1,91 @@
+# ExternalSymbolTable.py
+
+import os
+import sys
+from typing import Dict, Optional
+
+from pathlib import Path
+
+repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(repo_home_path)
+
+from Modules.ErrorLogHandler import ErrorLogHandler
+
+
+class ExternalSymbolTable:
+    """
+    External symbol table (ESTAB) for the linking loader.
+    Holds control section names and externally defined symbols with their absolute addresses.
+    Entries live in a dict, so duplicate detection and symbol resolution are O(1).
+    """
+
+    def __init__(self, logger: Optional[ErrorLogHandler] = None):
+        """
+        Initializes an empty ESTAB.
+
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        """
+        self.logger = logger or ErrorLogHandler()
+        self.symbols: Dict[str, int] = {}            # name -> absolute address
+        self.section_lengths: Dict[str, int] = {}    # control section name -> CSLTH
+        self.owners: Dict[str, str] = {}             # symbol name -> control section name
+
+    def add_control_section(self, name: str, address: int, length: int) -> bool:
+        """
+        Enters a control section name into ESTAB.
+
+        :param name: The control section name from the Header record.
+        :param address: The control section address (CSADDR).
+        :param length: The control section length (CSLTH).
+        :return: True if added, False if the name was already defined.
+        """
+        if name in self.symbols:
+            self.logger.log_error(f"Duplicate external symbol '{name}' (control section).", "ExternalSymbolTable.add_control_section")
+            return False
+        self.symbols[name] = address
+        self.section_lengths[name] = length
+        self.owners[name] = name
+        return True
+
+    def add_symbol(self, name: str, address: int, section: str) -> bool:
+        """
+        Enters an externally defined symbol into ESTAB.
+
+        :param name: The symbol name from a Define record.
+        :param address: The absolute address (CSADDR + indicated address).
+        :param section: The control section that defines the symbol.
+        :return: True if added, False if the name was already defined.
+        """
+        if name in self.symbols:
+            self.logger.log_error(f"Duplicate external symbol '{name}' in control section '{section}'.", "ExternalSymbolTable.add_symbol")
+            return False
+        self.symbols[name] = address
+        self.owners[name] = section
+        return True
+
+    def get(self, name: str) -> Optional[int]:
+        """
+        Looks up the absolute address of a symbol or control section.
+
+        :param name: The name to look up.
+        :return: The address, or None if the name is not defined.
+        """
+        return self.symbols.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.symbols
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __str__(self) -> str:
+        """
+        Returns the load map: one line per control section followed by its symbols.
+        """
+        lines = [f"{'CSECT':<8}{'SYMBOL':<8}{'ADDRESS':<9}{'LENGTH':<6}"]
+        for section, length in self.section_lengths.items():
+            lines.append(f"{section:<8}{'':<8}{self.symbols[section]:05X}    {length:05X}")
+            for name, owner in self.owners.items():
+                if owner == section and name != section:
+                    lines.append(f"{'':<8}{name:<8}{self.symbols[name]:05X}")
+        return "\n".join(lines)
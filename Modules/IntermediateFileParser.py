@@ -21,6 +21,7 @@ from Modules.Symbol_Table_Builder import SymbolTable, SymbolData
 from Modules.Literal_Table_Builder import LiteralTableList, LiteralData
 from Modules.SourceCodeLine import SourceCodeLine
 from Modules.Validator import Validator
+from Modules.TableSnapshot import TableSnapshot
 
 
 class IntermediateFileParser:
@@ -41,7 +42,8 @@ class IntermediateFileParser:
                  read_error_line_input: bool = False,
                  Program_length_prefix_for_Hex: str = None,
                  Program_length_prefix_for_Decimal: str = None,
-                 use_new_line_numbers: bool = True
+                 use_new_line_numbers: bool = True,
+                 snapshot_base: str = None
                  ):
         self.logger = logger or ErrorLogHandler()
         self.symbol_table = symbol_table_passed or SymbolTable(logger=self.logger)
@@ -62,6 +64,9 @@ class IntermediateFileParser:
         self.program_length_prefix_for_decimal = Program_length_prefix_for_Decimal  or "Program Length (DEC):"
         
         self.use_new_line_numbers = use_new_line_numbers
+
+        # Path prefix for binary table snapshots (<base>.sym / <base>.lit), or None.
+        self.snapshot_base = snapshot_base
         self.new_line_number = 1  # Initialize new line number counter
 
         
@@ -285,15 +290,24 @@ class IntermediateFileParser:
       
     def parse_symbol_table(self, lines_iterator):
         """
-        Parses the symbol table section of the intermediate file.
+        Parses the symbol table section of the intermediate file. Valid
+        entries are collected and bulk loaded into the symbol table once the
+        section ends. When snapshots are enabled and a snapshot built from the
+        same section text exists, it is loaded instead and the lines are not
+        re-validated; otherwise a snapshot is written after a clean parse.
 
         :param lines_iterator: An iterator over the lines of the intermediate file.
         :return: None
         """
-        for line in lines_iterator:
+        section_lines = self.read_section(lines_iterator, '===SYM_END===')
+        snapshot_path, digest = self.snapshot_for(section_lines, "sym")
+        if snapshot_path and self.symbol_table.load_snapshot(snapshot_path, digest):
+            return
+
+        error_count = len(self.errors)
+        parsed_symbols = []
+        for line in section_lines:
             line = line.strip()
-            if line == '===SYM_END===':
-                break
             if line in self.fluff_lines:
                 continue
             if self.is_divider_line(line) or not line:
@@ -341,7 +355,7 @@ class IntermediateFileParser:
                         iflag=iflag_bool,
                         mflag=mflag_bool
                     )
-                    self.symbol_table.insert(temp_SymbolData)
+                    parsed_symbols.append(temp_SymbolData)
                 else:
                     if not self.validator.valid_label(parts[0]):
                         self.logger.log_error(f"Invalid label: '{parts[0]}'")
@@ -361,7 +375,38 @@ class IntermediateFileParser:
                 _error = f"Incorrect number of fields in symbol table line: '{line}'"
                 self.logger.log_error(_error)
                 self.errors.append(_error)
-                
+
+        self.symbol_table.bulk_load(parsed_symbols)
+        if snapshot_path and len(self.errors) == error_count:
+            self.symbol_table.save_snapshot(snapshot_path, digest)
+
+    def read_section(self, lines_iterator, end_marker):
+        """
+        Collects the lines of a table section up to (not including) its end marker.
+
+        :param lines_iterator: An iterator over the lines of the intermediate file.
+        :param end_marker: The line that closes the section.
+        :return: List of the section's lines.
+        """
+        section_lines = []
+        for line in lines_iterator:
+            if line.strip() == end_marker:
+                break
+            section_lines.append(line)
+        return section_lines
+
+    def snapshot_for(self, section_lines, extension):
+        """
+        Returns the snapshot path and source digest for a table section.
+
+        :param section_lines: The section's lines.
+        :param extension: Snapshot file extension.
+        :return: (path, digest), or (None, None) when snapshots are disabled.
+        """
+        if not self.snapshot_base:
+            return None, None
+        return f"{self.snapshot_base}.{extension}", TableSnapshot.digest_lines(section_lines)
+
     def parse_literal_table(self, lines_iterator):
         """
         Parses the literal table from the lines iterator, adding the
@@ -370,11 +415,14 @@ class IntermediateFileParser:
         :param lines_iterator: An iterator over the lines of the file.
         :return: None
         """
+        section_lines = self.read_section(lines_iterator, '===LIT_END===')
+        snapshot_path, digest = self.snapshot_for(section_lines, "lit")
+        if snapshot_path and self.literal_table.load_snapshot(snapshot_path, digest):
+            return
 
-        for line in lines_iterator:
+        clean = True
+        for line in section_lines:
             line = line.strip()
-            if line == '===LIT_END===':
-                break
             if line in self.fluff_lines:
                 continue
             if self.is_divider_line(line) or not line:
@@ -395,6 +443,10 @@ class IntermediateFileParser:
             else:
                 _error = (f"Invalid literal table line: '{line}'")
                 self.logger.log_error(_error)
+                clean = False
+
+        if snapshot_path and clean:
+            self.literal_table.save_snapshot(snapshot_path, digest)
                 
     def parse_program_length(self, lines_iterator):
         """
@@ -0,0 +1,228 @@
+# LinkerCache.py
+
+import os
+import sys
+import struct
+import hashlib
+from typing import List, Optional
+
+from pathlib import Path
+
+repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(repo_home_path)
+
+from Modules.ErrorLogHandler import ErrorLogHandler
+from Modules.LinkerParser import (HeaderRecord, DefineRecord, ReferRecord, TextRecord,
+                                  ModificationRecord, EndRecord)
+
+
+class LinkerCache:
+    """
+    On-disk cache of parsed object files for incremental relinking.
+
+    Each object file gets one cache entry, named after a hash of its absolute path.
+    The entry holds the SHA-256 hash of the file's contents, followed by its control
+    sections encoded as compact binary records (Text record object code is stored
+    as raw bytes, not hex). On load the file is hashed again, and the entry is used
+    only if the hashes match. Size and mtime are not trusted: an edit that keeps
+    both still misses, and a touched but unchanged file still hits. Hashing reads
+    the whole file, but that costs far less than parsing it.
+    Files that produced parse errors are never cached, so their errors are
+    reported on every link.
+    """
+
+    MAGIC = b"LNKC"
+    VERSION = 2
+    _HEADER = struct.Struct(">4sB32s")   # magic, version, sha256
+
+    def __init__(self, cache_dir: str, logger: Optional[ErrorLogHandler] = None):
+        """
+        Initializes the cache, creating the directory if needed.
+
+        :param cache_dir: Directory that holds the cache entries.
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        """
+        self.cache_dir = cache_dir
+        self.logger = logger or ErrorLogHandler()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def entry_path(self, file_path: str) -> str:
+        """
+        Returns the cache entry path for an object file.
+
+        :param file_path: Path to the object file.
+        """
+        key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.lnk")
+
+    @staticmethod
+    def file_digest(file_path: str) -> bytes:
+        """
+        Computes the SHA-256 digest of a file's contents.
+
+        :param file_path: Path to the file.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.digest()
+
+    def load(self, file_path: str) -> Optional[List[list]]:
+        """
+        Returns the cached control sections of an object file if its contents have not changed.
+
+        :param file_path: Path to the object file.
+        :return: The control sections, or None on a cache miss.
+        """
+        entry = self.entry_path(file_path)
+        try:
+            with open(entry, "rb") as file:
+                blob = file.read()
+            magic, version, digest = self._HEADER.unpack_from(blob, 0)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError("stale cache format")
+            if self.file_digest(file_path) != digest:
+                self.misses += 1
+                return None
+            control_sections = self.decode(blob, self._HEADER.size)
+        except (OSError, ValueError, struct.error, UnicodeDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return control_sections
+
+    def store(self, file_path: str, control_sections: List[list]):
+        """
+        Writes the cache entry for an object file.
+
+        :param file_path: Path to the object file.
+        :param control_sections: The parsed control sections of the file.
+        """
+        try:
+            payload = self.encode(control_sections)
+            header = self._HEADER.pack(self.MAGIC, self.VERSION, self.file_digest(file_path))
+            entry = self.entry_path(file_path)
+            temp_entry = entry + ".tmp"
+            with open(temp_entry, "wb") as file:
+                file.write(header + payload)
+            os.replace(temp_entry, entry)
+        except (OSError, ValueError, struct.error) as e:
+            self.logger.log_error(f"Could not cache '{file_path}': {e}", "LinkerCache.store")
+
+    @staticmethod
+    def _pack_name(parts: list, name: str):
+        raw = name.encode("ascii")
+        parts.append(struct.pack(">B", len(raw)))
+        parts.append(raw)
+
+    @staticmethod
+    def _unpack_name(blob: bytes, offset: int):
+        length = blob[offset]
+        return blob[offset + 1:offset + 1 + length].decode("ascii"), offset + 1 + length
+
+    def encode(self, control_sections: List[list]) -> bytes:
+        """
+        Encodes control sections into the compact binary form.
+
+        :param control_sections: Parsed records, one list per control section.
+        :return: The encoded payload.
+        :raises ValueError: If a Text record's object code is not valid hex.
+        """
+        parts = [struct.pack(">I", len(control_sections))]
+        for records in control_sections:
+            parts.append(struct.pack(">I", len(records)))
+            for record in records:
+                record_type = record.record_type
+                parts.append(record_type.encode("ascii"))
+                if record_type == 'H':
+                    self._pack_name(parts, record.program_name)
+                    parts.append(struct.pack(">II", record.start_address, record.length))
+                elif record_type == 'D':
+                    parts.append(struct.pack(">H", len(record.definitions)))
+                    for symbol, address in record.definitions:
+                        self._pack_name(parts, symbol)
+                        parts.append(struct.pack(">I", address))
+                elif record_type == 'R':
+                    parts.append(struct.pack(">H", len(record.symbols)))
+                    for symbol in record.symbols:
+                        self._pack_name(parts, symbol)
+                elif record_type == 'T':
+                    object_code = bytes.fromhex(record.hex_code)
+                    parts.append(struct.pack(">IBH", record.start_address, record.length, len(object_code)))
+                    parts.append(object_code)
+                elif record_type == 'M':
+                    parts.append(struct.pack(">IBc", record.start_address, record.half_byte_count,
+                                             record.sign.encode("ascii")))
+                    self._pack_name(parts, record.symbol)
+                elif record_type == 'E':
+                    has_address = record.execution_address is not None
+                    parts.append(struct.pack(">?I", has_address, record.execution_address if has_address else 0))
+        return b"".join(parts)
+
+    def decode(self, blob: bytes, offset: int = 0) -> List[list]:
+        """
+        Decodes control sections from the compact binary form.
+
+        :param blob: The encoded bytes.
+        :param offset: Where the payload starts in blob.
+        :return: The control sections.
+        :raises ValueError: If the payload is malformed.
+        """
+        unpack_from = struct.unpack_from
+        unpack_name = self._unpack_name
+        (section_count,) = unpack_from(">I", blob, offset)
+        offset += 4
+        control_sections = []
+        for _ in range(section_count):
+            (record_count,) = unpack_from(">I", blob, offset)
+            offset += 4
+            records = []
+            for _ in range(record_count):
+                record_type = chr(blob[offset])
+                offset += 1
+                if record_type == 'H':
+                    name, offset = unpack_name(blob, offset)
+                    start, length = unpack_from(">II", blob, offset)
+                    offset += 8
+                    records.append(HeaderRecord(name, start, length))
+                elif record_type == 'D':
+                    (count,) = unpack_from(">H", blob, offset)
+                    offset += 2
+                    definitions = []
+                    for _ in range(count):
+                        symbol, offset = unpack_name(blob, offset)
+                        (address,) = unpack_from(">I", blob, offset)
+                        offset += 4
+                        definitions.append((symbol, address))
+                    records.append(DefineRecord(definitions))
+                elif record_type == 'R':
+                    (count,) = unpack_from(">H", blob, offset)
+                    offset += 2
+                    symbols = []
+                    for _ in range(count):
+                        symbol, offset = unpack_name(blob, offset)
+                        symbols.append(symbol)
+                    records.append(ReferRecord(symbols))
+                elif record_type == 'T':
+                    start, length, size = unpack_from(">IBH", blob, offset)
+                    offset += 7
+                    records.append(TextRecord(start, length, blob[offset:offset + size].hex().upper()))
+                    offset += size
+                elif record_type == 'M':
+                    start, half_bytes, sign = unpack_from(">IBc", blob, offset)
+                    offset += 6
+                    symbol, offset = unpack_name(blob, offset)
+                    records.append(ModificationRecord(start, half_bytes, sign.decode("ascii"), symbol))
+                elif record_type == 'E':
+                    has_address, address = unpack_from(">?I", blob, offset)
+                    offset += 5
+                    records.append(EndRecord(address if has_address else None))
+                else:
+                    raise ValueError(f"Unknown cached record type: {record_type!r}")
+            control_sections.append(records)
+        if offset != len(blob):
+            raise ValueError("Trailing data in cache entry.")
+        return control_sections
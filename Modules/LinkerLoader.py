@@ -11,4 +11,170 @@ from pathlib import Path
 repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(repo_home_path)
 
-from Modules.ErrorLogHandler import ErrorLogHandler
\ No newline at end of file
+from Modules.ErrorLogHandler import ErrorLogHandler
+from Modules.LinkerCache import LinkerCache
+from Modules.LinkerParser import LinkerParser
+from Modules.LinkerPass1 import LinkerPass1, ParallelLinkerPass1
+from Modules.LinkerPass2 import LinkerPass2
+from Modules.Memory import Memory
+from Modules.ObjectFileReader import ObjectFileReader
+
+
+class LinkerLoader:
+    """
+    Links and loads a list of object programs.
+
+    Every .obj file is memory-mapped and parsed exactly once; the parsed records are kept in
+    memory, grouped by control section, and replayed by both passes:
+        - Pass 1 builds the ESTAB and assigns control section addresses.
+        - Pass 2 loads Text records into Memory and applies Modification records.
+    The memory image is written to MEMORY.DAT, displayed on the monitor and saved
+    as a binary image (MEMORY.IMG) for downstream tools.
+    """
+
+    def __init__(self, input_files: List[str], prog_addr: int = 0x03300,
+                 output_file: str = "MEMORY.DAT", logger: Optional[ErrorLogHandler] = None,
+                 parallel: bool = False, max_workers: Optional[int] = None,
+                 cache_dir: Optional[str] = None, write_image: bool = True):
+        """
+        Initializes the LinkerLoader.
+
+        :param input_files: Object program file names, in command-line order.
+        :param prog_addr: The program load address (PROGADDR).
+        :param output_file: The memory image file to write.
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        :param parallel: If True, object files are parsed and scanned for Pass 1 in a process pool.
+        :param max_workers: Number of worker processes for the parallel mode. None lets the pool decide.
+        :param cache_dir: Directory for the incremental link cache. None disables caching.
+        :param write_image: If True, also write a binary memory image next to the output
+                            file (MEMORY.DAT -> MEMORY.IMG), loadable with Memory.load_image.
+        """
+        self.input_files = input_files
+        self.prog_addr = prog_addr
+        self.output_file = output_file
+        self.image_file = os.path.splitext(output_file)[0] + ".IMG" if write_image else None
+        self.logger = logger or ErrorLogHandler()
+        self.parser = LinkerParser()
+        self.control_sections: List[list] = []
+        self.estab = None
+        self.memory = None
+        self.execution_address = prog_addr
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.cache = LinkerCache(cache_dir, self.logger) if cache_dir else None
+
+    def run(self):
+        """
+        Runs the full link: read, Pass 1, Pass 2, then write and display the memory image.
+        """
+        if self.parallel:
+            pass1 = ParallelLinkerPass1(self.input_files, self.prog_addr, self.logger,
+                                        self.max_workers, include_records=True, cache=self.cache)
+            self.estab = pass1.run()
+            self.control_sections.extend(pass1.control_sections)
+        else:
+            self.load_object_files()
+            pass1 = LinkerPass1(self.control_sections, self.prog_addr, self.logger)
+            self.estab = pass1.run()
+        if not self.control_sections:
+            self.logger.log_error("No control sections to link.", "LinkerLoader.run")
+            return
+        self.memory = Memory(max(pass1.total_length, 1), self.prog_addr, self.logger)
+
+        pass2 = LinkerPass2(self.control_sections, self.estab, self.memory, self.prog_addr, self.logger)
+        self.execution_address = pass2.run()
+
+        self.write_memory_file()
+        self.write_image_file()
+        self.display_memory()
+        self.report_errors()
+
+    def load_object_files(self):
+        """
+        Reads and parses every input file once, splitting the records into control sections.
+        With a cache, unchanged files are loaded from it and only changed files are parsed.
+        """
+        for file_name in self.input_files:
+            if self.cache is not None:
+                control_sections = self.cache.load(file_name)
+                if control_sections is not None:
+                    self.control_sections.extend(control_sections)
+                    continue
+            try:
+                with ObjectFileReader(file_name, self.logger) as reader:
+                    control_sections = self.parse_object_lines(reader.iter_lines(), file_name)
+            except OSError as e:
+                self.logger.log_error(f"Could not read object file '{file_name}': {e}", "LinkerLoader.load_object_files")
+                continue
+            if self.cache is not None and control_sections is not None:
+                self.cache.store(file_name, control_sections)
+        if self.cache is not None:
+            self.logger.log_action(f"Link cache: {self.cache.hits} hit(s), {self.cache.misses} miss(es).")
+
+    def parse_object_lines(self, lines, file_name: str):
+        """
+        Parses the lines of one object file and appends its control sections.
+
+        :param lines: An iterable of record lines (str, or memoryview slices from ObjectFileReader).
+        :param file_name: The file the lines came from, for error messages.
+        :return: The file's control sections, or None if the file had errors.
+        """
+        control_sections, errors = self.parser.parse_control_sections(lines, file_name)
+        for error in errors:
+            self.logger.log_error(error, "LinkerLoader.parse_object_lines")
+        self.control_sections.extend(control_sections)
+        self.logger.log_action(f"Parsed object file '{file_name}'.")
+        return None if errors else control_sections
+
+    def write_memory_report(self, file) -> int:
+        """
+        Writes the memory report: a column header, the memory dump streamed row block
+        by row block with Memory.write_dump, and the execution address.
+
+        :param file: A writable text file object (the output file or sys.stdout).
+        :return: The number of dump rows written.
+        """
+        file.write("      " + " ".join(f"{column:>2X}" for column in range(16)) + "\n")
+        start = self.prog_addr - (self.prog_addr % 16)
+        end = self.memory.start_address + self.memory.size
+        rows = self.memory.write_dump(file, start, end)
+        file.write(f"\nExecution begins at address {self.execution_address:06X}.\n")
+        return rows
+
+    def write_memory_file(self):
+        """
+        Writes the memory report to the output file.
+        """
+        try:
+            with open(self.output_file, "w", encoding="utf-8") as file:
+                self.write_memory_report(file)
+            self.logger.log_action(f"Memory image written to '{self.output_file}'.")
+        except OSError as e:
+            self.logger.log_error(f"Could not write '{self.output_file}': {e}", "LinkerLoader.write_memory_file")
+
+    def write_image_file(self):
+        """
+        Writes the binary memory image, if enabled.
+        """
+        if self.image_file is None:
+            return
+        try:
+            self.memory.save_image(self.image_file, self.execution_address)
+        except OSError as e:
+            self.logger.log_error(f"Could not write '{self.image_file}': {e}", "LinkerLoader.write_image_file")
+
+    def display_memory(self):
+        """
+        Displays the memory report on the monitor.
+        """
+        print()
+        self.write_memory_report(sys.stdout)
+
+    def report_errors(self):
+        """
+        Prints a summary of the errors found while linking.
+        """
+        if self.logger.has_errors():
+            self.logger.print_colored(f"Linking completed with {len(self.logger.error_log)} error(s).", 'red')
+        else:
+            self.logger.print_colored("Linking completed successfully.", 'green')
@@ -2,7 +2,7 @@
 
 import os
 import sys
-from typing import List, Optional
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 from pathlib import Path
 
@@ -11,12 +11,176 @@ sys.path.append(repo_home_path)
 
 from Modules.ErrorLogHandler import ErrorLogHandler
 
+
+# Compact record types produced by LinkerParser.parse_record / iter_records.
+# Each carries its record type as a class attribute so callers can dispatch on it
+# the same way they do on the "record_type" key of the dict records.
+
+class HeaderRecord(NamedTuple):
+    program_name: str
+    start_address: int
+    length: int
+    record_type = 'H'
+
+
+class DefineRecord(NamedTuple):
+    definitions: List[Tuple[str, int]]
+    record_type = 'D'
+
+
+class ReferRecord(NamedTuple):
+    symbols: List[str]
+    record_type = 'R'
+
+
+class TextRecord(NamedTuple):
+    start_address: int
+    length: int
+    hex_code: str
+    record_type = 'T'
+
+    @property
+    def object_code(self) -> bytes:
+        """
+        The decoded object code. Decoded on each access; the loader writes hex_code
+        with Memory.write_hex instead.
+        """
+        return bytes.fromhex(self.hex_code)
+
+
+class ModificationRecord(NamedTuple):
+    start_address: int
+    half_byte_count: int
+    sign: str
+    symbol: str
+    record_type = 'M'
+
+
+class EndRecord(NamedTuple):
+    execution_address: Optional[int]
+    record_type = 'E'
+
+
 class LinkerParser:
     """
     Parses lines from .obj files without '^' delimiters.
     Record types: H, D, R, T, M, E.
+
+    parse_line returns one dict per record. parse_record and iter_records are the
+    fast path used by the linker: they return the compact NamedTuple records above,
+    decode D and R records with a single comprehension and keep T record object
+    code as hex text until it is written into memory.
     """
 
+    def __init__(self):
+        self._fast_parsers = {
+            'H': self._fast_header,
+            'D': self._fast_define,
+            'R': self._fast_refer,
+            'T': self._fast_text,
+            'M': self._fast_mod,
+            'E': self._fast_end,
+        }
+
+    def parse_record(self, line: str):
+        """
+        Parses one record line into a compact record object.
+
+        :param line: A record line (trailing newline allowed), as str or as a bytes-like
+                     object such as a memoryview slice from ObjectFileReader.
+        :return: A HeaderRecord, DefineRecord, ReferRecord, TextRecord, ModificationRecord or EndRecord.
+        :raises ValueError: If the line is empty or the record type is unknown.
+        """
+        if not isinstance(line, str):
+            line = str(line, "ascii")
+        line = line.rstrip()
+        if not line:
+            raise ValueError("Empty line encountered.")
+        parser = self._fast_parsers.get(line[0])
+        if parser is None:
+            raise ValueError(f"Unknown record type: {line[0]}")
+        return parser(line)
+
+    def iter_records(self, lines: Iterable[str]) -> Iterator:
+        """
+        Yields compact records for every non-blank line.
+
+        :param lines: An iterable of record lines (str or bytes-like).
+        :return: An iterator over record objects.
+        :raises ValueError: On the first malformed line.
+        """
+        parsers = self._fast_parsers
+        for line in lines:
+            if not isinstance(line, str):
+                line = str(line, "ascii")
+            line = line.rstrip()
+            if not line:
+                continue
+            parser = parsers.get(line[0])
+            if parser is None:
+                raise ValueError(f"Unknown record type: {line[0]}")
+            yield parser(line)
+
+    def parse_control_sections(self, lines: Iterable, file_name: str) -> Tuple[List[list], List[str]]:
+        """
+        Parses the lines of one object file and groups the records by control section.
+        Malformed lines and records outside a Header..End block are skipped and reported.
+
+        :param lines: An iterable of record lines (str, or memoryview slices from ObjectFileReader).
+        :param file_name: The file the lines came from, for error messages.
+        :return: (control_sections, errors) where each control section is a list of records
+                 starting with its HeaderRecord, and errors is a list of messages.
+        """
+        control_sections = []
+        errors = []
+        current = None
+        for line_number, line in enumerate(lines, start=1):
+            if isinstance(line, str):
+                line = line.rstrip()
+            if not line:
+                continue
+            try:
+                record = self.parse_record(line)
+            except ValueError as e:
+                errors.append(f"{file_name} line {line_number}: {e}")
+                continue
+            if record.record_type == 'H':
+                current = [record]
+                control_sections.append(current)
+            elif current is None:
+                errors.append(f"{file_name} line {line_number}: record before Header record.")
+            else:
+                current.append(record)
+                if record.record_type == 'E':
+                    current = None
+        return control_sections, errors
+
+    @staticmethod
+    def _fast_header(line: str) -> HeaderRecord:
+        return HeaderRecord(line[1:5].strip(), int(line[5:11], 16), int(line[11:17], 16))
+
+    @staticmethod
+    def _fast_define(line: str) -> DefineRecord:
+        return DefineRecord([(line[i:i + 4].strip(), int(line[i + 4:i + 10], 16))
+                             for i in range(1, len(line), 10)])
+
+    @staticmethod
+    def _fast_refer(line: str) -> ReferRecord:
+        return ReferRecord([symbol for symbol in (line[i:i + 4].strip() for i in range(1, len(line), 4)) if symbol])
+
+    @staticmethod
+    def _fast_text(line: str) -> TextRecord:
+        return TextRecord(int(line[1:7], 16), int(line[7:9], 16), line[9:])
+
+    @staticmethod
+    def _fast_mod(line: str) -> ModificationRecord:
+        return ModificationRecord(int(line[1:7], 16), int(line[7:9], 10), line[9], line[10:].strip())
+
+    @staticmethod
+    def _fast_end(line: str) -> EndRecord:
+        rest = line[1:].strip()
+        return EndRecord(int(rest[:6], 16) if len(rest) >= 6 else None)
+
     def parse_line(self, line: str) -> dict:
         line = line.strip()
         if not line:
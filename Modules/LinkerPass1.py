@@ -2,11 +2,181 @@
 
 import os
 import sys
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 
 from pathlib import Path
 
 repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(repo_home_path)
 
-from Modules.ErrorLogHandler import ErrorLogHandler
\ No newline at end of file
+from Modules.ErrorLogHandler import ErrorLogHandler
+from Modules.ExternalSymbolTable import ExternalSymbolTable
+from Modules.LinkerParser import LinkerParser
+from Modules.ObjectFileReader import ObjectFileReader
+
+
+# (control section name, CSLTH, [(symbol, relative address), ...])
+SectionSummary = Tuple[str, int, List[Tuple[str, int]]]
+
+
+def summarize_control_sections(control_sections: List[list]) -> List[SectionSummary]:
+    """
+    Reduces parsed control sections to what Pass 1 needs: the Header name and length
+    and the Define record symbols.
+
+    :param control_sections: Parsed records, one list per control section, each starting with its Header record.
+    :return: One summary per control section, in order.
+    """
+    summaries = []
+    for records in control_sections:
+        header = records[0]
+        definitions = []
+        for record in records[1:]:
+            if record.record_type == 'D':
+                definitions.extend(record.definitions)
+        summaries.append((header.program_name, header.length, definitions))
+    return summaries
+
+
+def scan_object_file(file_path: str, include_records: bool = False):
+    """
+    Scans one object file for Pass 1. Runs in a worker process, so it reports errors
+    as messages instead of logging them.
+
+    :param file_path: Path to the object file.
+    :param include_records: If True, parse every record and return the control sections
+                            too, so Pass 2 can replay them without reading the file again.
+                            If False, only Header and Define lines are parsed.
+    :return: (summaries, control_sections or None, errors)
+    """
+    parser = LinkerParser()
+    try:
+        with ObjectFileReader(file_path) as reader:
+            lines = reader.iter_lines()
+            if not include_records:
+                # Blank out everything but H, D and E lines; keeps line numbers for errors.
+                lines = (line if line[:1] in (b'H', b'D', b'E') else b'' for line in lines)
+            control_sections, errors = parser.parse_control_sections(lines, file_path)
+    except OSError as e:
+        return [], ([] if include_records else None), [f"Could not read object file '{file_path}': {e}"]
+    return summarize_control_sections(control_sections), (control_sections if include_records else None), errors
+
+
+class LinkerPass1:
+    """
+    Pass 1 of the linking loader.
+    Assigns an address (CSADDR) to every control section and builds the ESTAB
+    from the Header and Define records.
+    """
+
+    def __init__(self, control_sections: List[list], prog_addr: int = 0x03300,
+                 logger: Optional[ErrorLogHandler] = None):
+        """
+        Initializes Pass 1.
+
+        :param control_sections: Parsed records, one list per control section, each starting with its Header record.
+        :param prog_addr: The program load address (PROGADDR).
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        """
+        self.control_sections = control_sections
+        self.prog_addr = prog_addr
+        self.logger = logger or ErrorLogHandler()
+        self.estab = ExternalSymbolTable(self.logger)
+        self.total_length = 0
+
+    def run(self) -> ExternalSymbolTable:
+        """
+        Builds the ESTAB.
+
+        :return: The populated ExternalSymbolTable.
+        """
+        return self.build_estab(summarize_control_sections(self.control_sections))
+
+    def build_estab(self, summaries: List[SectionSummary]) -> ExternalSymbolTable:
+        """
+        Enters control sections and their symbols into ESTAB in order.
+        CSADDR for each section is the running sum of the lengths before it.
+
+        :param summaries: Control section summaries in command-line order.
+        :return: The populated ExternalSymbolTable.
+        """
+        cs_addr = self.prog_addr
+        for section_name, cs_length, definitions in summaries:
+            self.estab.add_control_section(section_name, cs_addr, cs_length)
+            for symbol, address in definitions:
+                self.estab.add_symbol(symbol, cs_addr + address, section_name)
+
+            self.logger.log_action(f"Control section '{section_name}' assigned address {cs_addr:05X}, length {cs_length:05X}.")
+            cs_addr += cs_length
+
+        self.total_length = cs_addr - self.prog_addr
+        self.logger.log_action(f"Pass 1 complete: {len(self.estab)} ESTAB entries, total length {self.total_length:05X}.")
+        return self.estab
+
+
+class ParallelLinkerPass1(LinkerPass1):
+    """
+    Pass 1 that scans the object files in a process pool.
+    Each worker returns the summaries of one file; they are merged in command-line
+    order, so CSADDRs and duplicate-symbol errors match the sequential Pass 1.
+    """
+
+    def __init__(self, input_files: List[str], prog_addr: int = 0x03300,
+                 logger: Optional[ErrorLogHandler] = None, max_workers: Optional[int] = None,
+                 include_records: bool = False, cache=None):
+        """
+        Initializes the parallel Pass 1.
+
+        :param input_files: Object program file names, in command-line order.
+        :param prog_addr: The program load address (PROGADDR).
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        :param max_workers: Number of worker processes. None lets the pool decide.
+        :param include_records: If True, workers also return the parsed records, which are
+                                collected into control_sections for Pass 2.
+        :param cache: Optional LinkerCache. With include_records, unchanged files are taken
+                      from it and only the rest are sent to the pool.
+        """
+        super().__init__([], prog_addr, logger)
+        self.input_files = input_files
+        self.max_workers = max_workers
+        self.include_records = include_records
+        self.cache = cache if include_records else None
+
+    def run(self) -> ExternalSymbolTable:
+        """
+        Scans every input file and builds the ESTAB.
+
+        :return: The populated ExternalSymbolTable.
+        """
+        results = [None] * len(self.input_files)
+        pending = []
+        for index, file_name in enumerate(self.input_files):
+            control_sections = self.cache.load(file_name) if self.cache is not None else None
+            if control_sections is not None:
+                results[index] = (summarize_control_sections(control_sections), control_sections, [])
+            else:
+                pending.append(index)
+
+        pending_files = [self.input_files[index] for index in pending]
+        flags = [self.include_records] * len(pending_files)
+        if len(pending_files) > 1 and self.max_workers != 1:
+            chunk_size = max(1, len(pending_files) // (4 * (self.max_workers or os.cpu_count() or 1)))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                scanned = list(executor.map(scan_object_file, pending_files, flags, chunksize=chunk_size))
+        else:
+            scanned = list(map(scan_object_file, pending_files, flags))
+
+        for index, result in zip(pending, scanned):
+            results[index] = result
+            if self.cache is not None and not result[2]:
+                self.cache.store(self.input_files[index], result[1])
+
+        summaries = []
+        for file_summaries, control_sections, errors in results:
+            for error in errors:
+                self.logger.log_error(error, "ParallelLinkerPass1.run")
+            summaries.extend(file_summaries)
+            if control_sections:
+                self.control_sections.extend(control_sections)
+        return self.build_estab(summaries)
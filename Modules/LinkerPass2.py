@@ -9,4 +9,78 @@ from pathlib import Path
 repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(repo_home_path)
 
-from Modules.ErrorLogHandler import ErrorLogHandler
\ No newline at end of file
+from Modules.ErrorLogHandler import ErrorLogHandler
+from Modules.ExternalSymbolTable import ExternalSymbolTable
+from Modules.LinkerParser import ModificationRecord
+from Modules.RelocationEngine import RelocationEngine
+
+
+class LinkerPass2:
+    """
+    Pass 2 of the linking loader.
+    Replays the parsed records of every control section: moves Text record object code
+    into memory, resolves Modification records against the ESTAB and picks up the
+    execution address from the End records. The resolved modifications are applied
+    as one batch by the RelocationEngine once every Text record is loaded.
+    """
+
+    def __init__(self, control_sections: List[list], estab: ExternalSymbolTable, memory,
+                 prog_addr: int = 0x03300, logger: Optional[ErrorLogHandler] = None):
+        """
+        Initializes Pass 2.
+
+        :param control_sections: Parsed records, one list per control section, each starting with its Header record.
+        :param estab: The ESTAB built by Pass 1.
+        :param memory: The Memory (or PagedMemory) to load into.
+        :param prog_addr: The program load address (PROGADDR).
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        """
+        self.control_sections = control_sections
+        self.estab = estab
+        self.memory = memory
+        self.prog_addr = prog_addr
+        self.logger = logger or ErrorLogHandler()
+        self.execution_address = prog_addr
+        self.relocation = RelocationEngine(memory, self.logger)
+
+    def run(self) -> int:
+        """
+        Loads and relocates all control sections.
+
+        :return: The execution address (EXECADDR).
+        """
+        cs_addr = self.prog_addr
+        for records in self.control_sections:
+            section_name = records[0].program_name
+            for record in records[1:]:
+                record_type = record.record_type
+                if record_type == 'T':
+                    try:
+                        self.memory.write_hex(cs_addr + record.start_address, record.hex_code)
+                    except ValueError as e:
+                        self.logger.log_error(f"Text record in '{section_name}' could not be loaded: {e}", "LinkerPass2.run")
+                elif record_type == 'M':
+                    self.resolve_modification(cs_addr, record, section_name)
+                elif record_type == 'E' and record.execution_address is not None:
+                    self.execution_address = cs_addr + record.execution_address
+            cs_addr += records[0].length
+
+        self.relocation.apply()
+        self.logger.log_action(f"Pass 2 complete. Execution begins at address {self.execution_address:06X}.")
+        return self.execution_address
+
+    def resolve_modification(self, cs_addr: int, record: ModificationRecord, section_name: str):
+        """
+        Looks up the symbol of a Modification record and queues the signed value
+        for the relocation stage.
+
+        :param cs_addr: The address of the control section the record belongs to.
+        :param record: The parsed Modification record.
+        :param section_name: The control section name, for error messages.
+        """
+        value = self.estab.get(record.symbol)
+        if value is None:
+            self.logger.log_error(f"Undefined external symbol '{record.symbol}' in control section '{section_name}'.", "LinkerPass2.resolve_modification")
+            return
+        delta = value if record.sign == '+' else -value
+        self.relocation.add(cs_addr + record.start_address, record.half_byte_count, delta)
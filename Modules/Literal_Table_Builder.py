@@ -25,7 +25,8 @@
 ***      language expressions, evaluates their operands, and manages literals in a      ***
 ***      linked list-based literal table. The program supports various addressing       ***
 ***      modes (direct, indirect, and immediate) and arithmetic operations              ***
-***      (addition and subtraction) for a maximum of two operands per expression.       ***
+***      (+, -, * and / with the usual precedence, and parentheses) on any number of    ***
+***      terms per expression.                                                          ***
 ***                                                                                     ***
 ***      The program performs the following tasks:                                      ***
 ***         - Reads symbols from a symbol table (SYMS.DAT)                              ***
@@ -85,25 +86,43 @@
 
 import sys
 import os
+import re
+import struct
 from typing import List
 
 # Add the parent directory to the Python path
 repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(repo_home_path)
 
-from Modules.Symbol_Table_Builder import SymbolTableDriver, FileExplorer
+from Modules.Symbol_Table_Builder import SymbolTableDriver, FileExplorer, normalize_symbol
 from Modules.ErrorLogHandler import ErrorLogHandler
+from Modules.TableSnapshot import TableSnapshot
 
 
 
+def encode_character_literal(text: str) -> bytes:
+    """
+    Returns the bytes of a character literal (one byte per character).
+
+    :param text: The characters after the =0C prefix.
+    :raises ValueError: If a character does not fit in one byte.
+    """
+    try:
+        return text.encode("latin-1")
+    except UnicodeEncodeError:
+        raise ValueError(f"Invalid character literal value: {text}") from None
+
+
 class LiteralData:
     """
     /***************************************************************************************
     ***  CLASS NAME : LiteralData                                                        ***
     ***  DESCRIPTION :                                                                   ***
     ***      This class represents a literal with attributes such as its name, value,    ***
-    ***      length, and address. It stores hexadecimal literals and their associated    ***
-    ***      data.                                                                       ***
+    ***      length, and address. The value is kept as raw bytes in `data`; the          ***
+    ***      uppercase hex string in `value` is produced on first use for display and    ***
+    ***      the .int/.lst writers. A literal pooled with an earlier literal of the same ***
+    ***      bytes shares that literal's bytes and address.                              ***
     ***************************************************************************************/
 
     Class to represent a literal with its name, value, length, and address.
@@ -115,12 +134,12 @@ class LiteralData:
         /***************************************************************************************
         ***  METHOD : __init__                                                               ***
         ***  DESCRIPTION :                                                                   ***
-        ***      Initializes a LiteralData object with its name, hexadecimal value, length   ***
-        ***      in bytes, and sets the address to None initially.                           ***
+        ***      Initializes a LiteralData object with its name, value, length in bytes,     ***
+        ***      and sets the address to None initially.                                     ***
         ***                                                                                  ***
         ***  INPUT PARAMETERS :                                                              ***
         ***      name   : str    : Name of the literal (e.g., '=X'05A'')                     ***
-        ***      value  : str    : Hexadecimal value of the literal                          ***
+        ***      value  : bytes  : Bytes of the literal, or their hexadecimal string         ***
         ***      length : int    : Length of the literal in bytes                            ***
         ***                                                                                  ***
         ***  EXCEPTIONS :                                                                    ***
@@ -130,7 +149,7 @@ class LiteralData:
 
         Initialize a literal with its name, value, length, and address.
         :param name: Name of the literal (e.g., '=X'05A'').
-        :param value: Hexadecimal value of the literal.
+        :param value: Bytes of the literal, or their hexadecimal string.
         :param length: Length of the literal in bytes.
         :raises ValueError: If name, value, or length is invalid.
         """
@@ -139,9 +158,70 @@ class LiteralData:
             raise ValueError("Invalid literal data: ensure the name is provided, value is not empty, and length is positive.")
         
         self.name: str = name
-        self.value: str = value.upper()  # Normalize value
+        self.pool_owner: LiteralData = None
+        self.value = value
         self.length: int = length
         self.address: int = address or None
+
+    @property
+    def value(self) -> str:
+        """
+        Uppercase hexadecimal string of the literal's bytes, built on first use.
+        """
+        if self._hex is None:
+            self._hex = self.data.hex().upper()
+        return self._hex
+
+    @value.setter
+    def value(self, value):
+        """
+        Sets the literal's bytes from `bytes` or a hex string. A string that is
+        not whole bytes of hex is kept as text, with `data` set to None.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            self.data, self._hex = bytes(value), None
+            return
+        text = value.upper()
+        if len(text) % 2 == 0 and all(c in "0123456789ABCDEF" for c in text):
+            self.data, self._hex = bytes.fromhex(text), text
+        else:
+            self.data, self._hex = None, text
+
+    @property
+    def pool_key(self):
+        """
+        Key used to pool literals by content: the bytes, or the text value.
+        """
+        return self.data if self.data is not None else self._hex
+
+    @property
+    def int_value(self) -> int:
+        """
+        The literal's bytes read as one big-endian unsigned integer.
+        """
+        if self.data is None:
+            return int(self._hex, 16)
+        return int.from_bytes(self.data, "big")
+
+    @property
+    def address(self):
+        """
+        Address of the literal's storage; a pooled literal reports its owner's.
+        """
+        if self.pool_owner is not None:
+            return self.pool_owner.address
+        return self._address
+
+    @address.setter
+    def address(self, address):
+        self._address = address
+
+    def pool_with(self, owner: "LiteralData"):
+        """
+        Makes this literal share the storage of `owner`, which holds the same bytes.
+        """
+        self.pool_owner = owner
+        self.data, self._hex = owner.data, owner._hex
         
     def __str__(self):
         """
@@ -225,7 +305,9 @@ class LiteralTableList:
         ***  METHOD : __init__                                                               ***
         ***  DESCRIPTION :                                                                   ***
         ***      Initializes the LiteralTableList with an empty linked list and a log        ***
-        ***      handler to log actions and errors.                                          ***
+        ***      handler to log actions and errors. Alongside the list, the table keeps a    ***
+        ***      tail pointer and dict indexes by name and by value, so inserts, duplicate   ***
+        ***      checks and lookups do not walk the list.                                    ***
         ***                                                                                  ***
         ***  INPUT PARAMETERS :                                                              ***
         ***      logger : ErrorLogHandler  : Object used to handle logging of actions   ***
@@ -236,9 +318,67 @@ class LiteralTableList:
 
         :param logger: An instance of ErrorLogHandler for logging actions and errors.
         """
-        self.head: LiteralNode = None
         self.logger = logger
+        self.head: LiteralNode = None
         self.str_header = (f"{'Literal':<10} {'Value':<10} {'Length':<6} {'Address':<8}")
+
+    @property
+    def head(self) -> LiteralNode:
+        """
+        First node of the literal list.
+        """
+        return self._head
+
+    @head.setter
+    def head(self, node: LiteralNode):
+        """
+        Replaces the whole list with the chain starting at `node` and rebuilds
+        the tail pointer and the indexes from it.
+        """
+        self._head = node
+        self._reindex()
+
+    def _reindex(self):
+        """
+        /***************************************************************************************
+        ***  METHOD : _reindex                                                               ***
+        ***  DESCRIPTION :                                                                   ***
+        ***      Rebuilds the tail pointer and the name and value indexes by walking the     ***
+        ***      list once. Only needed when the list is changed other than by insert().     ***
+        ***      When a name appears twice, the index keeps the first node, which is the     ***
+        ***      one a walk from the head would find. Pooling is redone in list order, and   ***
+        ***      every literal counts as pending again (closed LTORG pools are forgotten).   ***
+        ***************************************************************************************/
+        """
+        self.tail: LiteralNode = None
+        self.by_name: dict[str, LiteralData] = {}
+        self.by_value: dict[bytes, LiteralData] = {}
+        self._value_names: set[tuple[bytes, str]] = set()
+        # Literals that own storage, in insertion order; those from pool_start on
+        # are still waiting for an LTORG (or END) to place them.
+        self.pending_literals: list[LiteralData] = []
+        self.pool_start = 0
+        self.literal_pools: list[list[LiteralData]] = []
+        current = self._head
+        while current is not None:
+            current.literal_data.pool_owner = None
+            self._index_literal(current.literal_data)
+            self.tail = current
+            current = current.next
+
+    def _index_literal(self, literal_data: LiteralData):
+        """
+        Adds one literal to the name and value indexes. A literal whose bytes
+        are already in the table is pooled with the literal that holds them.
+        """
+        key = literal_data.pool_key
+        self.by_name.setdefault(literal_data.name, literal_data)
+        owner = self.by_value.setdefault(key, literal_data)
+        if owner is not literal_data:
+            literal_data.pool_with(owner)
+        else:
+            self.pending_literals.append(literal_data)
+        self._value_names.add((key, literal_data.name.upper()))
         
     def __str__(self) -> str:
         """
@@ -317,19 +457,19 @@ class LiteralTableList:
             return
 
                     # Check if a literal with the same value already exists
-        if self.exists_by_value(literal_data.value, literal_data.name):
+        if (literal_data.pool_key, literal_data.name.upper()) in self._value_names:
             self.logger.log_action(f"Literal '{literal_data.name}' with value '{literal_data.value}' already exists. Skipping insertion.", False)
             return
     
         new_node = LiteralNode(literal_data)
-        if self.head is None:
-            self.head = new_node
+        self._index_literal(literal_data)
+        if self._head is None:
+            self._head = new_node
+            self.tail = new_node
             self.logger.log_action(f"Inserted literal '{literal_data.name}' as head.", False)
         else:
-            current = self.head
-            while current.next is not None:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+            self.tail = new_node
             self.logger.log_action(f"Inserted literal '{literal_data.name}' into the table.", False)
 
 
@@ -349,22 +489,23 @@ class LiteralTableList:
         ***      False.                                                                      ***
         ***************************************************************************************/
         """
-        current = self.head
-        while current is not None:
-            if current.literal_data.value.upper() == value.upper():
-                if current.literal_data.name.upper() == name.upper():
-                    return True
-            current = current.next
-        return False
+        return (self._pool_key_for(value), name.upper()) in self._value_names
 
 
     def exists_by_value_alone(self, value: str) -> bool:
-        current = self.head
-        while current is not None:
-            if current.literal_data.value.upper() == value.upper():
-                return True
-            current = current.next
-        return False
+        return self._pool_key_for(value) in self.by_value
+
+    @staticmethod
+    def _pool_key_for(value) -> bytes | str:
+        """
+        Returns the pooling key of a literal value given as bytes or a hex string.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value)
+        text = value.upper()
+        if len(text) % 2 == 0 and all(c in "0123456789ABCDEF" for c in text):
+            return bytes.fromhex(text)
+        return text
 
     def get_literals(self) -> List[LiteralData]:
         """
@@ -379,6 +520,16 @@ class LiteralTableList:
             current = current.next
         return literals
 
+    def get_pooled_literals(self) -> List[LiteralData]:
+        """
+        Returns the literals that own storage, in table order. Literals pooled
+        with an earlier literal of the same bytes are left out, since they are
+        emitted once, at their owner's address.
+
+        :return: List of LiteralData objects.
+        """
+        return [literal for literal in self.get_literals() if literal.pool_owner is None]
+
     def get_address_for_literal_from_name(self, name: str) -> int | None:
         """
         /***************************************************************************************
@@ -398,7 +549,8 @@ class LiteralTableList:
         :param name: The name of the literal to search for.
         :return: The address of the literal if found, or None if not found.
         """
-        return self.search(name).address if self.search(name) else None
+        literal_data = self.search(name)
+        return literal_data.address if literal_data else None
     
     def get_value_for_literal_from_name(self, name: str) -> str | None:
         """
@@ -419,7 +571,8 @@ class LiteralTableList:
         :param name: The name of the literal to search for.
         :return: The value of the literal if found, or None if not found.
         """
-        return self.search(name).value if self.search(name) else None
+        literal_data = self.search(name)
+        return literal_data.value if literal_data else None
         
     def get_length_for_literal_from_name(self, name: str) -> int | None:
         """
@@ -440,7 +593,8 @@ class LiteralTableList:
         :param name: The name of the literal to search for.
         :return: The length of the literal if found, or None if not found.
         """
-        return self.search(name).length if self.search(name) else None
+        literal_data = self.search(name)
+        return literal_data.length if literal_data else None
     
     def get_literal_data_from_name(self, name: str) -> LiteralData | None:
         """
@@ -461,7 +615,7 @@ class LiteralTableList:
         :param name: The name of the literal to search for.
         :return: The LiteralData object if found, or None if not found.
         """
-        return self.search(name) if self.search(name) else None
+        return self.search(name)
 
     def insert_sorted(self, literal_data: LiteralData):
         """
@@ -480,15 +634,16 @@ class LiteralTableList:
         :param literal_data: LiteralData object to insert.
         """
         new_node = LiteralNode(literal_data)
-        if self.head is None or self.head.literal_data.name >= new_node.literal_data.name:
-            new_node.next = self.head
-            self.head = new_node
+        if self._head is None or self._head.literal_data.name >= new_node.literal_data.name:
+            new_node.next = self._head
+            self._head = new_node
         else:
-            current = self.head
+            current = self._head
             while current.next and current.next.literal_data.name < new_node.literal_data.name:
                 current = current.next
             new_node.next = current.next
             current.next = new_node
+        self._reindex()
 
 
     def _find_literal(self, name: str) -> bool:
@@ -510,12 +665,7 @@ class LiteralTableList:
         :param name: The name of the literal to search for.
         :return: True if the literal exists, False otherwise.
         """
-        current = self.head
-        while current is not None:
-            if current.literal_data.name == name:
-                return True
-            current = current.next
-        return False
+        return name in self.by_name
 
 
     def search(self, literal_name: str) -> LiteralData | None:
@@ -538,16 +688,83 @@ class LiteralTableList:
         :param literal_name: The name of the literal to search for.
         :return: The LiteralData object if found, or None if not found.
         """
-        current = self.head
-        while current is not None:
-            if current.literal_data.name == literal_name:
-                self.logger.log_action(f"Found literal '{literal_name}' in the table.", False)
-                return current.literal_data
-            current = current.next
+        literal_data = self.by_name.get(literal_name)
+        if literal_data is not None:
+            self.logger.log_action(f"Found literal '{literal_name}' in the table.", False)
+            return literal_data
         self.logger.log_action(f"Literal '{literal_name}' not found in the table.", False)
         return None
 
 
+    def get_unassigned_literals(self) -> List[LiteralData]:
+        """
+        Returns the literals that own storage and have not been placed in a
+        closed pool yet, in insertion order.
+
+        :return: List of LiteralData objects.
+        """
+        return self.pending_literals[self.pool_start:]
+
+    def close_pool(self, start_address: int) -> List[LiteralData]:
+        """
+        /***************************************************************************************
+        ***  METHOD : close_pool                                                             ***
+        ***  DESCRIPTION :                                                                   ***
+        ***      Closes the current literal pool (at an LTORG or the end of the program).    ***
+        ***      Literals pending since the previous pool are laid out one after another     ***
+        ***      from start_address. Only the pool itself is visited, so earlier pools cost  ***
+        ***      nothing.                                                                    ***
+        ***                                                                                  ***
+        ***  INPUT PARAMETERS :                                                              ***
+        ***      start_address : int  : Address of the first literal of the pool.            ***
+        ***                                                                                  ***
+        ***  RETURN : List[LiteralData]                                                      ***
+        ***      The literals of the pool, in insertion order.                               ***
+        ***************************************************************************************/
+        """
+        pool = self.pending_literals[self.pool_start:]
+        self.pool_start = len(self.pending_literals)
+        address = start_address
+        for literal in pool:
+            literal.address = address
+            address += int(literal.length)
+        if pool:
+            self.literal_pools.append(pool)
+        self.logger.log_action(f"Closed literal pool of {len(pool)} literals at address {start_address:X}.", False)
+        return pool
+
+    def take_pool_at(self, start_address: int) -> List[LiteralData]:
+        """
+        /***************************************************************************************
+        ***  METHOD : take_pool_at                                                           ***
+        ***  DESCRIPTION :                                                                   ***
+        ***      Closes the pool that Pass 1 placed at start_address, for a table that was   ***
+        ***      read back with its addresses (Pass 2). The pool is the run of pending       ***
+        ***      literals whose addresses follow on from start_address.                      ***
+        ***                                                                                  ***
+        ***  INPUT PARAMETERS :                                                              ***
+        ***      start_address : int  : Address of the LTORG.                                ***
+        ***                                                                                  ***
+        ***  RETURN : List[LiteralData]                                                      ***
+        ***      The literals of the pool, in insertion order.                               ***
+        ***************************************************************************************/
+        """
+        pending = self.pending_literals
+        index = self.pool_start
+        address = start_address
+        while index < len(pending):
+            literal = pending[index]
+            literal_address = int(literal.address, 16) if isinstance(literal.address, str) else literal.address
+            if literal_address != address:
+                break
+            address += int(literal.length)
+            index += 1
+        pool = pending[self.pool_start:index]
+        self.pool_start = index
+        if pool:
+            self.literal_pools.append(pool)
+        return pool
+
     def update_addresses(self, start_address: int = 0):
         """
         /***************************************************************************************
@@ -580,9 +797,10 @@ class LiteralTableList:
         current_address = start_address
 
         while current:
-            current.literal_data.address = current_address
-            self.logger.log_action(f"Assigned address {current_address} to literal '{current.literal_data.name}'.", False)
-            current_address += 1  # Increment address by 1 regardless of length
+            if current.literal_data.pool_owner is None:
+                current.literal_data.address = current_address
+                self.logger.log_action(f"Assigned address {current_address} to literal '{current.literal_data.name}'.", False)
+                current_address += 1  # Increment address by 1 regardless of length
             current = current.next
 
 
@@ -673,10 +891,135 @@ class LiteralTableList:
         total_size = 0
         current = self.head
         while current:
-            total_size += current.literal_data.length
+            if current.literal_data.pool_owner is None:
+                total_size += current.literal_data.length
             current = current.next
         return total_size
 
+    SNAPSHOT_MAGIC = b"LITT"
+    _FIELD_NONE, _FIELD_INT, _FIELD_STR, _FIELD_BYTES = 0, 1, 2, 3
+
+    @classmethod
+    def _pack_field(cls, value, buffer: bytearray):
+        """
+        Appends one tagged field (None, int, str, or bytes) to a snapshot buffer.
+        Length and address are stored with their original type, since the
+        intermediate file parser keeps them as hex strings.
+        """
+        if value is None:
+            buffer.append(cls._FIELD_NONE)
+        elif isinstance(value, int):
+            buffer.append(cls._FIELD_INT)
+            buffer += struct.pack(">q", value)
+        elif isinstance(value, bytes):
+            buffer.append(cls._FIELD_BYTES)
+            buffer += struct.pack(">H", len(value))
+            buffer += value
+        else:
+            encoded = str(value).encode("utf-8")
+            buffer.append(cls._FIELD_STR)
+            buffer += struct.pack(">H", len(encoded))
+            buffer += encoded
+
+    @classmethod
+    def _unpack_field(cls, payload: bytes, offset: int):
+        """
+        Reads one tagged field written by _pack_field.
+
+        :return: (value, next offset)
+        """
+        tag = payload[offset]
+        offset += 1
+        if tag == cls._FIELD_NONE:
+            return None, offset
+        if tag == cls._FIELD_INT:
+            return struct.unpack_from(">q", payload, offset)[0], offset + 8
+        if tag == cls._FIELD_STR:
+            (length,) = struct.unpack_from(">H", payload, offset)
+            offset += 2
+            return payload[offset:offset + length].decode("utf-8"), offset + length
+        if tag == cls._FIELD_BYTES:
+            (length,) = struct.unpack_from(">H", payload, offset)
+            offset += 2
+            return bytes(payload[offset:offset + length]), offset + length
+        raise ValueError(f"unknown field tag {tag}")
+
+    def save_snapshot(self, file_path: str, source_digest: bytes = bytes(32)) -> bool:
+        """
+        /***************************************************************************************
+        ***  METHOD : save_snapshot                                                          ***
+        ***  DESCRIPTION :                                                                   ***
+        ***      Writes the literal table, in table order, to a versioned binary snapshot    ***
+        ***      tagged with the digest of the text it was built from.                       ***
+        ***                                                                                  ***
+        ***  INPUT PARAMETERS :                                                              ***
+        ***      file_path     : str   : Destination path.                                   ***
+        ***      source_digest : bytes : TableSnapshot.digest_lines result.                  ***
+        ***                                                                                  ***
+        ***  RETURN : bool                                                                   ***
+        ***      True if the snapshot was written.                                           ***
+        ***************************************************************************************/
+        """
+        payload = bytearray()
+        for literal in self.get_literals():
+            for field in (literal.name, literal.pool_key, literal.length, literal.address):
+                self._pack_field(field, payload)
+        return TableSnapshot(self.SNAPSHOT_MAGIC, self.logger).write(file_path, bytes(payload), source_digest)
+
+    def load_snapshot(self, file_path: str, source_digest: bytes = None) -> bool:
+        """
+        /***************************************************************************************
+        ***  METHOD : load_snapshot                                                          ***
+        ***  DESCRIPTION :                                                                   ***
+        ***      Loads literals from a snapshot written by save_snapshot. The snapshot is    ***
+        ***      only used when its checksum is intact and, if given, its source digest      ***
+        ***      matches. Its literals already passed the insert checks, so an empty table   ***
+        ***      is rebuilt directly in the stored order.                                    ***
+        ***                                                                                  ***
+        ***  INPUT PARAMETERS :                                                              ***
+        ***      file_path     : str   : Snapshot path.                                      ***
+        ***      source_digest : bytes : Required source digest, or None.                    ***
+        ***                                                                                  ***
+        ***  RETURN : bool                                                                   ***
+        ***      True if the snapshot was loaded.                                            ***
+        ***************************************************************************************/
+        """
+        payload = TableSnapshot(self.SNAPSHOT_MAGIC, self.logger).read(file_path, source_digest)
+        if payload is None:
+            return False
+
+        literals = []
+        offset = 0
+        try:
+            while offset < len(payload):
+                fields = []
+                for _ in range(4):
+                    value, offset = self._unpack_field(payload, offset)
+                    fields.append(value)
+                name, value, length, address = fields
+                literal = LiteralData(name, value, length)
+                literal.address = address
+                literals.append(literal)
+        except (ValueError, IndexError, struct.error, UnicodeDecodeError) as e:
+            self.logger.log_error(f"Corrupt literal table snapshot '{file_path}': {e}")
+            return False
+
+        if self.head is None:
+            head = tail = None
+            for literal in literals:
+                node = LiteralNode(literal)
+                if tail is None:
+                    head = node
+                else:
+                    tail.next = node
+                tail = node
+            self.head = head
+        else:
+            for literal in literals:
+                self.insert(literal)
+        self.logger.log_action(f"Loaded {len(literals)} literals from snapshot '{file_path}'.", False)
+        return True
+
     def press_continue(self):
         """
         /***************************************************************************************
@@ -691,6 +1034,217 @@ class LiteralTableList:
         print("\033[F\033[K", end='')
 
 
+class CompiledExpression:
+    """
+    /***************************************************************************************
+    ***  CLASS NAME : CompiledExpression                                                 ***
+    ***  DESCRIPTION :                                                                   ***
+    ***      A parsed expression prepared for repeated evaluation. The addressing bits   ***
+    ***      are worked out once, each term is classified once (number, literal, symbol  ***
+    ***      or the location counter '*') and the expression is flattened into a         ***
+    ***      postfix program over those terms. Symbol terms are bound to their           ***
+    ***      SymbolData; the bindings are refreshed when the symbol table's generation   ***
+    ***      has moved on. Evaluating it again is a single loop over the program.        ***
+    ***                                                                                  ***
+    ***      Relocatability follows the evaluate_rflag rules, extended to many terms:    ***
+    ***      each relocatable term counts +1 or -1 with its sign, and the result is      ***
+    ***      absolute at 0, relocatable at 1 and an error otherwise. Relocatable terms   ***
+    ***      may not be multiplied or divided.                                           ***
+    ***************************************************************************************/
+    """
+
+    NUMBER, LITERAL, SYMBOL, LOCATION = 0, 1, 2, 3
+    # Program steps: a slot number (>= 0) pushes that term, a negative code applies an operator.
+    ADD, SUBTRACT, MULTIPLY, DIVIDE, NEGATE = -1, -2, -3, -4, -5
+    OPERATOR_CODES = {'+': ADD, '-': SUBTRACT, '*': MULTIPLY, '/': DIVIDE, 'NEG': NEGATE}
+
+    __slots__ = ('parsed_expr', 'text', 'error', 'operator', 'n_bit', 'i_bit', 'x_bit',
+                 'kinds', 'operands', 'program', 'bound', 'generation')
+
+    def __init__(self, parsed_expr):
+        """
+        /***************************************************************************************
+        ***  METHOD : __init__                                                               ***
+        ***  DESCRIPTION :                                                                   ***
+        ***      Turns a parsed expression dictionary into term slots and a postfix          ***
+        ***      program. Uses parsed_expr['rpn'], a postfix list of ('term', text) and      ***
+        ***      ('op', operator) pairs, when the parser provided it, otherwise the          ***
+        ***      operand1 [operator operand2] form.                                          ***
+        ***                                                                                  ***
+        ***  INPUT PARAMETERS :                                                              ***
+        ***      parsed_expr : dict  : A dictionary returned by ExpressionParser.parse_line. ***
+        ***************************************************************************************/
+        """
+        self.parsed_expr = parsed_expr
+        self.text = parsed_expr['original_expression']
+        self.error = parsed_expr.get('error')
+        self.operator = parsed_expr['operator']
+        mode = parsed_expr['addressing_mode']
+        self.n_bit = 0 if mode == 'IMMEDIATE' else 1
+        self.i_bit = 0 if mode == 'INDIRECT' else 1
+        self.x_bit = 1 if parsed_expr['indexing'] else 0
+
+        kinds, operands, program = [], [], []
+        if not self.error:
+            rpn = parsed_expr.get('rpn')
+            if rpn is None:
+                rpn = [('term', parsed_expr['operand1'])]
+                if self.operator:
+                    rpn += [('term', parsed_expr['operand2']), ('op', self.operator)]
+            for kind, token in rpn:
+                if kind == 'op':
+                    program.append(self.OPERATOR_CODES[token])
+                    continue
+                program.append(len(operands))
+                if token == '*':
+                    kinds.append(self.LOCATION)
+                    operands.append('*')
+                elif token.isdigit() or (token.startswith('-') and token[1:].isdigit()):
+                    kinds.append(self.NUMBER)
+                    operands.append(int(token))
+                elif token.startswith('#'):
+                    kinds.append(self.NUMBER)
+                    try:
+                        operands.append(int(token[1:]))
+                    except ValueError:
+                        operands.append(None)
+                        self.error = f"Invalid immediate value: {token}"
+                elif token.startswith('='):
+                    kinds.append(self.LITERAL)
+                    operands.append(token)
+                else:
+                    kinds.append(self.SYMBOL)
+                    operands.append(token)
+        self.kinds = tuple(kinds)
+        self.operands = tuple(operands)
+        self.program = tuple(program)
+        self.bound = [None] * len(operands)
+        self.generation = None
+
+    def bind(self, symbol_table):
+        """
+        Looks up the symbol terms again if the symbol table has changed
+        since they were last bound.
+
+        :param symbol_table: The SymbolTable the symbols come from.
+        """
+        generation = getattr(symbol_table, 'generation', None)
+        if generation is not None and generation == self.generation:
+            return
+        for slot, kind in enumerate(self.kinds):
+            if kind == self.SYMBOL:
+                # The parser has already removed '#', '@' and ',X'
+                self.bound[slot] = symbol_table.search(self.operands[slot])
+        self.generation = generation
+
+    def operand_value(self, slot, literal_table, location=None, external_keys=()):
+        """
+        Returns (value, relocatable_flag, error_message) for one term slot,
+        matching ExpressionEvaluator.get_operand_value. A symbol whose key is
+        in external_keys (an EXTREF name) is absolute 0; the linker adds its
+        address through a modification record.
+        """
+        kind = self.kinds[slot]
+        if kind == self.NUMBER:
+            return self.operands[slot], False, None
+        if kind == self.LITERAL:
+            literal = literal_table.search(self.operands[slot])
+            if literal is None:
+                return None, None, f"Literal '{self.operands[slot]}' not found in the literal table."
+            try:
+                return literal.int_value, False, None
+            except ValueError as e:
+                return None, None, f"Invalid literal value '{literal.value}': {str(e)}"
+        if kind == self.LOCATION:
+            if location is None:
+                return None, None, "Location counter '*' is not available here."
+            return location, True, None
+        symbol = self.bound[slot]
+        if symbol is None:
+            return None, None, f"Undefined symbol: {self.operands[slot]}"
+        if symbol.key in external_keys:
+            return 0, False, None
+        return symbol.value, symbol.rflag, None
+
+    def run(self, literal_table, location=None, external_keys=()):
+        """
+        /***************************************************************************************
+        ***  METHOD : run                                                                    ***
+        ***  DESCRIPTION :                                                                   ***
+        ***      Executes the postfix program. Call bind() first so symbol terms are         ***
+        ***      current.                                                                    ***
+        ***                                                                                  ***
+        ***  INPUT PARAMETERS :                                                              ***
+        ***      literal_table : LiteralTableList  : Table for literal terms.                ***
+        ***      location      : int  : Value of '*', if the caller has one.                 ***
+        ***      external_keys : set  : Keys of EXTREF symbols, evaluated as 0.              ***
+        ***                                                                                  ***
+        ***  RETURN : tuple                                                                  ***
+        ***      Returns (value, relocatable_flag, external_references, error_message).      ***
+        ***      external_references lists a (sign, symbol) pair for each EXTREF term.       ***
+        ***************************************************************************************/
+        """
+        values, counts, externals = [], [], []
+        for step in self.program:
+            if step >= 0:
+                value, rflag, error = self.operand_value(step, literal_table, location, external_keys)
+                if error:
+                    return None, None, (), error
+                values.append(value)
+                counts.append(1 if rflag else 0)
+                symbol = self.bound[step]
+                externals.append((('+', self.operands[step]),)
+                                 if symbol is not None and symbol.key in external_keys else ())
+                continue
+            if step == self.NEGATE:
+                if values[-1] is None:
+                    return None, None, (), "Operand has no value."
+                values[-1] = -values[-1]
+                counts[-1] = -counts[-1]
+                externals[-1] = self._negated(externals[-1])
+                continue
+            right, right_count, right_externals = values.pop(), counts.pop(), externals.pop()
+            if right is None or values[-1] is None:
+                return None, None, (), "Operand has no value."
+            if step == self.ADD:
+                values[-1] += right
+                counts[-1] += right_count
+                externals[-1] += right_externals
+            elif step == self.SUBTRACT:
+                values[-1] -= right
+                counts[-1] -= right_count
+                externals[-1] += self._negated(right_externals)
+            else:
+                if counts[-1] or right_count:
+                    return None, None, (), "Relocatable operand in multiplication or division."
+                if externals[-1] or right_externals:
+                    return None, None, (), "External symbol in multiplication or division."
+                if step == self.MULTIPLY:
+                    values[-1] *= right
+                elif right == 0:
+                    return None, None, (), "Division by zero."
+                else:
+                    # SIC/XE division truncates toward zero
+                    quotient = abs(values[-1]) // abs(right)
+                    values[-1] = quotient if (values[-1] < 0) == (right < 0) else -quotient
+
+        count = counts[0]
+        if count == 0:
+            return values[0], False, externals[0], None
+        if count == 1:
+            return values[0], True, externals[0], None
+        if count > 1:
+            return None, None, (), "T  +  T ERROR"
+        return None, None, (), "F  -  T ERROR"
+
+    @staticmethod
+    def _negated(external_references):
+        """
+        Flips the sign of each (sign, symbol) pair.
+        """
+        return tuple(('-' if sign == '+' else '+', symbol) for sign, symbol in external_references)
+
+
 class ExpressionParser:
     """
     /***************************************************************************************
@@ -701,6 +1255,7 @@ class ExpressionParser:
     ***************************************************************************************/
 
         Class responsible for parsing assembly expressions and literals.
+    Expressions may combine any number of terms with + - * / and parentheses.
     
     Attributes:
         expressions_lines (list): List of raw expression lines.
@@ -709,6 +1264,8 @@ class ExpressionParser:
         logger (ErrorLogHandler): Reference to the error log handler.
     """
 
+    # Binding strength of each operator; NEG is unary minus.
+    OPERATOR_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2, 'NEG': 3}
 
     def __init__(self, expressions_lines, literal_table, logger, hex_literal_prefix=None, character_literal_prefix='=0C'):
         """
@@ -738,6 +1295,7 @@ class ExpressionParser:
         self.invalid_literals_set = set()  # Track invalid literals
         self.hex_literal_prefix = hex_literal_prefix or '=0X'
         self.character_literal_prefix = character_literal_prefix or '=0C'
+        self.compiled_expressions = {}  # Stripped expression text -> CompiledExpression
 
 
     def parse_all(self):
@@ -784,6 +1342,7 @@ class ExpressionParser:
             'operator': None,
             'operand1': None,
             'operand2': None,
+            'rpn': None,
             'indexing': False,
             'error': None
         }
@@ -816,6 +1375,38 @@ class ExpressionParser:
 
         return parsed_expr
 
+    def compile_line(self, line):
+        """
+        /***************************************************************************************
+        ***  METHOD : compile_line                                                           ***
+        ***  DESCRIPTION :                                                                   ***
+        ***      Parses a line once and returns it as a CompiledExpression. Later calls      ***
+        ***      with the same (stripped) text return the cached object without parsing.    ***
+        ***      Literal operands are not cached, since parsing them inserts into the        ***
+        ***      literal table.                                                              ***
+        ***                                                                                  ***
+        ***  INPUT PARAMETERS :                                                              ***
+        ***      line : str  : The expression text.                                          ***
+        ***                                                                                  ***
+        ***  RETURN : CompiledExpression or None                                             ***
+        ***      None for an empty line or an invalid literal that was already reported.     ***
+        ***************************************************************************************/
+        """
+        text = line.strip()
+        compiled = self.compiled_expressions.get(text)
+        if compiled is not None:
+            return compiled
+        parsed_expr = self.parse_line(text)
+        if parsed_expr is None and '=' in text:
+            # A literal seen for the first time is inserted and not returned; parse it again.
+            parsed_expr = self.parse_line(text)
+        if parsed_expr is None:
+            return None
+        compiled = CompiledExpression(parsed_expr)
+        if '=' not in text:
+            self.compiled_expressions[text] = compiled
+        return compiled
+
     ### Sub-methods below ###
 
     def parse_addressing_mode(self, line, parsed_expr):
@@ -927,8 +1518,8 @@ class ExpressionParser:
                         _error_message = f"Character literal is empty: {literal_name}"
                         self.logger.log_error(_error_message)
                         raise ValueError(_error_message)
-                    literal_value = ''.join(f"{ord(c):02X}" for c in char_sequence)
-                    literal_length = len(char_sequence)
+                    literal_value = encode_character_literal(char_sequence)
+                    literal_length = len(literal_value)
 
                 else:
                     raise ValueError(f"Invalid literal format: {literal_name}")
@@ -960,32 +1551,69 @@ class ExpressionParser:
         /***************************************************************************************
         ***  METHOD : parse_operands                                                         ***
         ***  DESCRIPTION :                                                                   ***
-        ***      Splits the expression line and assigns operands, identifying the operator   ***
-        ***      and handling parentheses.                                                   ***
+        ***      Splits the expression line into terms and operators and converts it to      ***
+        ***      postfix order (parsed_expr['rpn']) with the shunting-yard method, so that   ***
+        ***      * and / bind tighter than + and -, and parentheses group. A '-' or '+'      ***
+        ***      where a term is expected is a sign; a '*' there is the location counter.    ***
+        ***      operand1, operator and operand2 record the first two terms and the first    ***
+        ***      operator.                                                                   ***
         ***                                                                                  ***
         ***  INPUT PARAMETERS :                                                              ***
         ***      line        : str   : The expression line containing operands.              ***
         ***      parsed_expr : dict  : The dictionary representing the parsed expression.    ***
         ***************************************************************************************/
 
-        Split and assign operands to the parsed expression. Identifies the operator (`+`, `-`) and assigns operands.
+        Split the expression into terms and operators and store it in postfix order.
         """
         self.logger.log_action(f"Parsing operands from line: {line}", False)
-        if '+' in line:
-            parsed_expr['operator'] = '+'
-            operands = line.split('+')
-        elif '-' in line:
-            parsed_expr['operator'] = '-'
-            operands = line.split('-')
-        else:
-            operands = [line]
-
-        operands = [operand.strip('()').strip() for operand in operands]  # Clean parentheses
+        tokens = re.findall(r'[-+*/()]|[^-+*/()\s]+', line)
+        rpn, pending, terms = [], [], []
+        expect_term = True
+        for token in tokens:
+            if expect_term:
+                if token == '(':
+                    pending.append(token)
+                elif token == '-':
+                    pending.append('NEG')
+                elif token == '+':
+                    continue
+                elif token in ')/':
+                    parsed_expr['error'] = f"Missing operand before '{token}'."
+                    return
+                else:
+                    rpn.append(('term', token))
+                    terms.append(token)
+                    expect_term = False
+            elif token == ')':
+                while pending and pending[-1] != '(':
+                    rpn.append(('op', pending.pop()))
+                if not pending:
+                    parsed_expr['error'] = "Unbalanced parentheses."
+                    return
+                pending.pop()
+            elif token in self.OPERATOR_PRECEDENCE:
+                precedence = self.OPERATOR_PRECEDENCE[token]
+                while pending and pending[-1] != '(' and self.OPERATOR_PRECEDENCE[pending[-1]] >= precedence:
+                    rpn.append(('op', pending.pop()))
+                pending.append(token)
+                parsed_expr['operator'] = parsed_expr['operator'] or token
+                expect_term = True
+            else:
+                parsed_expr['error'] = f"Missing operator before '{token}'."
+                return
 
-        if len(operands) == 1:
-            parsed_expr['operand1'] = operands[0]
-        elif len(operands) == 2:
-            parsed_expr['operand1'], parsed_expr['operand2'] = operands
+        parsed_expr['operand1'] = terms[0] if terms else None
+        parsed_expr['operand2'] = terms[1] if len(terms) > 1 else None
+        if expect_term:
+            parsed_expr['error'] = "Missing second operand." if terms else "Missing first operand."
+            return
+        while pending:
+            operator = pending.pop()
+            if operator == '(':
+                parsed_expr['error'] = "Unbalanced parentheses."
+                return
+            rpn.append(('op', operator))
+        parsed_expr['rpn'] = rpn
 
 
     def validate_operands(self, parsed_expr):
@@ -1002,6 +1630,8 @@ class ExpressionParser:
 
         Validate the operands in the parsed expression. If missing operands or invalid combination, add errors.
         """
+        if parsed_expr['error']:
+            return  # parse_operands already reported the problem
         if not parsed_expr['operand1']:
             parsed_expr['error'] = "Missing first operand."
         elif parsed_expr['operator'] and not parsed_expr['operand2']:
@@ -1076,6 +1706,8 @@ class ExpressionEvaluator:
         self.literal_table = literal_table
         self.evaluated_expressions = [] 
         self.logger = logger or ErrorLogHandler()
+        self.compiled_expressions = {}  # Original expression text -> CompiledExpression
+        self.external_keys = set()  # Packed keys of EXTREF symbols
 
 
     def evaluate_all(self):
@@ -1099,7 +1731,7 @@ class ExpressionEvaluator:
                 self.evaluated_expressions.append(evaluated_expr)
 
 
-    def evaluate_expression(self, parsed_expr):
+    def evaluate_expression(self, parsed_expr, location=None):
         """
         /***************************************************************************************
         ***  METHOD : evaluate_expression                                                    ***
@@ -1108,79 +1740,87 @@ class ExpressionEvaluator:
         ***      and various flags.                                                          ***
         ***                                                                                  ***
         ***  INPUT PARAMETERS :                                                              ***
-        ***      parsed_expr : dict   : A parsed expression dictionary.                      ***
+        ***      parsed_expr : dict or CompiledExpression : A parsed expression.             ***
+        ***      location    : int  : Value of the location counter term '*', if any.        ***
         ***                                                                                  ***
         ***  RETURN : dict                                                                   ***
         ***      Returns a dictionary representing the evaluated expression, with its value  ***
         ***      and flags.                                                                  ***
         ***************************************************************************************/
 
-        Evaluates a single parsed expression.
+        Evaluates a single parsed expression. A CompiledExpression (from
+        ExpressionParser.compile_line) only runs its postfix program and, until
+        the symbol table changes, skips the symbol lookups. A dictionary is
+        compiled first; see compile_expression.
         
         Args:
-            parsed_expr (dict): A parsed expression.
+            parsed_expr (dict or CompiledExpression): A parsed expression.
+            location (int, optional): Value of '*'.
         
         Returns:
             dict: A dictionary representing the evaluated expression with value and flags.
         """
+        compiled = self.compile_expression(parsed_expr)
         evaluated_expr = {
-            'original_expression': parsed_expr['original_expression'],
+            'original_expression': compiled.text,
             'value': None,
             'relocatable': None,
             'n_bit': 1,
             'i_bit': 1,
-            'x_bit': 1 if parsed_expr['indexing'] else 0,
-            'error': parsed_expr.get('error')
+            'x_bit': compiled.x_bit,
+            'external_references': [],
+            'error': compiled.error
         }
 
         if evaluated_expr['error']:
             return evaluated_expr
 
-        # Determine N-Bit and I-Bit based on addressing mode
-        if parsed_expr['addressing_mode'] == 'IMMEDIATE':
-            evaluated_expr['n_bit'] = 0
-            evaluated_expr['i_bit'] = 1
-        elif parsed_expr['addressing_mode'] == 'INDIRECT':
-            evaluated_expr['n_bit'] = 1
-            evaluated_expr['i_bit'] = 0
-
-        # Evaluate operands
-        operand1_value, operand1_rflag, error1 = self.get_operand_value(parsed_expr['operand1'])
-        if error1:
-            evaluated_expr['error'] = error1
+        # N-Bit and I-Bit from the addressing mode
+        evaluated_expr['n_bit'] = compiled.n_bit
+        evaluated_expr['i_bit'] = compiled.i_bit
+
+        # Run the compiled program; relocatability follows the evaluate_rflag rules
+        compiled.bind(self.symbol_table)
+        value, relocatable, external_references, error = compiled.run(self.literal_table, location, self.external_keys)
+        if error:
+            evaluated_expr['error'] = error
             return evaluated_expr
 
-        if parsed_expr['operator']:
-            operand2_value, operand2_rflag, error2 = self.get_operand_value(parsed_expr['operand2'])
-            if error2:
-                evaluated_expr['error'] = error2
-                return evaluated_expr
-
-            # Perform operation
-            if parsed_expr['operator'] == '+':
-                result_value = operand1_value + operand2_value
-            elif parsed_expr['operator'] == '-':
-                result_value = operand1_value - operand2_value
-            else:
-                evaluated_expr['error'] = f"Unsupported operator: {parsed_expr['operator']}"
-                return evaluated_expr
+        evaluated_expr['value'] = value
+        evaluated_expr['relocatable'] = relocatable
+        evaluated_expr['external_references'] = list(external_references)
+        return evaluated_expr
 
-            # Determine relocatability
-            relocatable, error_rflag = self.evaluate_rflag(operand1_rflag, parsed_expr['operator'], operand2_rflag)
-            if error_rflag:
-                evaluated_expr['error'] = error_rflag
-                return evaluated_expr
 
-            evaluated_expr['value'] = result_value
-            evaluated_expr['relocatable'] = relocatable
+    def add_external_symbol(self, symbol):
+        """
+        Marks a symbol as external (EXTREF). In expressions it counts as
+        absolute 0 and is listed in 'external_references' with its sign, so
+        the caller can emit a modification record for it.
 
-        else:
-            # Single operand evaluation
-            evaluated_expr['value'] = operand1_value
-            evaluated_expr['relocatable'] = operand1_rflag
+        :param symbol: The external symbol name.
+        """
+        self.external_keys.add(normalize_symbol(symbol)[0])
 
-        return evaluated_expr
+    def compile_expression(self, parsed_expr):
+        """
+        Returns the CompiledExpression for a parsed expression. The cache is keyed
+        on the original text, and a cached entry is reused only for the very dict
+        it was compiled from; any other dict is compiled again rather than compared
+        field by field. Callers that evaluate repeatedly, like Pass 1 and Pass 2,
+        pass the CompiledExpression from ExpressionParser.compile_line instead.
 
+        :param parsed_expr: A parsed expression dictionary or a CompiledExpression.
+        :return: CompiledExpression
+        """
+        if isinstance(parsed_expr, CompiledExpression):
+            return parsed_expr
+        text = parsed_expr['original_expression']
+        compiled = self.compiled_expressions.get(text)
+        if compiled is None or compiled.parsed_expr is not parsed_expr:
+            compiled = CompiledExpression(parsed_expr)
+            self.compiled_expressions[text] = compiled
+        return compiled
 
     def get_operand_value(self, operand):
         """
@@ -1216,7 +1856,7 @@ class ExpressionEvaluator:
             literal = self.literal_table.search(operand)
             if literal:
                 try:
-                    return int(literal.value, 16), False, None  # Convert from hex to decimal
+                    return literal.int_value, False, None
                 except ValueError as e:
                     return None, None, f"Invalid literal value '{literal.value}': {str(e)}"
             else:
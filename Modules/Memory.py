@@ -2,7 +2,9 @@
 
 import os
 import sys
-from typing import List, Optional
+import mmap
+import struct
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
 from pathlib import Path
 
@@ -12,6 +14,17 @@ sys.path.append(repo_home_path)
 from Modules.ErrorLogHandler import ErrorLogHandler
 
 
+ADDRESS_SPACE = 1 << 20      # SIC/XE addresses are 20 bits wide (1 MB)
+PAGE_BITS = 12
+PAGE_SIZE = 1 << PAGE_BITS   # 4 KB pages
+PAGE_MASK = PAGE_SIZE - 1
+
+# Binary memory image: header, then the raw bytes, then the initialized bitmap.
+# Header fields: magic, version, load address, length, execution address.
+IMAGE_MAGIC = b"SXIM"
+IMAGE_VERSION = 1
+IMAGE_HEADER = struct.Struct(">4sBIII")
+
 
 class MemoryUnit:
     """
@@ -85,10 +98,132 @@ class MemoryUnit:
 
 
 
+class MemoryDumpRenderer:
+    """
+    Formats memory dumps a whole row at a time.
+    Each row is pulled from the memory as one bytes slice plus an initialized-bit mask,
+    hex-encoded in bulk with bytes.hex(' '), and only rows that mix initialized and
+    uninitialized bytes are patched byte by byte with "??".
+    Works with any memory exposing _read_row (Memory and PagedMemory).
+    """
+    ROWS_PER_BLOCK = 256
+
+    def __init__(self, memory, width: int = 16, collapse_empty: bool = False, empty_symbol: str = "??"):
+        """
+        Initializes the renderer.
+
+        :param memory: The Memory or PagedMemory to render.
+        :param width: Number of bytes per row.
+        :param collapse_empty: If True, a run of all-"??" rows is shown as its first row followed by a single "*" line.
+        :param empty_symbol: The symbol shown for uninitialized bytes.
+        :raises ValueError: If width is not a positive integer.
+        """
+        if not isinstance(width, int) or width <= 0:
+            raise ValueError(f"Width must be a positive integer, got {width}")
+        self.memory = memory
+        self.width = width
+        self.collapse_empty = collapse_empty
+        self.empty_symbol = empty_symbol
+
+    def format_row(self, address: int, data: bytes, mask: int) -> str:
+        """
+        Formats a single dump row.
+
+        :param address: The absolute address of the first byte in the row.
+        :param data: The raw bytes of the row.
+        :param mask: Bit i is set when byte i of the row is initialized.
+        :return: The formatted row, e.g. "03300 AB CD ?? ...".
+        """
+        count = len(data)
+        if mask == (1 << count) - 1:
+            body = data.hex(' ').upper()
+        elif mask == 0:
+            body = " ".join([self.empty_symbol] * count)
+        else:
+            cells = data.hex(' ').upper().split(' ')
+            body = " ".join(cell if (mask >> i) & 1 else self.empty_symbol for i, cell in enumerate(cells))
+        return f"{address:05X} " + body.ljust(self.width * 3)
+
+    def iter_rows(self, start: int, end: int) -> Iterator[str]:
+        """
+        Yields the formatted rows between start and end addresses.
+        Memory is fetched in blocks of ROWS_PER_BLOCK rows; a block that is fully
+        initialized is hex-encoded with one call and sliced into rows.
+
+        :param start: The starting absolute address.
+        :param end: The ending absolute address (non-inclusive).
+        :return: An iterator over row strings (without newlines).
+        """
+        width = self.width
+        block_size = width * self.ROWS_PER_BLOCK
+        # Only PagedMemory has untouched regions to skip; plain Memory shows every row
+        is_allocated = getattr(self.memory, '_is_allocated', None)
+        previous_empty = False
+        starred = False
+        for block_addr in range(start, end, block_size):
+            block_length = min(block_size, end - block_addr)
+            block = self.memory._read_row(block_addr, block_length)
+            if block is None:
+                continue
+            block_data, block_mask = block
+            if block_mask == (1 << block_length) - 1:
+                previous_empty = False
+                starred = False
+                hex_text = block_data.hex(' ').upper()
+                for offset in range(0, block_length, width):
+                    body = hex_text[offset * 3:(offset + width) * 3 - 1]
+                    yield f"{block_addr + offset:05X} " + body.ljust(width * 3)
+                continue
+            for offset in range(0, block_length, width):
+                count = min(width, block_length - offset)
+                mask = (block_mask >> offset) & ((1 << count) - 1)
+                if mask == 0 and is_allocated is not None and not is_allocated(block_addr + offset, count):
+                    continue  # Row lies in untouched pages of a paged memory
+                if self.collapse_empty and mask == 0:
+                    if previous_empty:
+                        if not starred:
+                            starred = True
+                            yield "*"
+                        continue
+                    previous_empty = True
+                else:
+                    previous_empty = False
+                    starred = False
+                yield self.format_row(block_addr + offset, block_data[offset:offset + count], mask)
+
+    def render(self, start: int, end: int) -> str:
+        """
+        Renders the dump between start and end addresses as one string.
+
+        :param start: The starting absolute address.
+        :param end: The ending absolute address (non-inclusive).
+        :return: The dump, one row per line.
+        """
+        return "\n".join(self.iter_rows(start, end))
+
+    def write(self, file: TextIO, start: int, end: int) -> int:
+        """
+        Streams the dump between start and end addresses to an open text file.
+
+        :param file: A writable text file object.
+        :param start: The starting absolute address.
+        :param end: The ending absolute address (non-inclusive).
+        :return: The number of lines written.
+        """
+        lines = 0
+        for row in self.iter_rows(start, end):
+            file.write(row.rstrip() + "\n")
+            lines += 1
+        return lines
+
+
+
 class Memory:
     """
-    Represents a byte-addressable memory space using MemoryUnit instances.
-    Integrates with ErrorLogHandler to log all actions and errors.
+    Represents a byte-addressable memory space backed by a single bytearray.
+    A parallel bitmap (one bit per byte) records which addresses have been written,
+    so uninitialized bytes can still be reported and shown as "??".
+    Integrates with ErrorLogHandler to log bulk actions and errors.
     """
     def __init__(self, size: int, start_address: int = 0, logger: Optional['ErrorLogHandler'] = None):
         """
@@ -99,11 +234,7 @@ class Memory:
         :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
         :raises ValueError: If size or start_address are invalid.
         """
-        if logger is None:
-            from ErrorLogHandler import ErrorLogHandler
-            self.logger = ErrorLogHandler()
-        else:
-            self.logger = logger
+        self.logger = logger if logger is not None else ErrorLogHandler()
 
         if not isinstance(size, int) or size <= 0:
             self.logger.log_error(f"Invalid memory size: {size}. Must be a positive integer.", "Memory.__init__")
@@ -114,7 +245,8 @@ class Memory:
 
         self.size = size
         self.start_address = start_address
-        self.units: List[MemoryUnit] = [MemoryUnit(logger=self.logger) for _ in range(size)]
+        self.data = bytearray(size)
+        self.init_bitmap = bytearray((size + 7) >> 3)
         self.logger.log_action(f"Memory initialized with size {self.size} bytes starting at address {self.start_address:05X}.")
 
     def translate_address(self, address: int) -> int:
@@ -131,6 +263,37 @@ class Memory:
         self.logger.log_error(f"Address {address:05X} is out of range ({self.start_address:05X} - {self.start_address + self.size -1:05X}).", "Memory.translate_address")
         raise ValueError(f"Address {address:05X} is out of range ({self.start_address:05X} - {self.start_address + self.size -1:05X}).")
 
+    def _is_set(self, index: int) -> bool:
+        """
+        Checks the initialized bit for an internal index.
+
+        :param index: The internal index (already translated).
+        :return: True if the byte at the index has been written.
+        """
+        return bool(self.init_bitmap[index >> 3] & (1 << (index & 7)))
+
+    def _mark_initialized(self, index: int, length: int):
+        """
+        Sets the initialized bits for a run of internal indexes.
+        Whole bitmap bytes inside the run are filled with a single slice assignment;
+        only the partial bytes at either end are set bit by bit.
+
+        :param index: The first internal index of the run.
+        :param length: The number of bytes in the run.
+        """
+        end = index + length
+        first_full = (index + 7) >> 3
+        last_full = end >> 3
+        if first_full >= last_full:
+            for i in range(index, end):
+                self.init_bitmap[i >> 3] |= 1 << (i & 7)
+            return
+        for i in range(index, first_full << 3):
+            self.init_bitmap[i >> 3] |= 1 << (i & 7)
+        self.init_bitmap[first_full:last_full] = b'\xff' * (last_full - first_full)
+        for i in range(last_full << 3, end):
+            self.init_bitmap[i >> 3] |= 1 << (i & 7)
+
     def write_byte(self, address: int, value: int):
         """
         Writes a single byte to the specified address.
@@ -138,14 +301,17 @@ class Memory:
         :param address: The absolute memory address to write to.
         :param value: The byte value to write (0-255).
         :raises ValueError: If the address is out of range or value is invalid.
+        :raises TypeError: If the value is not an integer.
         """
-        try:
-            index = self.translate_address(address)
-            self.units[index].set_value(value)
-            self.logger.log_action(f"Wrote byte {value:02X} to address {address:05X}.")
-        except (ValueError, TypeError) as e:
-            self.logger.log_error(str(e), "Memory.write_byte")
-            raise e
+        if not isinstance(value, int):
+            self.logger.log_error("Attempted to set non-integer value.", "Memory.write_byte")
+            raise TypeError(f"Value must be an integer, got {type(value).__name__}")
+        if not (0 <= value <= 0xFF):
+            self.logger.log_error(f"Byte value {value} out of range.", "Memory.write_byte")
+            raise ValueError(f"Byte value must be between 0 and 255 (0x00 to 0xFF), got {value}")
+        index = self.translate_address(address)
+        self.data[index] = value
+        self.init_bitmap[index >> 3] |= 1 << (index & 7)
 
     def read_byte(self, address: int) -> Optional[int]:
         """
@@ -153,54 +319,72 @@ class Memory:
 
         :param address: The absolute memory address to read from.
         :return: The byte value if initialized, else None.
-        :raises ValueError: If the address is out of range.
         """
         try:
             index = self.translate_address(address)
-            value = self.units[index].get_value()
-            if value is not None:
-                self.logger.log_action(f"Read byte {value:02X} from address {address:05X}.")
-            else:
-                self.logger.log_action(f"Read uninitialized byte from address {address:05X}.")
-                raise ValueError(f"Uninitialized byte at address {address:05X}.")
-            return value
         except ValueError as e:
             self.logger.log_error(str(e), "Memory.read_byte")
             return None
+        if not self._is_set(index):
+            self.logger.log_error(f"Uninitialized byte at address {address:05X}.", "Memory.read_byte")
+            return None
+        return self.data[index]
 
     def is_initialized(self, address: int) -> bool:
         """
         Checks if the specified address has been initialized.
 
         :param address: The absolute memory address to check.
-        :return: True if initialized, False otherwise.
-        :raises ValueError: If the address is out of range.
+        :return: True if initialized, False otherwise (including out-of-range addresses).
         """
-        try:
-            index = self.translate_address(address)
-            status = self.units[index].initialized
-            self.logger.log_action(f"Checked initialization at address {address:05X}: {status}.")
-            return status
-        except ValueError as e:
-            self.logger.log_error(str(e), "Memory.is_initialized")
-            return False
+        index = address - self.start_address
+        if 0 <= index < self.size:
+            return self._is_set(index)
+        self.logger.log_error(f"Address {address:05X} is out of range ({self.start_address:05X} - {self.start_address + self.size -1:05X}).", "Memory.is_initialized")
+        return False
 
     def write_bytes(self, start_address: int, data: bytes):
         """
         Writes multiple bytes starting from a specified address.
+        The whole block is range-checked once and copied with a single slice assignment.
 
         :param start_address: The absolute starting address to write to.
         :param data: The bytes data to write.
-        :raises TypeError: If data is not bytes or bytearray.
-        :raises ValueError: If any address is out of range or data is invalid.
+        :raises TypeError: If data is not bytes, bytearray or memoryview.
+        :raises ValueError: If any address is out of range.
         """
-        if not isinstance(data, (bytes, bytearray)):
+        if not isinstance(data, (bytes, bytearray, memoryview)):
             self.logger.log_error("Data must be bytes or bytearray for write_bytes.", "Memory.write_bytes")
             raise TypeError("Data must be bytes or bytearray")
-        for offset, byte in enumerate(data):
-            current_address = start_address + offset
-            self.write_byte(current_address, byte)
-        self.logger.log_action(f"Wrote {len(data)} bytes starting at address {start_address:05X}.")
+        length = len(data)
+        if length == 0:
+            return
+        index = self.translate_address(start_address)
+        self.translate_address(start_address + length - 1)
+        self.data[index:index + length] = data
+        self._mark_initialized(index, length)
+        self.logger.log_action(f"Wrote {length} bytes starting at address {start_address:05X}.")
+
+    def write_hex(self, start_address: int, hex_code: str):
+        """
+        Writes the object code of a Text record, given as hex text, starting from a specified address.
+        The text is range-checked from its length, then decoded with bytes.fromhex and copied into
+        the memory slice in one assignment. Python cannot decode hex into a bytearray in place, so
+        each record still makes one temporary bytes object; the loader no longer builds a list of
+        ints or writes byte by byte.
+
+        :param start_address: The absolute starting address to write to.
+        :param hex_code: The object code as hexadecimal text, two digits per byte.
+        :raises ValueError: If any address is out of range or hex_code is not valid hex.
+        """
+        length = len(hex_code) >> 1
+        if length == 0:
+            return
+        index = self.translate_address(start_address)
+        self.translate_address(start_address + length - 1)
+        self.data[index:index + length] = bytes.fromhex(hex_code)
+        self._mark_initialized(index, length)
+        self.logger.log_action(f"Wrote {length} bytes starting at address {start_address:05X}.")
 
     def read_bytes(self, start_address: int, length: int) -> List[Optional[int]]:
         """
@@ -208,50 +392,148 @@ class Memory:
 
         :param start_address: The absolute starting address to read from.
         :param length: The number of bytes to read.
-        :return: A list of byte values or None if uninitialized.
-        :raises ValueError: If length is invalid or addresses are out of range.
+        :return: A list of byte values, with None for uninitialized or out-of-range bytes.
+        :raises ValueError: If length is invalid.
         """
         if not isinstance(length, int) or length < 0:
             self.logger.log_error("Length must be a non-negative integer for read_bytes.", "Memory.read_bytes")
             raise ValueError(f"Length must be a non-negative integer, got {length}")
-        bytes_list = []
-        for i in range(length):
-            current_address = start_address + i
-            byte = self.read_byte(current_address)
-            bytes_list.append(byte)
+        first = start_address - self.start_address
+        lo = max(first, 0)
+        hi = min(first + length, self.size)
+        if lo > first or hi < first + length:
+            self.logger.log_error(f"Read of {length} bytes at {start_address:05X} extends outside memory.", "Memory.read_bytes")
+        data = self.data
+        is_set = self._is_set
+        bytes_list = [None] * (lo - first) if lo > first else []
+        bytes_list.extend(data[i] if is_set(i) else None for i in range(lo, hi))
+        bytes_list.extend([None] * (length - len(bytes_list)))
         self.logger.log_action(f"Read {length} bytes starting at address {start_address:05X}.")
         return bytes_list
 
-    def get_dump(self, start: int, end: int, width: int = 16) -> str:
+    def _read_row(self, address: int, length: int) -> Optional[Tuple[bytes, int]]:
+        """
+        Returns a run of bytes and its initialized-bit mask for the dump renderer.
+        Addresses outside the memory come back as uninitialized zero bytes.
+
+        :param address: The absolute address of the first byte.
+        :param length: The number of bytes.
+        :return: (data, mask) where bit i of mask is set when byte i is initialized.
+        """
+        index = address - self.start_address
+        lo = max(index, 0)
+        hi = min(index + length, self.size)
+        if lo >= hi:
+            return bytes(length), 0
+        bits = int.from_bytes(self.init_bitmap[lo >> 3:((hi - 1) >> 3) + 1], 'little') >> (lo & 7)
+        mask = (bits & ((1 << (hi - lo)) - 1)) << (lo - index)
+        data = bytes(self.data[lo:hi])
+        if lo > index or hi < index + length:
+            data = bytes(lo - index) + data + bytes(index + length - hi)
+        return data, mask
+
+    def get_dump(self, start: int, end: int, width: int = 16, collapse_empty: bool = False) -> str:
         """
         Generates a formatted memory dump between start and end addresses.
 
         :param start: The starting absolute address.
         :param end: The ending absolute address (non-inclusive).
         :param width: Number of bytes per row.
-        :return: A string representing the memory dump.
-        :raises ValueError: If any address in the range is out of memory bounds.
+        :param collapse_empty: If True, runs of all-"??" rows are collapsed to a "*" line.
+        :return: A string representing the memory dump. Out-of-range and uninitialized bytes show as "??".
+        :raises ValueError: If start is greater than end.
         """
         if start > end:
             self.logger.log_error("Start address must be less than or equal to end address for get_dump.", "Memory.get_dump")
             raise ValueError("Start address must be less than or equal to end address.")
-        dump_str = ""
-        for addr in range(start, end, width):
-            row_bytes = []
-            for offset in range(width):
-                current_addr = addr + offset
-                if current_addr >= end:
-                    break
-                try:
-                    byte = self.read_byte(current_addr)
-                    row_bytes.append(f"{byte:02X}" if byte is not None else "??")
-                except ValueError:
-                    row_bytes.append("??")
-            row_str = f"{addr:05X} " + " ".join(row_bytes).ljust(width * 3)
-            dump_str += row_str + "\n"
+        dump_str = MemoryDumpRenderer(self, width, collapse_empty).render(start, end)
         self.logger.log_action(f"Generated memory dump from {start:05X} to {end:05X}.")
         return dump_str.strip()
 
+    def write_dump(self, file: TextIO, start: Optional[int] = None, end: Optional[int] = None,
+                   width: int = 16, collapse_empty: bool = False) -> int:
+        """
+        Streams a memory dump straight to an open text file (e.g. MEMORY.DAT).
+
+        :param file: A writable text file object.
+        :param start: The starting absolute address. Defaults to the start of memory.
+        :param end: The ending absolute address (non-inclusive). Defaults to the end of memory.
+        :param width: Number of bytes per row.
+        :param collapse_empty: If True, runs of all-"??" rows are collapsed to a "*" line.
+        :return: The number of lines written.
+        :raises ValueError: If start is greater than end.
+        """
+        start = self.start_address if start is None else start
+        end = self.start_address + self.size if end is None else end
+        if start > end:
+            self.logger.log_error("Start address must be less than or equal to end address for write_dump.", "Memory.write_dump")
+            raise ValueError("Start address must be less than or equal to end address.")
+        lines = MemoryDumpRenderer(self, width, collapse_empty).write(file, start, end)
+        self.logger.log_action(f"Wrote memory dump from {start:05X} to {end:05X} ({lines} lines).")
+        return lines
+
+    def save_image(self, file_path: str, execution_address: Optional[int] = None):
+        """
+        Writes the memory as a binary image: a small header (load address, length,
+        execution address) followed by the raw bytes and the initialized bitmap.
+        The buffers are written directly, without formatting or copying.
+
+        :param file_path: The image file to write.
+        :param execution_address: The execution address to record. Defaults to the start address.
+        :raises OSError: If the file cannot be written.
+        """
+        if execution_address is None:
+            execution_address = self.start_address
+        with open(file_path, "wb") as file:
+            file.write(IMAGE_HEADER.pack(IMAGE_MAGIC, IMAGE_VERSION, self.start_address, self.size, execution_address))
+            file.write(self.data)
+            file.write(self.init_bitmap)
+        self.logger.log_action(f"Wrote {self.size}-byte memory image to '{file_path}'.")
+
+    @classmethod
+    def load_image(cls, file_path: str, logger: Optional['ErrorLogHandler'] = None,
+                   use_mmap: bool = False) -> Tuple['Memory', int]:
+        """
+        Loads a binary image written by save_image.
+
+        By default the bytes and bitmap are read straight into the new Memory's
+        buffers with readinto (one read each, no intermediate copies). With use_mmap
+        the buffers are copy-on-write views of a memory-mapped file instead, so
+        nothing is read until it is touched and writes never reach the file.
+
+        :param file_path: The image file to load.
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        :param use_mmap: Map the file instead of reading it.
+        :return: (memory, execution_address)
+        :raises ValueError: If the file is not a valid memory image.
+        :raises OSError: If the file cannot be read.
+        """
+        with open(file_path, "rb") as file:
+            header = file.read(IMAGE_HEADER.size)
+            if len(header) != IMAGE_HEADER.size:
+                raise ValueError(f"'{file_path}' is too short to be a memory image.")
+            magic, version, start_address, size, execution_address = IMAGE_HEADER.unpack(header)
+            if magic != IMAGE_MAGIC or version != IMAGE_VERSION:
+                raise ValueError(f"'{file_path}' is not a version {IMAGE_VERSION} memory image.")
+            bitmap_size = (size + 7) >> 3
+            if os.fstat(file.fileno()).st_size != IMAGE_HEADER.size + size + bitmap_size:
+                raise ValueError(f"'{file_path}' is truncated or has trailing data.")
+
+            if use_mmap:
+                memory = cls.__new__(cls)
+                memory.logger = logger if logger is not None else ErrorLogHandler()
+                memory.size = size
+                memory.start_address = start_address
+                view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+                memory.data = view[IMAGE_HEADER.size:IMAGE_HEADER.size + size]
+                memory.init_bitmap = view[IMAGE_HEADER.size + size:]
+            else:
+                memory = cls(size, start_address, logger)
+                file.readinto(memory.data)
+                file.readinto(memory.init_bitmap)
+        memory.logger.log_action(f"Loaded {size}-byte memory image from '{file_path}' at {start_address:05X}.")
+        return memory, execution_address
+
     def __repr__(self) -> str:
         """
         Returns the full memory dump.
@@ -264,6 +546,289 @@ class Memory:
 
 
 
+class PagedMemory:
+    """
+    Represents the full SIC/XE address space as a table of lazily allocated 4 KB pages.
+    Each page is a small contiguous Memory, created the first time a byte in it is written,
+    so the footprint scales with the bytes actually loaded rather than with the address span.
+    Exposes the same read/write/dump API as Memory.
+    """
+    def __init__(self, logger: Optional['ErrorLogHandler'] = None, size: int = ADDRESS_SPACE):
+        """
+        Initializes an empty page table.
+
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        :param size: Size of the address space in bytes. Defaults to the 20-bit SIC/XE space.
+        :raises ValueError: If size is invalid.
+        """
+        self.logger = logger if logger is not None else ErrorLogHandler()
+        if not isinstance(size, int) or size <= 0:
+            self.logger.log_error(f"Invalid memory size: {size}. Must be a positive integer.", "PagedMemory.__init__")
+            raise ValueError(f"Size must be a positive integer, got {size}")
+        self.size = size
+        self.start_address = 0
+        self.pages: Dict[int, Memory] = {}
+        self.logger.log_action(f"Paged memory initialized covering {self.size} bytes in {PAGE_SIZE}-byte pages.")
+
+    def translate_address(self, address: int) -> int:
+        """
+        Checks that an address falls inside the address space.
+
+        :param address: The absolute memory address.
+        :return: The address itself (the paged space always starts at 0).
+        :raises ValueError: If the address is out of the memory range.
+        """
+        if 0 <= address < self.size:
+            return address
+        self.logger.log_error(f"Address {address:05X} is out of range (00000 - {self.size - 1:05X}).", "PagedMemory.translate_address")
+        raise ValueError(f"Address {address:05X} is out of range (00000 - {self.size - 1:05X}).")
+
+    def _get_page(self, page_number: int, create: bool = False) -> Optional[Memory]:
+        """
+        Looks up a page in the page table, optionally allocating it.
+
+        :param page_number: The page number (address >> PAGE_BITS).
+        :param create: Whether to allocate the page if it does not exist yet.
+        :return: The page, or None if it is not allocated and create is False.
+        """
+        page = self.pages.get(page_number)
+        if page is None and create:
+            page = Memory(PAGE_SIZE, page_number << PAGE_BITS, self.logger)
+            self.pages[page_number] = page
+        return page
+
+    @property
+    def allocated_bytes(self) -> int:
+        """
+        Number of bytes currently allocated for page storage.
+        """
+        return len(self.pages) * PAGE_SIZE
+
+    def write_byte(self, address: int, value: int):
+        """
+        Writes a single byte to the specified address, allocating its page if needed.
+
+        :param address: The absolute memory address to write to.
+        :param value: The byte value to write (0-255).
+        :raises ValueError: If the address is out of range or value is invalid.
+        :raises TypeError: If the value is not an integer.
+        """
+        self.translate_address(address)
+        self._get_page(address >> PAGE_BITS, create=True).write_byte(address, value)
+
+    def read_byte(self, address: int) -> Optional[int]:
+        """
+        Reads a single byte from the specified address.
+
+        :param address: The absolute memory address to read from.
+        :return: The byte value if initialized, else None.
+        """
+        try:
+            self.translate_address(address)
+        except ValueError as e:
+            self.logger.log_error(str(e), "PagedMemory.read_byte")
+            return None
+        page = self._get_page(address >> PAGE_BITS)
+        if page is None:
+            self.logger.log_error(f"Uninitialized byte at address {address:05X}.", "PagedMemory.read_byte")
+            return None
+        return page.read_byte(address)
+
+    def is_initialized(self, address: int) -> bool:
+        """
+        Checks if the specified address has been initialized.
+
+        :param address: The absolute memory address to check.
+        :return: True if initialized, False otherwise (including untouched pages).
+        """
+        if not (0 <= address < self.size):
+            self.logger.log_error(f"Address {address:05X} is out of range (00000 - {self.size - 1:05X}).", "PagedMemory.is_initialized")
+            return False
+        page = self._get_page(address >> PAGE_BITS)
+        return page is not None and page._is_set(address & PAGE_MASK)
+
+    def write_bytes(self, start_address: int, data: bytes):
+        """
+        Writes multiple bytes starting from a specified address.
+        The block is split at page boundaries and each piece is copied with one slice assignment.
+
+        :param start_address: The absolute starting address to write to.
+        :param data: The bytes data to write.
+        :raises TypeError: If data is not bytes, bytearray or memoryview.
+        :raises ValueError: If any address is out of range.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            self.logger.log_error("Data must be bytes or bytearray for write_bytes.", "PagedMemory.write_bytes")
+            raise TypeError("Data must be bytes or bytearray")
+        length = len(data)
+        if length == 0:
+            return
+        self.translate_address(start_address)
+        self.translate_address(start_address + length - 1)
+        view = memoryview(data)
+        address = start_address
+        done = 0
+        while done < length:
+            offset = address & PAGE_MASK
+            chunk = min(PAGE_SIZE - offset, length - done)
+            page = self._get_page(address >> PAGE_BITS, create=True)
+            page.data[offset:offset + chunk] = view[done:done + chunk]
+            page._mark_initialized(offset, chunk)
+            address += chunk
+            done += chunk
+        self.logger.log_action(f"Wrote {length} bytes starting at address {start_address:05X}.")
+
+    def write_hex(self, start_address: int, hex_code: str):
+        """
+        Writes the object code of a Text record, given as hex text, starting from a specified address.
+        The text is split at page boundaries and each piece is decoded by the page's own write_hex.
+
+        :param start_address: The absolute starting address to write to.
+        :param hex_code: The object code as hexadecimal text, two digits per byte.
+        :raises ValueError: If any address is out of range or hex_code is not valid hex.
+        """
+        length = len(hex_code) >> 1
+        if length == 0:
+            return
+        self.translate_address(start_address)
+        self.translate_address(start_address + length - 1)
+        address = start_address
+        done = 0
+        while done < length:
+            chunk = min(PAGE_SIZE - (address & PAGE_MASK), length - done)
+            page = self._get_page(address >> PAGE_BITS, create=True)
+            page.write_hex(address, hex_code[done << 1:(done + chunk) << 1])
+            address += chunk
+            done += chunk
+
+    def read_bytes(self, start_address: int, length: int) -> List[Optional[int]]:
+        """
+        Reads multiple bytes starting from a specified address.
+
+        :param start_address: The absolute starting address to read from.
+        :param length: The number of bytes to read.
+        :return: A list of byte values, with None for uninitialized or out-of-range bytes.
+        :raises ValueError: If length is invalid.
+        """
+        if not isinstance(length, int) or length < 0:
+            self.logger.log_error("Length must be a non-negative integer for read_bytes.", "PagedMemory.read_bytes")
+            raise ValueError(f"Length must be a non-negative integer, got {length}")
+        bytes_list: List[Optional[int]] = []
+        address = start_address
+        end = start_address + length
+        while address < end:
+            if not (0 <= address < self.size):
+                chunk = min(-address, end - address) if address < 0 else end - address
+                bytes_list.extend([None] * chunk)
+                address += chunk
+                continue
+            offset = address & PAGE_MASK
+            chunk = min(PAGE_SIZE - offset, end - address)
+            page = self._get_page(address >> PAGE_BITS)
+            if page is None:
+                bytes_list.extend([None] * chunk)
+            else:
+                bytes_list.extend(page.data[i] if page._is_set(i) else None for i in range(offset, offset + chunk))
+            address += chunk
+        self.logger.log_action(f"Read {length} bytes starting at address {start_address:05X}.")
+        return bytes_list
+
+    def _is_allocated(self, address: int, length: int) -> bool:
+        """
+        Checks whether any page of a run of addresses has been allocated, without reading it.
+
+        :param address: The absolute address of the first byte.
+        :param length: The number of bytes.
+        :return: False if the run lies entirely in untouched pages.
+        """
+        pages = self.pages
+        return any(page_number in pages
+                   for page_number in range(address >> PAGE_BITS, ((address + length - 1) >> PAGE_BITS) + 1))
+
+    def _read_row(self, address: int, length: int) -> Optional[Tuple[bytes, int]]:
+        """
+        Returns a run of bytes and its initialized-bit mask for the dump renderer.
+
+        :param address: The absolute address of the first byte.
+        :param length: The number of bytes.
+        :return: (data, mask) as for Memory._read_row, or None if the run lies entirely in untouched pages.
+        """
+        first_page = address >> PAGE_BITS
+        last_page = (address + length - 1) >> PAGE_BITS
+        if first_page == last_page:
+            page = self.pages.get(first_page)
+            return None if page is None else page._read_row(address, length)
+        pieces = []
+        mask = 0
+        shift = 0
+        allocated = False
+        for page_number in range(first_page, last_page + 1):
+            lo = max(address, page_number << PAGE_BITS)
+            hi = min(address + length, (page_number + 1) << PAGE_BITS)
+            page = self.pages.get(page_number)
+            if page is None:
+                pieces.append(bytes(hi - lo))
+            else:
+                allocated = True
+                data, bits = page._read_row(lo, hi - lo)
+                pieces.append(data)
+                mask |= bits << shift
+            shift += hi - lo
+        return (b"".join(pieces), mask) if allocated else None
+
+    def get_dump(self, start: int, end: int, width: int = 16, collapse_empty: bool = False) -> str:
+        """
+        Generates a formatted memory dump between start and end addresses.
+        Rows that lie entirely in untouched pages are skipped.
+
+        :param start: The starting absolute address.
+        :param end: The ending absolute address (non-inclusive).
+        :param width: Number of bytes per row.
+        :param collapse_empty: If True, runs of all-"??" rows are collapsed to a "*" line.
+        :return: A string representing the memory dump.
+        :raises ValueError: If start is greater than end.
+        """
+        if start > end:
+            self.logger.log_error("Start address must be less than or equal to end address for get_dump.", "PagedMemory.get_dump")
+            raise ValueError("Start address must be less than or equal to end address.")
+        dump_str = MemoryDumpRenderer(self, width, collapse_empty).render(start, end)
+        self.logger.log_action(f"Generated memory dump from {start:05X} to {end:05X}.")
+        return dump_str.strip()
+
+    def write_dump(self, file: TextIO, start: int = 0, end: Optional[int] = None,
+                   width: int = 16, collapse_empty: bool = False) -> int:
+        """
+        Streams a memory dump of the touched pages straight to an open text file (e.g. MEMORY.DAT).
+
+        :param file: A writable text file object.
+        :param start: The starting absolute address. Defaults to 0.
+        :param end: The ending absolute address (non-inclusive). Defaults to the end of the address space.
+        :param width: Number of bytes per row.
+        :param collapse_empty: If True, runs of all-"??" rows are collapsed to a "*" line.
+        :return: The number of lines written.
+        :raises ValueError: If start is greater than end.
+        """
+        end = self.size if end is None else end
+        if start > end:
+            self.logger.log_error("Start address must be less than or equal to end address for write_dump.", "PagedMemory.write_dump")
+            raise ValueError("Start address must be less than or equal to end address.")
+        lines = MemoryDumpRenderer(self, width, collapse_empty).write(file, start, end)
+        self.logger.log_action(f"Wrote memory dump from {start:05X} to {end:05X} ({lines} lines).")
+        return lines
+
+    def __repr__(self) -> str:
+        """
+        Returns a dump of every allocated page.
+
+        :return: A string representing the touched parts of memory.
+        """
+        return "\n".join(self.get_dump(page_number << PAGE_BITS, (page_number + 1) << PAGE_BITS)
+                         for page_number in sorted(self.pages))
+
+
+
+
+
 def main():
     # Initialize the ErrorLogHandler
     logger = ErrorLogHandler(print_log_actions=True)
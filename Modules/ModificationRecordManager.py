@@ -46,12 +46,14 @@ class ModificationRecordManager:
         """
         return self.separation_character if self.activate_separator else ""
 
-    def add_modification(self, address: int, length: int):
+    def add_modification(self, address: int, length: int, sign: str = "", symbol: str = ""):
         """
         Records a modification at the specified address with the given length.
         
         :param address: The memory address that requires modification.
         :param length: The length in half-bytes (nibbles) that need to be modified.
+        :param sign: '+' or '-' for an external symbol; empty for program relocation.
+        :param symbol: The external (EXTREF) symbol whose address is added or subtracted.
         """
         # Validate modification parameters
         
@@ -68,16 +70,18 @@ class ModificationRecordManager:
         # if not self.validate_modification(address, length):
         #     return  # Validation failed; error already logged
         
-        # Check for duplicate modification records
-        if any(record.startswith(f"M{self.sp_ch}{address:06X}") for record in self.modification_records):
+        # Format the modification record
+        formatted_record = f"M{self.sp_ch}{address:06X}{self.sp_ch}{length:02X}"
+        if symbol:
+            formatted_record += f"{self.sp_ch}{sign}{symbol}"
+        
+        # Check for duplicate modification records; one address may carry several external symbols
+        if formatted_record in self.modification_records:
             self.logger.log_error(
                 f"Duplicate modification record for address {address:06X}."
             )
             return
         
-        # Format the modification record
-        formatted_record = f"M{self.sp_ch}{address:06X}{self.sp_ch}{length:02X}"
-        
         # Add the formatted record to the list of modification records
         self.modification_records.append(formatted_record)
         
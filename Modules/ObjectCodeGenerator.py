@@ -33,7 +33,9 @@ class ObjectCodeGenerator:
                  literal_table,
                  opcode_handler,
                  logger,
-                 location_counter):
+                 location_counter,
+                 expression_parser=None,
+                 expression_evaluator=None):
         """
         Initializes the ObjectCodeGenerator with necessary references.
         
@@ -42,6 +44,8 @@ class ObjectCodeGenerator:
         :param opcode_handler: Instance of OpcodeHandler.
         :param logger: Instance of ErrorLogHandler.
         :param location_counter: Instance of LocationCounter.
+        :param expression_parser: ExpressionParser for operand expressions. If None, a new instance is created.
+        :param expression_evaluator: ExpressionEvaluator for operand expressions. If None, a new instance is created.
         """
         self.logger = logger
         self.location_counter = location_counter
@@ -49,6 +53,8 @@ class ObjectCodeGenerator:
         self.literal_table = literal_table
         self.opcode_handler = opcode_handler
         self.validator = Validator(logger = self.logger)
+        self.expression_parser = expression_parser or ExpressionParser(None, literal_table, logger)
+        self.expression_evaluator = expression_evaluator or ExpressionEvaluator(None, symbol_table, literal_table, logger)
 
 
         self.text_record_manager = TextRecordManager(
@@ -63,6 +69,8 @@ class ObjectCodeGenerator:
         
         self.base_register_value = None
         self.nixbpe_flags = [0, 0, 0, 0, 0, 0]  # [n, i, x, b, p, e]
+        self.external_references = []  # (sign, symbol) pairs of the last resolved operand
+        self.relocation_info = 'A'  # 'R' or 'A' for the last resolved operand
     
     def generate_object_code(self, source_lines):
         """
@@ -127,6 +135,7 @@ class ObjectCodeGenerator:
         # Detect illegal addressing
         self.detect_illegal_addressing(source_line, opcode_info)
         if source_line.has_errors():
+            self.skip_instruction(source_line, format_type)
             return None
         
         # Handle based on instruction format
@@ -144,6 +153,7 @@ class ObjectCodeGenerator:
         
         if object_code is None:
             self.logger.log_error(f"Error generating object code for instruction '{source_line.opcode_mnemonic}' at line {source_line.line_number}.")
+            self.skip_instruction(source_line, format_type)
             return None
         
         # Add object code to text record
@@ -171,6 +181,18 @@ class ObjectCodeGenerator:
         self.logger.log_action(f"Object code '{object_code}' generated for instruction '{source_line.opcode_mnemonic}' at line {source_line.line_number} {source_line.line_text}.")
         return object_code
     
+    def skip_instruction(self, source_line, format_type):
+        """
+        Advances the location counter past an instruction that produced no object code,
+        so later lines keep the addresses Pass 1 gave them.
+        
+        :param source_line: Instance of SourceCodeLine.
+        :param format_type: The instruction format, which is also its length in bytes.
+        """
+        source_line.set_instruction_length(format_type)
+        self.location_counter.increment_by_decimal(format_type)
+        self.logger.log_action(f"Skipped {format_type} bytes for instruction '{source_line.opcode_mnemonic}' at line {source_line.line_number}.")
+    
     def handle_format1(self, source_line, opcode):
         """
         Handles format 1 instructions.
@@ -227,10 +249,13 @@ class ObjectCodeGenerator:
         operand, self.nixbpe_flags = self.process_addressing_modes(operand, self.nixbpe_flags, source_line)
         
         # Resolve operand
-        resolved_value, relocation = self.resolve_operand(operand, current_address)
+        resolved_value, relocation = self.resolve_operand(operand, current_address, source_line)
         if resolved_value is None:
             self.logger.log_error(f"Undefined symbol '{operand}' at line {source_line.line_number}.")
             return None
+        if self.external_references:
+            self.report_operand_error(f"External symbol in operand '{operand}' requires format 4 at line {source_line.line_number}.", source_line)
+            return None
         
         # convert the resolved value to an int
         # resolved_value = self.validator.convert_string_hex_str_to_int(resolved_value)
@@ -270,7 +295,7 @@ class ObjectCodeGenerator:
         operand, self.nixbpe_flags = self.process_addressing_modes(operand, self.nixbpe_flags, source_line)
         
         # Resolve operand
-        resolved_value, relocation = self.resolve_operand(operand, current_address)
+        resolved_value, relocation = self.resolve_operand(operand, current_address, source_line)
         if resolved_value is None:
             self.logger.log_error(f"Undefined symbol '{operand}' at line {source_line.line_number}.")
             return None
@@ -295,15 +320,26 @@ class ObjectCodeGenerator:
         return object_code
     
     
-    def resolve_operand(self, operand, current_address):
+    def resolve_operand(self, operand, current_address, source_line=None):
+        """
+        Resolves an operand to its value. EXTREF symbols resolve to 0 and are
+        collected, with their signs, in self.external_references for the
+        modification records; self.relocation_info keeps the relocation of the result.
+        
+        :param operand: The operand without addressing-mode prefixes.
+        :param current_address: The address of the instruction, used for '*'.
+        :param source_line: Instance of SourceCodeLine that receives any error.
+        :return: Tuple (resolved_value, relocation_info) with 'R' or 'A', or (None, None) on error.
+        """
         self.logger.log_action(f"Resolving operand '{operand}' at address {current_address}.")
         relocation_info = 'A'
+        self.external_references = []
 
         if operand.startswith('='):
             # It's a literal
             literal = self.literal_table.get_literal_data_from_name(operand)
             if not literal:
-                self.logger.log_error(f"Literal '{operand}' not found in literal table.")
+                self.report_operand_error(f"Literal '{operand}' not found in literal table.", source_line)
                 return (None, None)
             # # Convert the literal value to an integer
             resolved_value = self.validator.convert_string_hex_str_to_int(literal.address)
@@ -317,16 +353,45 @@ class ObjectCodeGenerator:
         elif operand.isdigit():
             # Immediate numeric value
             resolved_value = int(operand)
+        elif any(operator in operand for operator in '+-*/()'):
+            # An expression such as BUFEND-BUFFER+3; '*' is the current address
+            compiled = self.expression_parser.compile_line(operand)
+            if compiled is None:
+                self.report_operand_error(f"Invalid expression '{operand}'.", source_line)
+                return (None, None)
+            evaluated = self.expression_evaluator.evaluate_expression(compiled, location=current_address)
+            if evaluated['error'] or not isinstance(evaluated['value'], int):
+                self.report_operand_error(f"Invalid expression '{operand}': {evaluated['error']}", source_line)
+                return (None, None)
+            resolved_value = evaluated['value']
+            relocation_info = 'R' if evaluated['relocatable'] else 'A'
+            self.external_references = evaluated['external_references']
         else:
             # It's a symbol
             value, rflag, error = self.symbol_table.get(operand)
             if error is not None:
                 # Symbol not found
-                self.logger.log_error(error)
+                self.report_operand_error(error, source_line)
                 return (None, None)
+            if normalize_symbol(operand)[0] in self.expression_evaluator.external_keys:
+                # The linker supplies the address of an EXTREF symbol
+                self.external_references = [('+', operand)]
+                value, rflag = 0, False
             resolved_value = value
             relocation_info = 'R' if rflag else 'A'
+        self.relocation_info = relocation_info
         return (resolved_value, relocation_info)
+
+    def report_operand_error(self, error, source_line=None):
+        """
+        Logs an operand error and records it on the source line.
+        
+        :param error: The error message.
+        :param source_line: Instance of SourceCodeLine, if there is one.
+        """
+        self.logger.log_error(error)
+        if source_line is not None:
+            source_line.add_error(error)
     
     def calculate_displacement(self, target_address, current_address):
         """
@@ -571,16 +636,11 @@ class ObjectCodeGenerator:
         :return: Object code as a hexadecimal string.
         """
         self.logger.log_action(f"Generating object code for literal '{literal.name}'.")
-        if literal.type == 'C':
-            # Convert each character to its ASCII hexadecimal value
-            object_code = ''.join([format(ord(char), '02X') for char in literal.value])
-        elif literal.type == 'X':
-            # Use the hexadecimal value directly
-            object_code = literal.value.upper()
-        else:
-            self.logger.log_error(f"Unsupported literal type '{literal.type}' for literal '{literal.name}'.")
+        if literal.data is None:
+            self.logger.log_error(f"Literal '{literal.name}' has no byte value ('{literal.value}').")
             return None
-        return object_code
+        # LiteralData keeps the bytes and caches their hex, so nothing is converted here.
+        return literal.value
         
     def requires_modification(self, source_line):
         """
@@ -0,0 +1,113 @@
+# ObjectFileReader.py
+
+import os
+import sys
+import mmap
+from typing import Iterator, Optional
+
+from pathlib import Path
+
+repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(repo_home_path)
+
+from Modules.ErrorLogHandler import ErrorLogHandler
+
+
+class ObjectFileReader:
+    """
+    Reads object program files through a read-only memory map.
+
+    Lines are handed out as memoryview slices of the mapping, so the file is never
+    copied into a list of strings. Each slice is released as soon as the consumer
+    asks for the next line; LinkerParser.parse_record accepts the slices directly.
+    The path is opened as given and never goes through FileExplorer.find_file,
+    so the reader never prompts.
+
+    Usage:
+        with ObjectFileReader("prog.obj") as reader:
+            for line in reader.iter_lines():
+                record = parser.parse_record(line)
+    """
+
+    def __init__(self, file_path: str, logger: Optional[ErrorLogHandler] = None):
+        """
+        Initializes the reader. The file is opened on __enter__ or open().
+
+        :param file_path: Path to the object file.
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        """
+        self.file_path = file_path
+        self.logger = logger or ErrorLogHandler()
+        self._file = None
+        self._map = None
+        self._view = None
+        self._iterators = []
+
+    def open(self):
+        """
+        Opens and maps the file.
+
+        :raises OSError: If the file cannot be opened.
+        """
+        self._file = open(self.file_path, "rb")
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+
+    def close(self):
+        """
+        Unmaps and closes the file. Line iterators that are still open are closed
+        first so that no slice of the mapping is left exported.
+        """
+        for iterator in self._iterators:
+            iterator.close()
+        self._iterators.clear()
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'ObjectFileReader':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def iter_lines(self) -> Iterator[memoryview]:
+        """
+        Yields every line of the file as a memoryview without its line ending or
+        trailing whitespace. Blank lines are yielded as empty views so callers can
+        count line numbers. A view is only valid until the next line is requested.
+
+        :return: An iterator over memoryview slices.
+        """
+        iterator = self._iter_lines()
+        self._iterators.append(iterator)
+        return iterator
+
+    def _iter_lines(self) -> Iterator[memoryview]:
+        mapped = self._map
+        if mapped is None:
+            return
+        view = self._view
+        size = len(mapped)
+        position = 0
+        while position < size:
+            end = mapped.find(b"\n", position)
+            if end == -1:
+                end = size
+            stop = end
+            while stop > position and mapped[stop - 1] in b" \t\r":
+                stop -= 1
+            line = view[position:stop]
+            try:
+                yield line
+            finally:
+                line.release()
+            position = end + 1
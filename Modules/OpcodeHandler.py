@@ -93,7 +93,8 @@ class OpcodeHandler:
             'RESB', 'RESW', 
             'EQU', 'ORG', 
             'EXTDEF', 'EXTREF', 
-            'BASE', 'NOBASE'
+            'BASE', 'NOBASE',
+            'LTORG'
             ]
 
         
@@ -0,0 +1,135 @@
+# RelocationEngine.py
+
+import os
+import sys
+from typing import Dict, List, Optional
+
+from pathlib import Path
+
+repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(repo_home_path)
+
+from Modules.ErrorLogHandler import ErrorLogHandler
+from Modules.Memory import Memory
+
+
+class RelocationEngine:
+    """
+    Applies the Modification records of a link as one batch.
+
+    Pass 2 resolves each M record against the ESTAB and hands the result to add().
+    Records are grouped by field width (in half-bytes) and records that hit the same
+    field are folded into one net delta, so apply() does a single read-modify-write
+    per field in one address-ordered pass over the memory buffer. Arithmetic wraps
+    around within the field width (20 bits for 5 half-bytes, 24 bits for 6).
+    Overlapping, out-of-range and uninitialized fields are reported once per kind.
+    """
+
+    def __init__(self, memory, logger: Optional[ErrorLogHandler] = None):
+        """
+        Initializes the engine.
+
+        :param memory: The Memory (or PagedMemory) to relocate.
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        """
+        self.memory = memory
+        self.logger = logger or ErrorLogHandler()
+        self.fields: Dict[int, Dict[int, int]] = {}   # half-byte width -> {absolute address: net delta}
+        self.record_count = 0
+
+    def add(self, address: int, half_byte_count: int, delta: int):
+        """
+        Queues a resolved modification.
+
+        :param address: The absolute address of the first byte of the field.
+        :param half_byte_count: The field width in half-bytes (5 or 6).
+        :param delta: The signed value to add (negative for '-' records).
+        """
+        group = self.fields.setdefault(half_byte_count, {})
+        group[address] = group.get(address, 0) + delta
+        self.record_count += 1
+
+    def apply(self) -> int:
+        """
+        Applies every queued modification in one pass and clears the queue.
+
+        :return: The number of fields that were modified.
+        """
+        fields = sorted((address, width, delta)
+                        for width, group in self.fields.items()
+                        for address, delta in group.items())
+        contiguous = isinstance(self.memory, Memory)
+        overlapping: List[int] = []
+        out_of_range: List[int] = []
+        uninitialized: List[int] = []
+        applied = 0
+        previous_end = None
+
+        for address, width, delta in fields:
+            byte_count = (width + 1) // 2
+            mask = (1 << (4 * width)) - 1
+            if previous_end is not None and address < previous_end:
+                overlapping.append(address)
+            previous_end = max(previous_end or 0, address + byte_count)
+
+            if contiguous:
+                status = self._apply_contiguous(address, byte_count, mask, delta)
+            else:
+                status = self._apply_generic(address, byte_count, mask, delta)
+            if status == "range":
+                out_of_range.append(address)
+            elif status == "uninitialized":
+                uninitialized.append(address)
+            else:
+                applied += 1
+
+        self._report(overlapping, "Overlapping modification fields")
+        self._report(out_of_range, "Modifications outside the loaded memory")
+        self._report(uninitialized, "Modifications of uninitialized memory")
+        self.logger.log_action(f"Applied {self.record_count} modification records to {applied} fields.")
+        self.fields.clear()
+        self.record_count = 0
+        return applied
+
+    def _apply_contiguous(self, address: int, byte_count: int, mask: int, delta: int) -> Optional[str]:
+        """
+        Read-modify-write of one field directly in a contiguous Memory buffer.
+
+        :return: None on success, "range" or "uninitialized" on failure.
+        """
+        memory = self.memory
+        index = address - memory.start_address
+        if index < 0 or index + byte_count > memory.size:
+            return "range"
+        for i in range(index, index + byte_count):
+            if not memory._is_set(i):
+                return "uninitialized"
+        data = memory.data
+        word = int.from_bytes(data[index:index + byte_count], 'big')
+        word = (word & ~mask) | ((word + delta) & mask)
+        data[index:index + byte_count] = word.to_bytes(byte_count, 'big')
+        return None
+
+    def _apply_generic(self, address: int, byte_count: int, mask: int, delta: int) -> Optional[str]:
+        """
+        Read-modify-write of one field through the _read_row / write_bytes API (PagedMemory).
+
+        :return: None on success, "range" or "uninitialized" on failure.
+        """
+        if address < 0 or address + byte_count > self.memory.size:
+            return "range"
+        row = self.memory._read_row(address, byte_count)
+        if row is None or row[1] != (1 << byte_count) - 1:
+            return "uninitialized"
+        word = int.from_bytes(row[0], 'big')
+        word = (word & ~mask) | ((word + delta) & mask)
+        self.memory.write_bytes(address, word.to_bytes(byte_count, 'big'))
+        return None
+
+    def _report(self, addresses: List[int], description: str):
+        """
+        Logs a single error listing every address of one kind of problem.
+        """
+        if addresses:
+            listed = ", ".join(f"{address:05X}" for address in addresses)
+            self.logger.log_error(f"{description} ({len(addresses)}): {listed}", "RelocationEngine.apply")
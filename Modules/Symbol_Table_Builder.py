@@ -34,12 +34,21 @@
 
 import sys
 import os
+import io
+import bisect
+import functools
+import struct
+import threading
+from contextlib import ExitStack
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 
 repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(repo_home_path)
 
 from Modules.FileExplorer import FileExplorer
 from Modules.ErrorLogHandler import ErrorLogHandler
+from Modules.TableSnapshot import TableSnapshot
 
 # Try to import Tkinter for GUI file explorer. If not available, fallback to manual entry.
 try:
@@ -50,6 +59,42 @@ except ImportError:
     tkinter_available = False
 
 
+def pack_symbol_name(symbol):
+    """
+    Packs an uppercase symbol name of at most 4 characters into a 32-bit
+    integer, one byte per character, left-justified and zero padded. The
+    packed keys sort in the same order as the names themselves.
+
+    :param symbol: The normalized symbol name.
+    :return: The packed integer key.
+    """
+    return int.from_bytes(symbol.encode("latin-1", "replace").ljust(4, b"\0"), "big")
+
+
+def unpack_symbol_key(key):
+    """
+    Inverse of pack_symbol_name.
+
+    :param key: A packed integer key.
+    :return: The symbol name.
+    """
+    return key.to_bytes(4, "big").rstrip(b"\0").decode("latin-1")
+
+
+@functools.lru_cache(maxsize=8192)
+def normalize_symbol(name):
+    """
+    Normalizes a symbol token to its 4-character uppercase name and packed
+    key. Results are cached, so a token that is looked up repeatedly (e.g.
+    an operand resolved on every pass) is only converted once.
+
+    :param name: The symbol token as written in the source.
+    :return: (key, symbol) tuple.
+    """
+    symbol = name.upper()[:4]
+    return pack_symbol_name(symbol), symbol
+
+
 class SymbolData:
     """
     /********************************************************************
@@ -72,7 +117,9 @@ class SymbolData:
     ***      duplicated.                                                ***
     ********************************************************************/
     """
-    
+
+    __slots__ = ("key", "_symbol", "value", "rflag", "iflag", "mflag", "address")
+
     def __init__(self, symbol, value, rflag, iflag=True, mflag=False, address=None):
         """
         /********************************************************************
@@ -92,7 +139,7 @@ class SymbolData:
         ***    - mflag (bool, optional): Defaults to False.                 ***
         ********************************************************************/
         """
-        self.symbol: str = symbol.upper()[:4]  # Only first 4 characters, uppercase
+        self.key, self._symbol = normalize_symbol(symbol)  # Only first 4 characters, uppercase
         self.value: int = value
         self.rflag: bool = rflag
         self.iflag: bool = iflag
@@ -102,6 +149,14 @@ class SymbolData:
         else:
             self.address: int = None
 
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+
+    @symbol.setter
+    def symbol(self, name):
+        self.key, self._symbol = normalize_symbol(name)
+
 
 class SymbolNode:
     """
@@ -123,6 +178,8 @@ class SymbolNode:
     ********************************************************************/
     """
     # Represents a node in the Binary Search Tree, storing a SymbolData object.
+    __slots__ = ("symbol_data", "left", "right")
+
     def __init__(self, symbol_data: SymbolData):
         """
         /********************************************************************
@@ -145,6 +202,809 @@ class SymbolNode:
         self.right = None  # Right child node
 
 
+class AVLSymbolNode(SymbolNode):
+    """
+    SymbolNode that also records the height of its subtree for AVL
+    rebalancing. A leaf has height 1.
+    """
+    __slots__ = ("height",)
+
+    def __init__(self, symbol_data: SymbolData):
+        super().__init__(symbol_data)
+        self.height = 1
+
+
+class BSTSymbolIndex:
+    """
+    /********************************************************************
+    ***  CLASS  : BSTSymbolIndex                                        ***
+    *********************************************************************
+    ***  DESCRIPTION : Storage backend that keeps SymbolData objects    ***
+    ***  in an unbalanced binary search tree of SymbolNode objects.     ***
+    ***  This is the original symbol table layout. Every operation      ***
+    ***  walks the tree with a loop and an explicit path, so a          ***
+    ***  degenerate tree is slow but never hits the recursion limit.    ***
+    ***  AVLSymbolIndex reuses these walks and rebalances the path.     ***
+    ********************************************************************/
+    """
+
+    node_class = SymbolNode
+
+    def __init__(self):
+        self.root = None
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def find(self, key):
+        """
+        Returns the SymbolData stored under the packed `key`, or None.
+        """
+        node = self.root
+        while node is not None:
+            node_key = node.symbol_data.key
+            if key == node_key:
+                return node.symbol_data
+            node = node.left if key < node_key else node.right
+        return None
+
+    def add(self, symbol_data):
+        """
+        Inserts `symbol_data` unless its name is already present.
+
+        :return: The existing SymbolData on a duplicate, otherwise None.
+        """
+        new_node = self.node_class(symbol_data)
+        if self.root is None:
+            self.root = new_node
+            self.count = 1
+            return None
+
+        key = symbol_data.key
+        path = []
+        node = self.root
+        while True:
+            if key == node.symbol_data.key:
+                return node.symbol_data
+            path.append(node)
+            if key < node.symbol_data.key:
+                if node.left is None:
+                    node.left = new_node
+                    break
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = new_node
+                    break
+                node = node.right
+
+        self.count += 1
+        self._retrace(path)
+        return None
+
+    def remove(self, key):
+        """
+        Removes the symbol stored under `key` from the tree. A node with
+        two children takes the data of its in-order successor, which is
+        then unlinked.
+
+        :return: True if the symbol was present.
+        """
+        path = []
+        node = self.root
+        while node is not None and key != node.symbol_data.key:
+            path.append(node)
+            node = node.left if key < node.symbol_data.key else node.right
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.symbol_data = successor.symbol_data
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+
+        self.count -= 1
+        self._retrace(path)
+        return True
+
+    def find_many(self, keys):
+        """
+        Looks up a batch of packed keys. Small batches probe the tree once
+        per key; when that would cost more than one ordered walk, the
+        sorted keys are merged against an in-order traversal instead.
+
+        :param keys: Set of packed keys.
+        :return: Dict mapping each found key to its SymbolData.
+        """
+        if not keys or self.root is None:
+            return {}
+        if len(keys) * max(self.count, 2).bit_length() <= self.count:
+            found = {}
+            for key in keys:
+                symbol_data = self.find(key)
+                if symbol_data is not None:
+                    found[key] = symbol_data
+            return found
+
+        wanted = sorted(keys)
+        found = {}
+        position = 0
+        for symbol_data in self.inorder_traversal(wanted[0], wanted[-1]):
+            while wanted[position] < symbol_data.key:
+                position += 1
+            if wanted[position] == symbol_data.key:
+                found[symbol_data.key] = symbol_data
+                position += 1
+                if position == len(wanted):
+                    break
+        return found
+
+    def _retrace(self, path):
+        """
+        Hook called with the root-to-parent path after a structural
+        change. The plain BST does not rebalance.
+        """
+        return None
+
+    def find_min(self, node):
+        """
+        Returns the leftmost node of the subtree rooted at `node`.
+        """
+        while node.left is not None:
+            node = node.left
+        return node
+
+    def inorder_traversal(self, low=None, high=None):
+        """
+        Yields SymbolData in alphabetical order using an explicit stack,
+        optionally limited to packed keys between `low` and `high`
+        inclusive.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                # Subtrees left of a key below `low` cannot hold matches.
+                if low is not None and node.symbol_data.key < low:
+                    node = None
+                else:
+                    node = node.left
+            node = stack.pop()
+            key = node.symbol_data.key
+            if high is not None and key > high:
+                return
+            if low is None or key >= low:
+                yield node.symbol_data
+            node = node.right
+
+    def sorted_symbols(self):
+        """
+        Returns every SymbolData in alphabetical order.
+        """
+        return list(self.inorder_traversal())
+
+    def symbols_between(self, low, high):
+        """
+        Returns the SymbolData whose packed keys fall between `low` and
+        `high` inclusive, in alphabetical order.
+        """
+        return list(self.inorder_traversal(low, high))
+
+    def build(self, sorted_symbols):
+        """
+        Replaces the tree with a perfectly balanced one built from
+        `sorted_symbols`, which must be sorted by name with no duplicates.
+        Each midpoint becomes a subtree root, so the build is O(n).
+        """
+        track_height = issubclass(self.node_class, AVLSymbolNode)
+        self.root = None
+        self.count = len(sorted_symbols)
+        # Work items: (low, high, parent, attach_left) over sorted_symbols[low:high].
+        pending = [(0, len(sorted_symbols), None, False)]
+        while pending:
+            low, high, parent, attach_left = pending.pop()
+            if low >= high:
+                continue
+            middle = (low + high) // 2
+            node = self.node_class(sorted_symbols[middle])
+            if track_height:
+                node.height = (high - low).bit_length()
+            if parent is None:
+                self.root = node
+            elif attach_left:
+                parent.left = node
+            else:
+                parent.right = node
+            pending.append((low, middle, node, True))
+            pending.append((middle + 1, high, node, False))
+
+    def clear(self):
+        self.root = None
+        self.count = 0
+
+
+class AVLSymbolIndex(BSTSymbolIndex):
+    """
+    /********************************************************************
+    ***  CLASS  : AVLSymbolIndex                                        ***
+    *********************************************************************
+    ***  DESCRIPTION : Storage backend that keeps the symbol tree       ***
+    ***  height-balanced (AVL). After each insert or remove the path    ***
+    ***  from the changed node back to the root is rebalanced with      ***
+    ***  rotations, so insert, search and delete are O(log n) even when ***
+    ***  labels arrive in sorted order.                                 ***
+    ********************************************************************/
+    """
+
+    node_class = AVLSymbolNode
+
+    @staticmethod
+    def _height(node):
+        return node.height if node is not None else 0
+
+    def _update_height(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        """
+        Restores the AVL property at `node` and returns the subtree root.
+        """
+        self._update_height(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _retrace(self, path):
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            balanced = self._rebalance(node)
+            if depth == 0:
+                self.root = balanced
+            elif path[depth - 1].left is node:
+                path[depth - 1].left = balanced
+            else:
+                path[depth - 1].right = balanced
+
+
+class HashSymbolIndex:
+    """
+    /********************************************************************
+    ***  CLASS  : HashSymbolIndex                                       ***
+    *********************************************************************
+    ***  DESCRIPTION : Storage backend that keeps SymbolData objects    ***
+    ***  in a dict keyed by packed name, so lookups stay O(1) no matter ***
+    ***  in which order labels are defined. The alphabetical listing    ***
+    ***  needed by view() and __str__ is sorted on first use and        ***
+    ***  cached until the next insert, remove, or clear.                ***
+    ********************************************************************/
+    """
+
+    def __init__(self):
+        self.symbols = {}
+        self._sorted_cache = None
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def find(self, key):
+        """
+        Returns the SymbolData stored under the packed `key`, or None.
+        """
+        return self.symbols.get(key)
+
+    def add(self, symbol_data):
+        """
+        Inserts `symbol_data` unless its name is already present.
+
+        :return: The existing SymbolData on a duplicate, otherwise None.
+        """
+        existing = self.symbols.setdefault(symbol_data.key, symbol_data)
+        if existing is not symbol_data:
+            return existing
+        self._sorted_cache = None
+        return None
+
+    def remove(self, key):
+        """
+        Removes the symbol stored under `key` from the index.
+
+        :return: True if the symbol was present.
+        """
+        if self.symbols.pop(key, None) is None:
+            return False
+        self._sorted_cache = None
+        return True
+
+    def find_many(self, keys):
+        """
+        Looks up a batch of packed keys with one dict probe each.
+
+        :param keys: Set of packed keys.
+        :return: Dict mapping each found key to its SymbolData.
+        """
+        symbols = self.symbols
+        return {key: symbols[key] for key in keys if key in symbols}
+
+    def _sorted_keys(self):
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(self.symbols)
+        return self._sorted_cache
+
+    def sorted_symbols(self):
+        """
+        Returns every SymbolData in alphabetical order, sorting only when
+        the table changed since the last call.
+        """
+        return [self.symbols[key] for key in self._sorted_keys()]
+
+    def symbols_between(self, low, high):
+        """
+        Returns the SymbolData whose packed keys fall between `low` and
+        `high` inclusive, in alphabetical order.
+        """
+        keys = self._sorted_keys()
+        first = bisect.bisect_left(keys, low)
+        last = bisect.bisect_right(keys, high)
+        return [self.symbols[key] for key in keys[first:last]]
+
+    def build(self, sorted_symbols):
+        """
+        Replaces the index with `sorted_symbols`, which must be sorted by
+        name with no duplicates; the order doubles as the sorted view.
+        """
+        self.symbols = {symbol_data.key: symbol_data for symbol_data in sorted_symbols}
+        self._sorted_cache = list(self.symbols)
+
+    def clear(self):
+        self.symbols.clear()
+        self._sorted_cache = None
+
+
+class SymbolColumns:
+    """
+    /********************************************************************
+    ***  CLASS  : SymbolColumns                                         ***
+    *********************************************************************
+    ***  DESCRIPTION : Column store for symbol fields. Slot n of each   ***
+    ***  parallel array holds one field of the n-th stored symbol:      ***
+    ***  packed name key, value and address as 32-bit integers, and     ***
+    ***  the rflag/iflag/mflag bits in one flags byte. Values that are  ***
+    ***  None or do not fit in 32 bits are flagged, and the rare        ***
+    ***  oversized ones are kept in a side dict.                        ***
+    ********************************************************************/
+    """
+
+    __slots__ = ("keys", "values", "addresses", "flags", "overflow")
+
+    RFLAG, IFLAG, MFLAG = 1, 2, 4
+    NO_VALUE, NO_ADDRESS, BIG_VALUE, BIG_ADDRESS = 8, 16, 32, 64
+    _INT_MIN, _INT_MAX = -(1 << 31), (1 << 31) - 1
+
+    def __init__(self):
+        self.keys = array("I")
+        self.values = array("i")
+        self.addresses = array("i")
+        self.flags = bytearray()
+        self.overflow = {}   # (column name, slot) -> value that does not fit
+
+    def append(self, symbol_data):
+        """
+        Copies `symbol_data` into a new slot.
+
+        :return: The slot number.
+        """
+        slot = len(self.keys)
+        self.keys.append(symbol_data.key)
+        self.values.append(0)
+        self.addresses.append(0)
+        self.flags.append(((self.RFLAG if symbol_data.rflag else 0)
+                           | (self.IFLAG if symbol_data.iflag else 0)
+                           | (self.MFLAG if symbol_data.mflag else 0)))
+        self.set_number("values", slot, symbol_data.value, self.NO_VALUE, self.BIG_VALUE)
+        self.set_number("addresses", slot, symbol_data.address, self.NO_ADDRESS, self.BIG_ADDRESS)
+        return slot
+
+    def get_number(self, column, slot, none_bit, big_bit):
+        flags = self.flags[slot]
+        if flags & none_bit:
+            return None
+        if flags & big_bit:
+            return self.overflow[(column, slot)]
+        return getattr(self, column)[slot]
+
+    def set_number(self, column, slot, number, none_bit, big_bit):
+        self.flags[slot] &= ~(none_bit | big_bit)
+        self.overflow.pop((column, slot), None)
+        if number is None:
+            self.flags[slot] |= none_bit
+        elif isinstance(number, int) and self._INT_MIN <= number <= self._INT_MAX:
+            getattr(self, column)[slot] = number
+        else:
+            self.flags[slot] |= big_bit
+            self.overflow[(column, slot)] = number
+
+    def get_flag(self, slot, bit):
+        return bool(self.flags[slot] & bit)
+
+    def set_flag(self, slot, bit, enabled):
+        if enabled:
+            self.flags[slot] |= bit
+        else:
+            self.flags[slot] &= ~bit
+
+
+class SymbolView(SymbolData):
+    """
+    /********************************************************************
+    ***  CLASS  : SymbolView                                            ***
+    *********************************************************************
+    ***  DESCRIPTION : Lightweight SymbolData over one slot of a        ***
+    ***  SymbolColumns store. Reads and writes go straight to the       ***
+    ***  columns, so code that updates a looked-up symbol (e.g. MFlag   ***
+    ***  on duplicates) updates the table. A view stays bound to the    ***
+    ***  columns it was created from; rebuilding the table (bulk_load)  ***
+    ***  detaches earlier views.                                        ***
+    ********************************************************************/
+    """
+
+    __slots__ = ("_columns", "_slot")
+
+    def __init__(self, columns, slot):
+        self._columns = columns
+        self._slot = slot
+
+    def __eq__(self, other):
+        if isinstance(other, SymbolView):
+            return self._columns is other._columns and self._slot == other._slot
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._columns), self._slot))
+
+    @property
+    def key(self):
+        return self._columns.keys[self._slot]
+
+    @property
+    def symbol(self):
+        return unpack_symbol_key(self._columns.keys[self._slot])
+
+    @property
+    def value(self):
+        return self._columns.get_number("values", self._slot, SymbolColumns.NO_VALUE, SymbolColumns.BIG_VALUE)
+
+    @value.setter
+    def value(self, value):
+        self._columns.set_number("values", self._slot, value, SymbolColumns.NO_VALUE, SymbolColumns.BIG_VALUE)
+
+    @property
+    def address(self):
+        return self._columns.get_number("addresses", self._slot, SymbolColumns.NO_ADDRESS, SymbolColumns.BIG_ADDRESS)
+
+    @address.setter
+    def address(self, address):
+        self._columns.set_number("addresses", self._slot, address, SymbolColumns.NO_ADDRESS, SymbolColumns.BIG_ADDRESS)
+
+    @property
+    def rflag(self):
+        return self._columns.get_flag(self._slot, SymbolColumns.RFLAG)
+
+    @rflag.setter
+    def rflag(self, enabled):
+        self._columns.set_flag(self._slot, SymbolColumns.RFLAG, enabled)
+
+    @property
+    def iflag(self):
+        return self._columns.get_flag(self._slot, SymbolColumns.IFLAG)
+
+    @iflag.setter
+    def iflag(self, enabled):
+        self._columns.set_flag(self._slot, SymbolColumns.IFLAG, enabled)
+
+    @property
+    def mflag(self):
+        return self._columns.get_flag(self._slot, SymbolColumns.MFLAG)
+
+    @mflag.setter
+    def mflag(self, enabled):
+        self._columns.set_flag(self._slot, SymbolColumns.MFLAG, enabled)
+
+
+class ColumnarSymbolIndex:
+    """
+    /********************************************************************
+    ***  CLASS  : ColumnarSymbolIndex                                   ***
+    *********************************************************************
+    ***  DESCRIPTION : Storage backend for very large tables. Symbols   ***
+    ***  live in a SymbolColumns store and a dict maps each packed key  ***
+    ***  to its slot, so a symbol costs a few bytes of array space plus ***
+    ***  one dict entry instead of a SymbolData object and a tree node. ***
+    ***  Lookups hand out SymbolView objects. Removed slots are reused. ***
+    ********************************************************************/
+    """
+
+    def __init__(self):
+        self.columns = SymbolColumns()
+        self.slots = {}
+        self.free_slots = []
+        self._sorted_cache = None
+
+    def __len__(self):
+        return len(self.slots)
+
+    def _view(self, slot):
+        return SymbolView(self.columns, slot)
+
+    def find(self, key):
+        """
+        Returns a view of the symbol stored under the packed `key`, or None.
+        """
+        slot = self.slots.get(key)
+        return None if slot is None else self._view(slot)
+
+    def add(self, symbol_data):
+        """
+        Copies `symbol_data` into the columns unless its name is already present.
+
+        :return: A view of the existing symbol on a duplicate, otherwise None.
+        """
+        slot = self.slots.get(symbol_data.key)
+        if slot is not None:
+            return self._view(slot)
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            columns = self.columns
+            columns.keys[slot] = symbol_data.key
+            columns.flags[slot] = 0
+            view = self._view(slot)
+            view.rflag, view.iflag, view.mflag = symbol_data.rflag, symbol_data.iflag, symbol_data.mflag
+            view.value, view.address = symbol_data.value, symbol_data.address
+        else:
+            slot = self.columns.append(symbol_data)
+        self.slots[symbol_data.key] = slot
+        self._sorted_cache = None
+        return None
+
+    def remove(self, key):
+        """
+        Removes the symbol stored under `key`; its slot is recycled by a later add.
+
+        :return: True if the symbol was present.
+        """
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return False
+        # The slot keeps its fields until it is reused, so a view taken
+        # just before removal can still be read (e.g. to unindex its address).
+        self.free_slots.append(slot)
+        self._sorted_cache = None
+        return True
+
+    def find_many(self, keys):
+        """
+        Looks up a batch of packed keys with one dict probe each.
+
+        :param keys: Set of packed keys.
+        :return: Dict mapping each found key to a SymbolView.
+        """
+        slots = self.slots
+        return {key: self._view(slots[key]) for key in keys if key in slots}
+
+    def _sorted_keys(self):
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(self.slots)
+        return self._sorted_cache
+
+    def sorted_symbols(self):
+        """
+        Returns views of every symbol in alphabetical order.
+        """
+        return [self._view(self.slots[key]) for key in self._sorted_keys()]
+
+    def symbols_between(self, low, high):
+        """
+        Returns views of the symbols whose packed keys fall between `low`
+        and `high` inclusive, in alphabetical order.
+        """
+        keys = self._sorted_keys()
+        first = bisect.bisect_left(keys, low)
+        last = bisect.bisect_right(keys, high)
+        return [self._view(self.slots[key]) for key in keys[first:last]]
+
+    def build(self, sorted_symbols):
+        """
+        Replaces the store with `sorted_symbols`, which must be sorted by
+        name with no duplicates. The new columns are filled before the old
+        ones are dropped, since the input may be views of the old store.
+        """
+        columns = SymbolColumns()
+        slots = {}
+        for symbol_data in sorted_symbols:
+            slots[symbol_data.key] = columns.append(symbol_data)
+        self.columns = columns
+        self.slots = slots
+        self.free_slots = []
+        self._sorted_cache = list(slots)
+
+    def clear(self):
+        self.build([])
+
+
+class StripedSymbolIndex:
+    """
+    /********************************************************************
+    ***  CLASS  : StripedSymbolIndex                                    ***
+    *********************************************************************
+    ***  DESCRIPTION : Thread-safe storage backend. Symbols are spread  ***
+    ***  over a fixed number of dicts (stripes), each guarded by its    ***
+    ***  own lock, so writers to different stripes do not wait on each ***
+    ***  other. Lookups take no lock: a single dict read is atomic, and ***
+    ***  whole-table views copy each stripe before reading it.          ***
+    ********************************************************************/
+    """
+
+    STRIPES = 16
+
+    def __init__(self, stripes=None):
+        count = stripes or self.STRIPES
+        self.locks = [threading.RLock() for _ in range(count)]
+        self.stripes = [{} for _ in range(count)]
+
+    def __len__(self):
+        return sum(len(stripe) for stripe in self.stripes)
+
+    def _stripe(self, key):
+        # Short names leave the low bytes zero, so mix the key before picking a stripe.
+        return ((key * 0x9E3779B1) >> 16) % len(self.locks)
+
+    def lock_for(self, key):
+        """
+        Returns the lock that guards the stripe holding `key`.
+        """
+        return self.locks[self._stripe(key)]
+
+    def all_locks(self):
+        """
+        Returns a context manager that holds every stripe lock, acquired
+        in stripe order so it cannot deadlock with another caller.
+        """
+        stack = ExitStack()
+        for lock in self.locks:
+            stack.enter_context(lock)
+        return stack
+
+    def find(self, key):
+        """
+        Returns the SymbolData stored under the packed `key`, or None.
+        """
+        return self.stripes[self._stripe(key)].get(key)
+
+    def add(self, symbol_data):
+        """
+        Inserts `symbol_data` unless its name is already present.
+
+        :return: The existing SymbolData on a duplicate, otherwise None.
+        """
+        index = self._stripe(symbol_data.key)
+        with self.locks[index]:
+            existing = self.stripes[index].setdefault(symbol_data.key, symbol_data)
+        return existing if existing is not symbol_data else None
+
+    def replace(self, symbol_data):
+        """
+        Stores `symbol_data` under its key, replacing any existing entry.
+
+        :return: The replaced SymbolData, or None.
+        """
+        index = self._stripe(symbol_data.key)
+        with self.locks[index]:
+            previous = self.stripes[index].get(symbol_data.key)
+            self.stripes[index][symbol_data.key] = symbol_data
+        return previous
+
+    def pop(self, key):
+        """
+        Removes the symbol stored under `key`.
+
+        :return: The removed SymbolData, or None.
+        """
+        index = self._stripe(key)
+        with self.locks[index]:
+            return self.stripes[index].pop(key, None)
+
+    def remove(self, key):
+        """
+        Removes the symbol stored under `key` from the index.
+
+        :return: True if the symbol was present.
+        """
+        return self.pop(key) is not None
+
+    def find_many(self, keys):
+        """
+        Looks up a batch of packed keys with one dict probe each.
+
+        :param keys: Set of packed keys.
+        :return: Dict mapping each found key to its SymbolData.
+        """
+        matches = {}
+        for key in keys:
+            symbol_data = self.find(key)
+            if symbol_data is not None:
+                matches[key] = symbol_data
+        return matches
+
+    def _items(self):
+        items = []
+        for stripe in self.stripes:
+            items.extend(stripe.copy().items())
+        items.sort(key=lambda item: item[0])
+        return items
+
+    def sorted_symbols(self):
+        """
+        Returns every SymbolData in alphabetical order.
+        """
+        return [symbol_data for _, symbol_data in self._items()]
+
+    def symbols_between(self, low, high):
+        """
+        Returns the SymbolData whose packed keys fall between `low` and
+        `high` inclusive, in alphabetical order.
+        """
+        return [symbol_data for key, symbol_data in self._items() if low <= key <= high]
+
+    def build(self, sorted_symbols):
+        """
+        Replaces the index with `sorted_symbols` (sorted, no duplicates).
+        """
+        stripes = [{} for _ in self.locks]
+        for symbol_data in sorted_symbols:
+            stripes[self._stripe(symbol_data.key)][symbol_data.key] = symbol_data
+        with self.all_locks():
+            self.stripes = stripes
+
+    def clear(self):
+        self.build([])
+
+
 class SymbolTable:
     """
     /********************************************************************
@@ -153,27 +1013,86 @@ class SymbolTable:
     ***  ASSIGNMENT : Assignment 1 - Symbol Table Manager               ***
     ***  DUE DATE : September 18, 2024                                  ***
     *********************************************************************
-    ***  DESCRIPTION : This class implements a Binary Search Tree       ***
-    ***  (BST) for managing symbols in a symbol table. It provides      ***
-    ***  methods to insert, search, view, remove, and destroy symbols.  ***
+    ***  DESCRIPTION : This class manages the symbols of a program.     ***
+    ***  It provides methods to insert, search, view, remove, and       ***
+    ***  destroy symbols. Storage is delegated to a backend index       ***
+    ***  chosen at construction time (see BACKENDS); the default is a   ***
+    ***  balanced AVL tree, which also answers range queries by name.   ***
     ********************************************************************/
     """
 
-    def __init__(self, logger=None):
+    BACKENDS = {
+        "avl": AVLSymbolIndex,
+        "hash": HashSymbolIndex,
+        "bst": BSTSymbolIndex,
+        "columnar": ColumnarSymbolIndex,
+        "striped": StripedSymbolIndex,
+    }
+    DEFAULT_BACKEND = "avl"
+
+    def __init__(self, logger=None, backend=None):
         """
         /********************************************************************
         ***  FUNCTION : __init__                                            ***
         ***  CLASS  : SymbolTable                                           ***
         *********************************************************************
-        ***  DESCRIPTION : Initializes the SymbolTable class by setting     ***
-        ***  the root of the tree to None, representing an empty symbol     ***
-        ***  table.                                                         ***
+        ***  DESCRIPTION : Initializes an empty symbol table backed by the  ***
+        ***  requested storage index.                                       ***
+        ***                                                                 ***
+        ***  INPUTS :                                                       ***
+        ***    - logger (ErrorLogHandler, optional): Shared logger.         ***
+        ***    - backend (str, optional): Key of BACKENDS; defaults to      ***
+        ***      DEFAULT_BACKEND.                                           ***
         ********************************************************************/
         """
-        self.root = None
         self.logger = logger or ErrorLogHandler()
+        self.backend = backend or self.DEFAULT_BACKEND
+        if self.backend not in self.BACKENDS:
+            _error = f"Unknown symbol table backend '{self.backend}'."
+            self.logger.log_error(_error)
+            raise ValueError(_error)
+        self.index = self.BACKENDS[self.backend]()
+        # Reverse index: sorted (address, packed key) pairs for relocatable symbols.
+        self.address_index = []
+        # Bumped after every change that adds, replaces or drops a stored SymbolData,
+        # so holders of bound symbols (e.g. compiled expressions) know to look again.
+        self.generation = 0
         self.str_header = (f"{'Symbol':<10} {'Value':<10} {'RFlag':<6} {'IFlag':<6} {'MFlag':<6}")
-    
+
+    @property
+    def root(self):
+        """
+        Root node of tree-backed tables; None for the hash backend.
+        """
+        return getattr(self.index, "root", None)
+
+    def size(self):
+        """
+        Returns the number of symbols in the table. (SymbolTable has no
+        __len__ so that an empty table stays truthy for `table or default`.)
+        """
+        return len(self.index)
+
+    def __contains__(self, symbol):
+        return self.index.find(normalize_symbol(symbol)[0]) is not None
+
+    def __iter__(self):
+        return iter(self.sorted_symbols())
+
+    def sorted_symbols(self):
+        """
+        Returns every SymbolData in the table in alphabetical order.
+        """
+        return self.index.sorted_symbols()
+
+    def symbols_between(self, low, high):
+        """
+        Returns the symbols whose names fall between `low` and `high`
+        inclusive (compared as 4-character uppercase names), in
+        alphabetical order.
+        """
+        return self.index.symbols_between(normalize_symbol(low)[0], normalize_symbol(high)[0])
+
     def __str__(self):
         """
         /********************************************************************
@@ -184,54 +1103,31 @@ class SymbolTable:
         ***  table, displaying all symbols in sorted order.                 ***
         ********************************************************************/
         """
-        if self.root is None:
+        if len(self.index) == 0:
             return "Symbol table is empty."
-        
+
         divider = "_" * 46
-        symbols = []
-        self._collect_symbols(self.root, symbols)
         result = [f"\n{divider}\nSymbol Table:\n{divider}"]
         result.append(self.str_header)
         result.append(f"{divider}")
-    
-        
-        for sym in symbols:
+
+
+        for sym in self.sorted_symbols():
             hex_address = format(sym.value, '05X') if sym.value is not None else "None"
             result.append(f"{sym.symbol:<10} {hex_address:<10} {int(sym.rflag):<6} {int(sym.iflag):<6} {int(sym.mflag):<6}")
-        
+
         result.append(f"{divider}\n")
         return "\n".join(result)
 
-    def _collect_symbols(self, node, symbols):
-        """
-        /********************************************************************
-        ***  FUNCTION : _collect_symbols                                    ***
-        ***  CLASS  : SymbolTable                                           ***
-        *********************************************************************
-        ***  DESCRIPTION : Helper method to collect all symbols in the      ***
-        ***  binary search tree using in-order traversal.                   ***
-        ***                                                                 ***
-        ***  INPUTS :                                                       ***
-        ***    - node (SymbolNode): Current node in the tree.               ***
-        ***    - symbols (list): List to collect symbols.                   ***
-        ********************************************************************/
-        """
-        if node is not None:
-            self._collect_symbols(node.left, symbols)
-            symbols.append(node.symbol_data)
-            self._collect_symbols(node.right, symbols)
-        
-
     def insert(self, symbol_data):
         """
         /********************************************************************
         ***  FUNCTION : insert                                              ***
         ***  CLASS  : SymbolTable                                           ***
         *********************************************************************
-        ***  DESCRIPTION : Inserts a new symbol into the binary search      ***
-        ***  tree. If the tree is empty, the symbol becomes the root.       ***
-        ***  Otherwise, the _insert method is called to place the symbol    ***
-        ***  in the correct position.                                       ***
+        ***  DESCRIPTION : Inserts a new symbol into the table. If the      ***
+        ***  symbol already exists, the stored entry's mflag is set to      ***
+        ***  True, indicating a duplicate, and the new entry is dropped.    ***
         ***                                                                 ***
         ***  INPUTS :                                                       ***
         ***    - symbol_data (SymbolData): The symbol to be inserted.       ***
@@ -242,58 +1138,150 @@ class SymbolTable:
             self.logger.log_error(_error)
             raise TypeError(_error)
 
-        if self.root is None:
-            self.root = SymbolNode(symbol_data)
+        was_empty = len(self.index) == 0
+        existing = self.index.add(symbol_data)
+        if existing is not None:
+            existing.mflag = True
+            self.logger.log_action(f"Duplicate symbol '{symbol_data.symbol}' found. MFlag set to True.")
+            return
+        self._index_address(symbol_data)
+        self._changed()
+        if was_empty:
             self.logger.log_action(f"New symbol table created. Symbol '{symbol_data.symbol}' inserted.")
         else:
-            self._insert(self.root, symbol_data)
+            self.logger.log_action(f"Symbol '{symbol_data.symbol}' inserted.")
 
-    
-    def _insert(self, current_node, symbol_data):
+    def _changed(self):
+        """
+        Marks the table as changed by advancing its generation.
+        """
+        self.generation += 1
+
+    @staticmethod
+    def _is_address(symbol_data):
+        """
+        Only relocatable symbols name addresses; absolute constants (RFlag
+        false, e.g. EQU values) stay out of the reverse index.
+        """
+        return symbol_data.rflag and isinstance(symbol_data.value, int)
+
+    def _index_address(self, symbol_data):
+        if self._is_address(symbol_data):
+            bisect.insort(self.address_index, (symbol_data.value, symbol_data.key))
+
+    def _unindex_address(self, symbol_data):
+        if self._is_address(symbol_data):
+            entry = (symbol_data.value, symbol_data.key)
+            position = bisect.bisect_left(self.address_index, entry)
+            if position < len(self.address_index) and self.address_index[position] == entry:
+                del self.address_index[position]
+
+    def symbol_at(self, address):
         """
         /********************************************************************
-        ***  FUNCTION : _insert                                             ***
+        ***  FUNCTION : symbol_at                                           ***
         ***  CLASS  : SymbolTable                                           ***
         *********************************************************************
-        ***  DESCRIPTION : Recursively inserts symbol_data into the BST.    ***
-        ***  If the symbol already exists, sets the mflag to True,          ***
-        ***  indicating a duplicate. Otherwise, places the symbol in the    ***
-        ***  appropriate left or right subtree.                             ***
+        ***  DESCRIPTION : Returns the relocatable symbol that covers       ***
+        ***  `address`, i.e. the one with the highest address not above it. ***
+        ***  When several labels share that address the alphabetically     ***
+        ***  first one is returned.                                         ***
         ***                                                                 ***
         ***  INPUTS :                                                       ***
-        ***    - current_node (SymbolNode): Current node in the tree.       ***
-        ***    - symbol_data (SymbolData): Symbol data to be inserted.      ***
+        ***    - address (int): The address to look up.                     ***
+        ***  RETURNS :                                                      ***
+        ***    - (SymbolData or None): None if no label precedes address.   ***
         ********************************************************************/
         """
-        # Set MFlag to true if there's a duplicate
-        if symbol_data.symbol == current_node.symbol_data.symbol:
-            current_node.symbol_data.mflag = True
-            self.logger.log_action(f"Duplicate symbol '{symbol_data.symbol}' found. MFlag set to True.")
-        # Insert into left subtree
-        elif symbol_data.symbol < current_node.symbol_data.symbol:
-            if current_node.left is None:
-                current_node.left = SymbolNode(symbol_data)
-                self.logger.log_action(f"Symbol '{symbol_data.symbol}' inserted.")
-            else:
-                self._insert(current_node.left, symbol_data)
-        # Insert into right subtree
-        else:
-            if current_node.right is None:
-                current_node.right = SymbolNode(symbol_data)
-                self.logger.log_action(f"Symbol '{symbol_data.symbol}' inserted.")
+        address_index = self.address_index
+        # Packed keys are below 2**32, so this sorts after every key at `address`.
+        position = bisect.bisect_right(address_index, (address, 1 << 32)) - 1
+        if position < 0:
+            return None
+        covering = address_index[position][0]
+        position = bisect.bisect_left(address_index, (covering, -1))
+        return self.index.find(address_index[position][1])
+
+    def symbols_in_range(self, low, high):
+        """
+        /********************************************************************
+        ***  FUNCTION : symbols_in_range                                    ***
+        ***  CLASS  : SymbolTable                                           ***
+        *********************************************************************
+        ***  DESCRIPTION : Returns the relocatable symbols whose addresses  ***
+        ***  fall between `low` and `high` inclusive, ordered by address    ***
+        ***  and then by name.                                              ***
+        ***                                                                 ***
+        ***  INPUTS :                                                       ***
+        ***    - low (int), high (int): The address range.                  ***
+        ***  RETURNS :                                                      ***
+        ***    - list of SymbolData.                                        ***
+        ********************************************************************/
+        """
+        address_index = self.address_index
+        first = bisect.bisect_left(address_index, (low, -1))
+        last = bisect.bisect_right(address_index, (high, 1 << 32))
+        return [self.index.find(key) for _, key in address_index[first:last]]
+
+    def bulk_load(self, symbols):
+        """
+        /********************************************************************
+        ***  FUNCTION : bulk_load                                           ***
+        ***  CLASS  : SymbolTable                                           ***
+        *********************************************************************
+        ***  DESCRIPTION : Adds many symbols at once. The new symbols are   ***
+        ***  sorted once together with the current contents (a stable      ***
+        ***  sort, so earlier entries win), duplicates are dropped with     ***
+        ***  the surviving entry's mflag set to True just as insert()       ***
+        ***  would, and the backend is rebuilt in one linear pass. Only a   ***
+        ***  single summary action is logged.                               ***
+        ***                                                                 ***
+        ***  INPUTS :                                                       ***
+        ***    - symbols (iterable of SymbolData): Symbols to add.          ***
+        ***  RETURNS :                                                      ***
+        ***    - (int, int): Symbols added and duplicates merged.           ***
+        ********************************************************************/
+        """
+        incoming = list(symbols)
+        for symbol_data in incoming:
+            if not isinstance(symbol_data, SymbolData):
+                _error = "Expected a SymbolData object."
+                self.logger.log_error(_error)
+                raise TypeError(_error)
+
+        existing_count = self.size()
+        combined = self.sorted_symbols() + incoming
+        combined.sort(key=lambda symbol_data: symbol_data.key)
+
+        unique = []
+        duplicates = 0
+        for symbol_data in combined:
+            if unique and unique[-1].key == symbol_data.key:
+                unique[-1].mflag = True
+                duplicates += 1
             else:
-                self._insert(current_node.right, symbol_data)
-    
+                unique.append(symbol_data)
+
+        self.index.build(unique)
+        self.address_index = sorted((sym.value, sym.key) for sym in unique if self._is_address(sym))
+        self._changed()
+        added = len(unique) - existing_count
+        self.logger.log_action(f"Bulk loaded {added} symbols ({duplicates} duplicates flagged).")
+        return added, duplicates
+
     def insert_or_update(self, symbol_data):
         """
         Inserts a new symbol or updates an existing symbol's value.
         """
         existing_symbol = self.search(symbol_data.symbol)
         if existing_symbol:
+            self._unindex_address(existing_symbol)
             existing_symbol.value = symbol_data.value
             existing_symbol.rflag = symbol_data.rflag
             existing_symbol.iflag = symbol_data.iflag
             existing_symbol.mflag = symbol_data.mflag
+            self._index_address(existing_symbol)
+            self._changed()
         else:
             self.insert(symbol_data)
 
@@ -305,7 +1293,7 @@ class SymbolTable:
     #         return symbol.value, symbol.rflag, None
     #     else:
     #         return None, None, f"Undefined symbol: {operand}"
-        
+
     def get(self, operand):
         # is_immediate = operand.startswith('#')
         # is_indirect = operand.startswith('@')
@@ -333,7 +1321,7 @@ class SymbolTable:
         else:
             self.logger.log_error(f"Undefined symbol: {operand}")
             return None
-    
+
     def get_rflag(self, operand):
         """
         This function returns the rflag value for a given operand.
@@ -351,9 +1339,8 @@ class SymbolTable:
         ***  FUNCTION : search                                              ***
         ***  CLASS  : SymbolTable                                           ***
         *********************************************************************
-        ***  DESCRIPTION : Searches for a symbol in the BST by calling      ***
-        ***  the _search method and returns the SymbolData if found.        ***
-        ***  If not found, prints a message indicating the symbol's absence.***
+        ***  DESCRIPTION : Searches for a symbol in the table and returns   ***
+        ***  the SymbolData if found. Logs whether the symbol was found.    ***
         ***                                                                 ***
         ***  INPUTS :                                                       ***
         ***    - symbol (str): The symbol to search for (4 chars max).      ***
@@ -361,40 +1348,116 @@ class SymbolTable:
         ***    - (SymbolData or None): Returns the symbol data if found.    ***
         ********************************************************************/
         """
-        result = self._search(self.root, symbol.upper()[:4])
+        key, name = normalize_symbol(symbol)
+        result = self.index.find(key)
         if result is None:
-            self.logger.log_action(f"Symbol '{symbol.upper()[:4]}' not found.")
+            self.logger.log_action(f"Symbol '{name}' not found.")
             return None
+        self.logger.log_action(f"Symbol '{name}' found in symbol table.")
         return result
-        # return {'value': result.value, 'rflag': result.rflag}
 
-    
-    def _search(self, current_node, symbol):
+    # Snapshot record: packed key, value, address, and the flag bits below.
+    SNAPSHOT_MAGIC = b"SYMT"
+    _SNAPSHOT_RECORD = struct.Struct(">IqqB")
+    _RFLAG, _IFLAG, _MFLAG, _NO_VALUE, _NO_ADDRESS = 1, 2, 4, 8, 16
+
+    def save_snapshot(self, file_path, source_digest=bytes(32)):
         """
         /********************************************************************
-        ***  FUNCTION : _search                                             ***
+        ***  FUNCTION : save_snapshot                                       ***
         ***  CLASS  : SymbolTable                                           ***
         *********************************************************************
-        ***  DESCRIPTION : Recursively searches the binary search tree      ***
-        ***  for a specific symbol. If found, returns the corresponding     ***
-        ***  SymbolData object; otherwise, returns None.                    ***
+        ***  DESCRIPTION : Writes the table to a versioned binary snapshot  ***
+        ***  (one fixed-size record per symbol, in sorted order) tagged     ***
+        ***  with the digest of the text it was built from.                 ***
         ***                                                                 ***
         ***  INPUTS :                                                       ***
-        ***    - current_node (SymbolNode): The current node in the tree.   ***
-        ***    - symbol (str): The symbol to search for (4 chars max).      ***
+        ***    - file_path (str): Destination path.                         ***
+        ***    - source_digest (bytes): TableSnapshot.digest_lines result.  ***
         ***  RETURNS :                                                      ***
-        ***    - (SymbolData or None): The symbol data if found, or None.   ***
+        ***    - bool: True if the snapshot was written.                    ***
         ********************************************************************/
         """
-        if current_node is None:
-            return None  # Symbol not found
-        if symbol == current_node.symbol_data.symbol:
-            self.logger.log_action(f"Symbol '{symbol}' found in symbol table.")
-            return current_node.symbol_data
-        elif symbol < current_node.symbol_data.symbol:
-            return self._search(current_node.left, symbol)
-        else:
-            return self._search(current_node.right, symbol)
+        record = self._SNAPSHOT_RECORD
+        payload = bytearray()
+        try:
+            for sym in self.sorted_symbols():
+                flags = ((self._RFLAG if sym.rflag else 0) | (self._IFLAG if sym.iflag else 0)
+                         | (self._MFLAG if sym.mflag else 0)
+                         | (self._NO_VALUE if sym.value is None else 0)
+                         | (self._NO_ADDRESS if sym.address is None else 0))
+                payload += record.pack(sym.key, sym.value or 0, sym.address or 0, flags)
+        except (struct.error, TypeError) as e:
+            self.logger.log_error(f"Cannot snapshot symbol table: {e}")
+            return False
+        return TableSnapshot(self.SNAPSHOT_MAGIC, self.logger).write(file_path, bytes(payload), source_digest)
+
+    def load_snapshot(self, file_path, source_digest=None):
+        """
+        /********************************************************************
+        ***  FUNCTION : load_snapshot                                       ***
+        ***  CLASS  : SymbolTable                                           ***
+        *********************************************************************
+        ***  DESCRIPTION : Loads symbols from a binary snapshot written by  ***
+        ***  save_snapshot. The snapshot is only used when its checksum is  ***
+        ***  intact and, if given, its source digest matches; its records   ***
+        ***  were validated when it was written and are bulk loaded as is.  ***
+        ***                                                                 ***
+        ***  INPUTS :                                                       ***
+        ***    - file_path (str): Snapshot path.                            ***
+        ***    - source_digest (bytes, optional): Required source digest.   ***
+        ***  RETURNS :                                                      ***
+        ***    - bool: True if the snapshot was loaded.                     ***
+        ********************************************************************/
+        """
+        payload = TableSnapshot(self.SNAPSHOT_MAGIC, self.logger).read(file_path, source_digest)
+        if payload is None or len(payload) % self._SNAPSHOT_RECORD.size:
+            return False
+        symbols = []
+        for key, value, address, flags in self._SNAPSHOT_RECORD.iter_unpack(payload):
+            symbols.append(SymbolData(
+                unpack_symbol_key(key),
+                None if flags & self._NO_VALUE else value,
+                bool(flags & self._RFLAG),
+                iflag=bool(flags & self._IFLAG),
+                mflag=bool(flags & self._MFLAG),
+                address=None if flags & self._NO_ADDRESS else address,
+            ))
+        self.bulk_load(symbols)
+        self.logger.log_action(f"Loaded {len(symbols)} symbols from snapshot '{file_path}'.")
+        return True
+
+    def search_many(self, symbols):
+        """
+        /********************************************************************
+        ***  FUNCTION : search_many                                         ***
+        ***  CLASS  : SymbolTable                                           ***
+        *********************************************************************
+        ***  DESCRIPTION : Looks up a batch of symbols at once. Each name   ***
+        ***  is normalized once and the backend answers the whole batch     ***
+        ***  (hash probes or a merge against the sorted tree). Unlike       ***
+        ***  search(), nothing is logged per lookup.                        ***
+        ***                                                                 ***
+        ***  INPUTS :                                                       ***
+        ***    - symbols (iterable of str): The symbols to search for.      ***
+        ***  RETURNS :                                                      ***
+        ***    - (list, list): Found SymbolData objects and the names that  ***
+        ***      were not found, each in input order.                       ***
+        ********************************************************************/
+        """
+        normalized = [normalize_symbol(symbol) for symbol in symbols]
+        matches = self.index.find_many({key for key, _ in normalized})
+
+        found = []
+        missing = []
+        for key, name in normalized:
+            symbol_data = matches.get(key)
+            if symbol_data is None:
+                missing.append(name)
+            else:
+                found.append(symbol_data)
+        self.logger.log_action(f"Batch search: {len(found)} found, {len(missing)} not found.")
+        return found, missing
 
     def view(self):
         """
@@ -402,12 +1465,12 @@ class SymbolTable:
         ***  FUNCTION : view                                                ***
         ***  CLASS  : SymbolTable                                           ***
         *********************************************************************
-        ***  DESCRIPTION : Displays all symbols in the BST in sorted order  ***
-        ***  using an in-order traversal. The method pauses every 20 lines  ***
-        ***  to prevent scrolling past entries.                             ***
+        ***  DESCRIPTION : Displays all symbols in sorted order. The        ***
+        ***  method pauses every 20 lines to prevent scrolling past         ***
+        ***  entries.                                                       ***
         ********************************************************************/
         """
-        if self.root is None:
+        if len(self.index) == 0:
             print("No symbols in the table.")
             return
         print("┏" + ("━" * 47) + "┓")
@@ -417,7 +1480,12 @@ class SymbolTable:
         print("┣" + ("━" * 11) + "┯" + ("━" * 11) + "┯" + ("━" * 7) + "┯" + ("━" * 7) + "┯" + ("━" * 7) + "┫")
         print(f"┃ {'Symbol':<10}│ {'Value':<10}│ {'RFlag':<6}│ {'IFlag':<6}│ {'MFlag':<6}┃")
         print("┣" + ("━" * 11) + "┿" + ("━" * 11) + "┿" + ("━" * 7) + "┿" + ("━" * 7) + "┿" + ("━" * 7) + "┫")
-        self.inorder_traversal(self.root, counter=0)
+        for counter, symbol_data in enumerate(self.sorted_symbols(), start=1):
+            print(f"┃ {symbol_data.symbol:<10}│ {symbol_data.value:<10}│ "
+                  f"{int(symbol_data.rflag):<6}│ {int(symbol_data.iflag):<6}│ "
+                  f"{int(symbol_data.mflag):<6}┃")
+            if counter % 20 == 0:
+                self.pressContinue()  # Pause after every 20 symbols
         print("┗" + ("━" * 11) + "┷" + ("━" * 11) + "┷" + ("━" * 7) + "┷" + ("━" * 7) + "┷" + ("━" * 7) + "┛") # end of table
 
     def pressContinue(self):
@@ -434,145 +1502,179 @@ class SymbolTable:
         input("Press Enter to continue...")
         print("\033[F\033[K", end='')
 
-    def inorder_traversal(self, node, counter):
-        """
-        /********************************************************************
-        ***  FUNCTION : inorder_traversal                                   ***
-        ***  CLASS  : SymbolTable                                           ***
-        *********************************************************************
-        ***  DESCRIPTION : Performs an in-order traversal of the BST,       ***
-        ***  printing symbols in sorted order. Pauses after every 20 lines  ***
-        ***  to prompt user input.                                          ***
-        ***                                                                 ***
-        ***  INPUTS :                                                       ***
-        ***    - node (SymbolNode): Current node in the tree.               ***
-        ***    - counter (int): Line counter to track when to pause.        ***
-        ********************************************************************/
-        """
-        if node is not None:
-            counter = self.inorder_traversal(node.left, counter)
-            print(f"┃ {node.symbol_data.symbol:<10}│ {node.symbol_data.value:<10}│ "
-                  f"{int(node.symbol_data.rflag):<6}│ {int(node.symbol_data.iflag):<6}│ "
-                  f"{int(node.symbol_data.mflag):<6}┃")
-            counter += 1
-            if counter % 20 == 0:
-                self.pressContinue()  # Pause after every 20 symbols
-            counter = self.inorder_traversal(node.right, counter)
-        return counter
-    
     def remove_symbol(self, symbol):
         """
         /********************************************************************
         ***  FUNCTION : remove_symbol                                       ***
         ***  CLASS  : SymbolTable                                           ***
         *********************************************************************
-        ***  DESCRIPTION : Removes a symbol from the binary search tree.    ***
-        ***  If the symbol does not exist in the tree, a message is         ***
-        ***  printed. Calls the _remove method internally.                  ***
+        ***  DESCRIPTION : Removes a symbol from the table. If the symbol   ***
+        ***  does not exist in the table, a message is printed.             ***
         ***                                                                 ***
         ***  INPUTS :                                                       ***
         ***    - symbol (str): The symbol to be removed.                    ***
         ********************************************************************/
         """
-        if self.root is None:
+        if len(self.index) == 0:
             self.logger.log_error("Symbol table is empty.")
             return
-        
-        self.root, removed = self._remove(self.root, symbol.upper()[:4])
-        if removed:
-            self.logger.log_action(f"Symbol '{symbol.upper()[:4]}' removed.")
-        else:
-            print(f"Symbol '{symbol.upper()[:4]}' not found.")
-            self.logger.log_error(f"Symbol '{symbol.upper()[:4]}' not found.")
 
-
-    def _remove(self, node, symbol):
-        """
-        /********************************************************************
-        ***  FUNCTION : _remove                                             ***
-        ***  CLASS  : SymbolTable                                           ***
-        *********************************************************************
-        ***  DESCRIPTION : Recursively removes a symbol from the BST.       ***
-        ***  Handles cases with no children, one child, or two children,    ***
-        ***  replacing nodes as necessary.                                  ***
-        ***                                                                 ***
-        ***  INPUTS :                                                       ***
-        ***    - node (SymbolNode): Current node in the tree.               ***
-        ***    - symbol (str): The symbol to remove (4 chars max).          ***
-        ***  RETURNS :                                                      ***
-        ***    - (SymbolNode, bool): Updated node and whether symbol        ***
-        ***      was removed.                                               ***
-        ********************************************************************/
-        """
-        if node is None:
-            return None, False
-        if symbol < node.symbol_data.symbol:
-            node.left, removed = self._remove(node.left, symbol)
-        elif symbol > node.symbol_data.symbol:
-            node.right, removed = self._remove(node.right, symbol)
+        key, name = normalize_symbol(symbol)
+        symbol_data = self.index.find(key)
+        if symbol_data is not None and self.index.remove(key):
+            self._unindex_address(symbol_data)
+            self._changed()
+            self.logger.log_action(f"Symbol '{name}' removed.")
         else:
-            # Node to be removed found
-            if node.left is None:
-                return node.right, True
-            elif node.right is None:
-                return node.left, True
-            else:
-                # Node with two children
-                temp_node = self.find_min(node.right)
-                node.symbol_data = temp_node.symbol_data
-                node.right, _ = self._remove(node.right, temp_node.symbol_data.symbol)
-            return node, True
-        return node, removed
-        
+            print(f"Symbol '{name}' not found.")
+            self.logger.log_error(f"Symbol '{name}' not found.")
+
     def destroy(self):
         """
         /********************************************************************
         ***  FUNCTION : destroy                                             ***
         ***  CLASS  : SymbolTable                                           ***
         *********************************************************************
-        ***  DESCRIPTION : Destroys the symbol table by setting the root    ***
-        ***  to None, effectively removing all symbols from the tree.       ***
+        ***  DESCRIPTION : Destroys the symbol table, removing all symbols  ***
+        ***  from the backend index.                                        ***
         ********************************************************************/
         """
-        if self.root is None:
+        if len(self.index) == 0:
             self.logger.log_error("Symbol table is already empty.")
         else:
-            self._destroy()
+            self.index.clear()
+            self.address_index = []
+            self._changed()
             self.logger.log_action("Symbol Table Destroyed.")
-            
-    def _destroy(self):
-        """
-        /********************************************************************
-        ***  FUNCTION : _destroy                                            ***
-        ***  CLASS  : SymbolTable                                           ***
-        *********************************************************************
-        ***  DESCRIPTION : Recursively destroys the symbol table by         ***
-        ***  traversing through all nodes and deleting them. Sets the       ***
-        ***  root of the tree to None when completed.                       ***
-        ********************************************************************/
-        """
-        if self.root is not None:
-            self._destroy_nodes(self.root)
-            self.root = None
-            
-    def _destroy_nodes(self, node):
+
+
+class ConcurrentSymbolTable(SymbolTable):
+    """
+    /********************************************************************
+    ***  CLASS  : ConcurrentSymbolTable                                 ***
+    *********************************************************************
+    ***  DESCRIPTION : SymbolTable that can be shared between threads,  ***
+    ***  e.g. a table of external or EQU symbols used while several     ***
+    ***  sources are assembled at once. Storage is a StripedSymbolIndex.***
+    ***  Writers hold the stripe lock of the symbol they change, so the ***
+    ***  duplicate check and the MFlag update happen together. Readers  ***
+    ***  (search, get, symbol_at, ...) take no lock.                    ***
+    ***                                                                 ***
+    ***  Stored SymbolData objects are never modified in place, except  ***
+    ***  for setting MFlag. insert_or_update publishes a new record     ***
+    ***  instead. The address reverse index is copied on every change,  ***
+    ***  so a reader always sees a complete list.                       ***
+    ********************************************************************/
+    """
+
+    def __init__(self, logger=None, stripes=None):
         """
         /********************************************************************
-        ***  FUNCTION : _destroy_nodes                                      ***
-        ***  CLASS  : SymbolTable                                           ***
+        ***  FUNCTION : __init__                                            ***
+        ***  CLASS  : ConcurrentSymbolTable                                 ***
         *********************************************************************
-        ***  DESCRIPTION : Recursively deletes all nodes in the tree.       ***
-        ***  Used as part of the table destruction process.                 ***
+        ***  DESCRIPTION : Initializes an empty table.                      ***
         ***                                                                 ***
         ***  INPUTS :                                                       ***
-        ***    - node (SymbolNode): The current node being destroyed.       ***
+        ***    - logger (ErrorLogHandler, optional): Shared logger.         ***
+        ***    - stripes (int, optional): Number of lock stripes.           ***
         ********************************************************************/
         """
-        if node is not None:
-            self._destroy_nodes(node.left)
-            self._destroy_nodes(node.right)
-            del node
+        super().__init__(logger, backend="striped")
+        self.index = StripedSymbolIndex(stripes)
+        self.address_lock = threading.Lock()
+        self.generation_lock = threading.Lock()
+
+    def _changed(self):
+        with self.generation_lock:
+            self.generation += 1
+
+    def _index_address(self, symbol_data):
+        if self._is_address(symbol_data):
+            with self.address_lock:
+                address_index = list(self.address_index)
+                bisect.insort(address_index, (symbol_data.value, symbol_data.key))
+                self.address_index = address_index
+
+    def _unindex_address(self, symbol_data):
+        if self._is_address(symbol_data):
+            with self.address_lock:
+                address_index = list(self.address_index)
+                entry = (symbol_data.value, symbol_data.key)
+                position = bisect.bisect_left(address_index, entry)
+                if position < len(address_index) and address_index[position] == entry:
+                    del address_index[position]
+                    self.address_index = address_index
+
+    def insert(self, symbol_data):
+        """
+        Inserts a new symbol; on a duplicate the stored entry's MFlag is set.
+        Safe to call from several threads.
+        """
+        if not isinstance(symbol_data, SymbolData):
+            _error = "Expected a SymbolData object."
+            self.logger.log_error(_error)
+            raise TypeError(_error)
+
+        with self.index.lock_for(symbol_data.key):
+            existing = self.index.add(symbol_data)
+            if existing is not None:
+                existing.mflag = True
+            else:
+                self._index_address(symbol_data)
+                self._changed()
+        if existing is not None:
+            self.logger.log_action(f"Duplicate symbol '{symbol_data.symbol}' found. MFlag set to True.")
+        else:
+            self.logger.log_action(f"Symbol '{symbol_data.symbol}' inserted.")
+
+    def insert_or_update(self, symbol_data):
+        """
+        Inserts a new symbol or replaces an existing symbol's value and
+        flags with a new record, so readers never see a half-updated entry.
+        """
+        with self.index.lock_for(symbol_data.key):
+            existing = self.index.find(symbol_data.key)
+            if existing is None:
+                self.insert(symbol_data)
+                return
+            updated = SymbolData(existing.symbol, symbol_data.value, symbol_data.rflag,
+                                 symbol_data.iflag, symbol_data.mflag, existing.address)
+            self.index.replace(updated)
+            self._unindex_address(existing)
+            self._index_address(updated)
+            self._changed()
+
+    def remove_symbol(self, symbol):
+        """
+        Removes a symbol from the table, printing a message if it is missing.
+        """
+        key, name = normalize_symbol(symbol)
+        with self.index.lock_for(key):
+            symbol_data = self.index.pop(key)
+            if symbol_data is not None:
+                self._unindex_address(symbol_data)
+                self._changed()
+        if symbol_data is not None:
+            self.logger.log_action(f"Symbol '{name}' removed.")
+        else:
+            print(f"Symbol '{name}' not found.")
+            self.logger.log_error(f"Symbol '{name}' not found.")
+
+    def bulk_load(self, symbols):
+        """
+        Same as SymbolTable.bulk_load, holding every stripe lock while the
+        index is rebuilt.
+        """
+        with self.index.all_locks(), self.address_lock:
+            return super().bulk_load(symbols)
 
+    def destroy(self):
+        """
+        Removes every symbol from the table.
+        """
+        with self.index.all_locks(), self.address_lock:
+            super().destroy()
 
 
 class Validator:
@@ -764,6 +1866,65 @@ class Validator:
             return f"{symbol_validation} in line: '{line}'"
 
 
+def split_syms_chunks(file_path, chunk_bytes):
+    """
+    Splits a SYMS.DAT file into byte ranges of roughly `chunk_bytes` each.
+    Every range ends just after a newline (or at end of file), so no line
+    is cut in two and UTF-8 characters stay whole.
+
+    :param file_path: Path to the SYMS.DAT file.
+    :param chunk_bytes: Target chunk size in bytes.
+    :return: List of (start, end) byte offsets covering the whole file.
+    """
+    size = os.path.getsize(file_path)
+    chunks = []
+    start = 0
+    with open(file_path, "rb") as file:
+        while start < size:
+            file.seek(min(start + chunk_bytes, size))
+            file.readline()
+            end = min(file.tell(), size)
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def validate_syms_chunk(file_path, start, end):
+    """
+    Reads bytes `start`..`end` of a SYMS.DAT file and validates each line.
+    Lines are cleaned the same way FileExplorer.read_file does (comments
+    and blank lines dropped), so positions match the sequential path. Runs
+    in a worker process, so it returns plain tuples instead of objects.
+
+    :param file_path: Path to the SYMS.DAT file.
+    :param start: First byte of the chunk.
+    :param end: Byte just past the chunk.
+    :return: (line count, [(index, (symbol, value, rflag)) ...],
+             [(index, line, reason) ...]) where index counts the cleaned
+             lines of this chunk from 0.
+    """
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    explorer = FileExplorer()
+    validator = Validator()
+    symbols = []
+    errors = []
+    count = 0
+    for raw_line in io.TextIOWrapper(io.BytesIO(data), encoding="utf-8"):
+        line = explorer.read_line_from_file(raw_line)
+        if not line:
+            continue
+        validation_result = validator.validate_syms_line(line)
+        if isinstance(validation_result, SymbolData):
+            symbols.append((count, (validation_result.symbol, validation_result.value, validation_result.rflag)))
+        else:
+            errors.append((count, line, validation_result))
+        count += 1
+    return count, symbols, errors
+
+
 class SymbolTableDriver:
     """
     /**********************************************************************
@@ -790,6 +1951,10 @@ class SymbolTableDriver:
         self.validator = validator or Validator()
         self.logger = logger or ErrorLogHandler()
 
+    # SYMS.DAT files at least this large are validated in a process pool.
+    PARALLEL_SYMS_BYTES = 1 << 20
+    SYMS_CHUNK_BYTES = 256 * 1024
+
 
     def process_syms_file(self, file_path):
         """
@@ -807,33 +1972,126 @@ class SymbolTableDriver:
         """
         try:
             print(f"\nProcessing SYMS.DAT for symbol insertion...\n")
-            lines = self.file_explorer.process_file("SYMS.DAT")
+            syms_path = self.file_explorer.find_file("SYMS.DAT")
+            if syms_path is not None and os.path.getsize(syms_path) >= self.PARALLEL_SYMS_BYTES:
+                self.load_syms_file_parallel(syms_path)
+                return
+
+            lines = None
+            if syms_path is not None:
+                lines = self.file_explorer.read_file(self.file_explorer.open_file(syms_path))
             if lines is None:
                 print(f"Error: Unable to read {file_path}.")
                 return
 
-            valid_count = 0
-            invalid_count = 0
+            self.load_syms_lines(lines)
 
-            for line_num, line in enumerate(lines, start=1):
-                validation_result = self.validator.validate_syms_line(line)
-                if isinstance(validation_result, SymbolData):
-                    self.symbol_table.insert(validation_result)
-                    valid_count += 1
-                    print(f"- Symbol '{validation_result.symbol}' Inserted")
-                else:
-                    print(f"\nError in Line {line_num}: '{line}'")
-                    print(f"  Reason: {validation_result}")
-                    invalid_count += 1
-
-            print(f"\nSummary:")
-            print(f"- {valid_count} valid symbols inserted")
-            print(f"- {invalid_count} invalid lines encountered")
-        
         except Exception as e:
             print(f"An error occurred while processing the SYMS file: {e}")
 
 
+    def load_syms_lines(self, lines):
+        """
+        /**********************************************************************
+        ***  FUNCTION : load_syms_lines                                     ***
+        ***  CLASS  : SymbolTableDriver                                     ***
+        ***********************************************************************
+        ***  DESCRIPTION : Validates every SYMS.DAT line, bulk loads the    ***
+        ***  valid symbols into the symbol table in one pass, and prints a  ***
+        ***  summary instead of one line per insert. Invalid lines are      ***
+        ***  still listed with their line numbers.                          ***
+        ***                                                                 ***
+        ***  INPUTS :                                                       ***
+        ***    - lines (iterable of str): The SYMS.DAT lines.               ***
+        ***  RETURNS :                                                      ***
+        ***    - (int, int, int): Symbols inserted, duplicates flagged, and ***
+        ***      invalid lines encountered.                                 ***
+        **********************************************************************/
+        """
+        valid_symbols = []
+        errors = []
+        for line_num, line in enumerate(lines, start=1):
+            validation_result = self.validator.validate_syms_line(line)
+            if isinstance(validation_result, SymbolData):
+                valid_symbols.append(validation_result)
+            else:
+                errors.append((line_num, line, validation_result))
+
+        return self.report_syms_load(valid_symbols, errors)
+
+    def load_syms_file_parallel(self, file_path, max_workers=None, chunk_bytes=None):
+        """
+        /**********************************************************************
+        ***  FUNCTION : load_syms_file_parallel                             ***
+        ***  CLASS  : SymbolTableDriver                                     ***
+        ***********************************************************************
+        ***  DESCRIPTION : Same result as load_syms_lines, but the file is  ***
+        ***  split into newline-aligned byte chunks that are validated in a ***
+        ***  process pool. Chunk results are merged back in file order, so  ***
+        ***  duplicate MFlags and error line numbers match the sequential   ***
+        ***  path.                                                          ***
+        ***                                                                 ***
+        ***  INPUTS :                                                       ***
+        ***    - file_path (str): Path to the SYMS.DAT file.                ***
+        ***    - max_workers (int): Worker processes; None lets the pool    ***
+        ***      decide and 1 validates in this process.                    ***
+        ***    - chunk_bytes (int): Target chunk size in bytes.             ***
+        ***  RETURNS :                                                      ***
+        ***    - (int, int, int): Symbols inserted, duplicates flagged, and ***
+        ***      invalid lines encountered.                                 ***
+        **********************************************************************/
+        """
+        chunks = split_syms_chunks(file_path, chunk_bytes or self.SYMS_CHUNK_BYTES)
+        paths = [file_path] * len(chunks)
+        starts = [start for start, _ in chunks]
+        ends = [end for _, end in chunks]
+        if len(chunks) > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(validate_syms_chunk, paths, starts, ends))
+        else:
+            results = list(map(validate_syms_chunk, paths, starts, ends))
+
+        valid_symbols = []
+        errors = []
+        line_offset = 1
+        for count, symbols, chunk_errors in results:
+            valid_symbols.extend(SymbolData(symbol, value, rflag) for _, (symbol, value, rflag) in symbols)
+            errors.extend((line_offset + index, line, reason) for index, line, reason in chunk_errors)
+            line_offset += count
+        self.logger.log_action(f"Validated '{file_path}' in {len(chunks)} chunk(s).")
+
+        return self.report_syms_load(valid_symbols, errors)
+
+    def report_syms_load(self, valid_symbols, errors):
+        """
+        /**********************************************************************
+        ***  FUNCTION : report_syms_load                                    ***
+        ***  CLASS  : SymbolTableDriver                                     ***
+        ***********************************************************************
+        ***  DESCRIPTION : Bulk loads validated symbols (in file order) and ***
+        ***  prints the invalid lines and the load summary.                 ***
+        ***                                                                 ***
+        ***  INPUTS :                                                       ***
+        ***    - valid_symbols (list of SymbolData): Symbols in file order. ***
+        ***    - errors (list): (line number, line, reason) tuples.         ***
+        ***  RETURNS :                                                      ***
+        ***    - (int, int, int): Symbols inserted, duplicates flagged, and ***
+        ***      invalid lines encountered.                                 ***
+        **********************************************************************/
+        """
+        inserted, duplicates = self.symbol_table.bulk_load(valid_symbols)
+
+        for line_num, line, reason in errors:
+            print(f"Error in Line {line_num}: '{line}'")
+            print(f"  Reason: {reason}")
+
+        print(f"\nSummary:")
+        print(f"- {inserted} valid symbols inserted")
+        print(f"- {duplicates} duplicate symbols flagged")
+        print(f"- {len(errors)} invalid lines encountered")
+        return inserted, duplicates, len(errors)
+
+
     def process_search_file(self, file_path):
         """
         /********************************************************************
@@ -855,21 +2113,16 @@ class SymbolTableDriver:
                 print(f"Error: Unable to read {file_path}.")
                 return
 
-            found_symbols = []
-            not_found_symbols = []
-
+            search_symbols = []
             for line in lines:
                 validation_result = self.validator.validate_search_line(line)
                 if "Error" not in validation_result:
-                    symbol = validation_result
-                    result = self.symbol_table.search(symbol)
-                    if result:
-                        found_symbols.append(result)
-                    else:
-                        not_found_symbols.append(symbol)
+                    search_symbols.append(validation_result)
                 else:
                     print(f"Invalid search line: {validation_result}")
 
+            found_symbols, not_found_symbols = self.symbol_table.search_many(search_symbols)
+
             if found_symbols:
                 self.display_symbols_paginated(found_symbols)
             else:
@@ -928,7 +2181,7 @@ class SymbolTableDriver:
         ********************************************************************/
         """
         try:
-            if self.symbol_table.root is None:
+            if self.symbol_table.size() == 0:
                 print("The symbol table is empty.")
             else:
                 print("-" * 35)
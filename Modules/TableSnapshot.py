@@ -0,0 +1,107 @@
+# TableSnapshot.py
+
+import os
+import sys
+import struct
+import hashlib
+import zlib
+from typing import Iterable, Optional
+
+repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(repo_home_path)
+
+from Modules.ErrorLogHandler import ErrorLogHandler
+
+
+class TableSnapshot:
+    """
+    Versioned binary snapshot file for an assembler table.
+
+    Layout:
+        header  : magic (4s), version (B), source digest (32s), payload CRC-32 (I),
+                  payload length (I)
+        payload : table-specific records
+
+    The source digest is the SHA-256 of the text the table was built from (e.g. the
+    symbol table section of a .int file). A snapshot is only accepted when the
+    digest matches the current text and the payload CRC checks out, so a caller
+    can trust its contents and skip re-validating the text.
+    """
+
+    VERSION = 1
+    _HEADER = struct.Struct(">4sB32sII")
+
+    def __init__(self, magic: bytes, logger: Optional[ErrorLogHandler] = None):
+        """
+        :param magic: 4-byte tag that identifies the table type.
+        :param logger: An instance of ErrorLogHandler for logging. If None, a new instance is created.
+        """
+        self.magic = magic
+        self.logger = logger or ErrorLogHandler()
+
+    @staticmethod
+    def digest_lines(lines: Iterable[str]) -> bytes:
+        """
+        Returns the SHA-256 digest of a block of text lines, ignoring
+        surrounding whitespace on each line.
+
+        :param lines: The lines the table is built from.
+        """
+        digest = hashlib.sha256()
+        for line in lines:
+            digest.update(line.strip().encode("utf-8"))
+            digest.update(b"\n")
+        return digest.digest()
+
+    def write(self, file_path: str, payload: bytes, source_digest: bytes = bytes(32)) -> bool:
+        """
+        Writes a snapshot file atomically.
+
+        :param file_path: Destination path.
+        :param payload: Encoded table records.
+        :param source_digest: Digest of the text the table was built from.
+        :return: True on success.
+        """
+        header = self._HEADER.pack(self.magic, self.VERSION, source_digest,
+                                   zlib.crc32(payload), len(payload))
+        temp_path = f"{file_path}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(header)
+                file.write(payload)
+            os.replace(temp_path, file_path)
+        except OSError as e:
+            self.logger.log_error(f"Could not write table snapshot '{file_path}': {e}", "TableSnapshot.write")
+            return False
+        self.logger.log_action(f"Wrote table snapshot '{file_path}' ({len(payload)} bytes).")
+        return True
+
+    def read(self, file_path: str, source_digest: Optional[bytes] = None) -> Optional[bytes]:
+        """
+        Reads a snapshot file and returns its payload if it is usable.
+
+        :param file_path: Snapshot path.
+        :param source_digest: Digest the snapshot must have been built from, or None to accept any.
+        :return: The payload, or None if the file is missing, stale, or corrupt.
+        """
+        try:
+            with open(file_path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        if len(data) < self._HEADER.size:
+            self.logger.log_action(f"Ignoring truncated table snapshot '{file_path}'.")
+            return None
+        magic, version, digest, crc, length = self._HEADER.unpack_from(data)
+        payload = data[self._HEADER.size:]
+        if magic != self.magic or version != self.VERSION:
+            self.logger.log_action(f"Ignoring table snapshot '{file_path}' with an unknown format.")
+            return None
+        if source_digest is not None and digest != source_digest:
+            self.logger.log_action(f"Table snapshot '{file_path}' is out of date.")
+            return None
+        if length != len(payload) or zlib.crc32(payload) != crc:
+            self.logger.log_action(f"Ignoring table snapshot '{file_path}': checksum mismatch.")
+            return None
+        return payload
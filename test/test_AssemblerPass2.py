@@ -0,0 +1,82 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+repo_home_path = Path(__file__).resolve().parent.parent
+sys.path.append(str(repo_home_path))
+
+from Modules.AssemblerPass1 import AssemblerPass1
+from Modules.AssemblerPass2 import AssemblerPass2
+
+SAMPLES = repo_home_path / "A4_Pass_2"
+
+
+class TestAssemblerPass2(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        shutil.copy(SAMPLES / "opcodes.txt", self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assemble(self, name, source_lines=None):
+        """
+        Runs both passes on name.asm in the temporary directory and returns the
+        object program lines and the listing lines.
+        """
+        if source_lines is None:
+            shutil.copy(SAMPLES / f"{name}.asm", self.temp_dir.name)
+        else:
+            with open(os.path.join(self.temp_dir.name, f"{name}.asm"), "w") as file:
+                file.write("\n".join(source_lines) + "\n")
+        main_program = os.path.join(self.temp_dir.name, "ComboP1P2.py")
+        with patch('sys.argv', [main_program]), patch('builtins.input', return_value='y'), \
+                patch('sys.stdout', new_callable=StringIO):
+            AssemblerPass1(f"{name}.asm")
+            AssemblerPass2(f"{name}.int")
+        with open(os.path.join(self.temp_dir.name, f"{name}.obj")) as file:
+            object_program = file.read().splitlines()
+        with open(os.path.join(self.temp_dir.name, f"{name}.lst")) as file:
+            listing = file.read().split("===SYM_START===")[0].splitlines()
+        return object_program, [line.split() for line in listing if line.strip()]
+
+    def test_external_references_keep_pass_one_addresses(self):
+        object_program, listing = self.assemble("t2")
+        self.assertEqual(object_program[0], "HFA20000000000012")
+        self.assertEqual([line[1] for line in listing], ["00000", "00000", "00000", "00000", "00004",
+                                                          "00008", "0000C", "0000F", "00012"])
+        self.assertEqual(object_program[1], "T00000012EF10000067100000DF100006000000000061")
+        self.assertEqual(object_program[2:-1], ["M00000105", "M00000505+TWO", "M00000905+FOUR",
+                                                "M00000C06", "M00000C06-TWO"])
+
+    def test_bad_operands_still_advance_the_location_counter(self):
+        object_program, listing = self.assemble("bad", [
+            "BAD:      START     #0",
+            "FIRST:    LDA       MISSING",
+            "          +LDA      MISSING+1",
+            "LAST:     J         LAST",
+            "          END       FIRST",
+        ])
+        self.assertEqual(object_program[0], "HBAD00000000000A")
+        self.assertIn(["00007", "LAST:", "J", "LAST", "3F2FFD"], [line[1:] for line in listing])
+
+    def test_end_pool_is_emitted_like_ltorg_pool(self):
+        object_program, listing = self.assemble("ltp", [
+            "LTP:      START     #0",
+            "FIRST:    LDA       =0X05",
+            "          LTORG",
+            "          LDA       =0X0A",
+            "          END       FIRST",
+        ])
+        self.assertEqual(object_program[:2], ["HLTP000000000008", "T00000008032000050320000A"])
+        self.assertEqual([line[0:3] for line in listing[-3:]], [["5", "00004", "LDA"], ["6", "00007", "END"],
+                                                                ["7", "00007", "*"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from io import StringIO
+
+repo_home_path = Path(__file__).resolve().parent.parent
+sys.path.append(str(repo_home_path))
+
+from Modules.LinkerCache import LinkerCache
+from Modules.LinkerLoader import LinkerLoader
+from Modules.LinkerParser import LinkerParser
+from Modules.ErrorLogHandler import ErrorLogHandler
+
+LINKER_DIR = repo_home_path / "A5_Linker_Loader"
+
+
+class TestLinkerCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.files = []
+        for name in ("prog.obj", "func.obj"):
+            path = os.path.join(self.temp_dir.name, name)
+            shutil.copy(LINKER_DIR / name, path)
+            self.files.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def link(self, parallel=False):
+        loader = LinkerLoader(self.files, output_file=os.path.join(self.temp_dir.name, "MEMORY.DAT"),
+                              logger=ErrorLogHandler(), parallel=parallel, max_workers=2,
+                              cache_dir=self.cache_dir)
+        with patch('sys.stdout', new_callable=StringIO):
+            loader.run()
+        return loader
+
+    def test_encode_decode_round_trip(self):
+        cache = LinkerCache(self.cache_dir)
+        with open(self.files[0]) as file:
+            sections, errors = LinkerParser().parse_control_sections(file, self.files[0])
+        self.assertEqual(errors, [])
+        self.assertEqual(cache.decode(cache.encode(sections)), sections)
+
+    def test_warm_link_is_identical(self):
+        cold = self.link()
+        self.assertEqual((cold.cache.hits, cold.cache.misses), (0, 2))
+        for parallel in (False, True):
+            warm = self.link(parallel)
+            self.assertEqual(warm.cache.hits, 2)
+            self.assertEqual(warm.memory.data, cold.memory.data)
+            self.assertEqual(warm.memory.init_bitmap, cold.memory.init_bitmap)
+            self.assertEqual(warm.execution_address, cold.execution_address)
+
+    def test_changed_file_is_reparsed(self):
+        self.link()
+        with open(self.files[1]) as file:
+            content = file.read()
+        with open(self.files[1], "w") as file:
+            file.write(content.replace("T0000000E03", "T0000000E04"))
+        warm = self.link()
+        self.assertEqual((warm.cache.hits, warm.cache.misses), (1, 1))
+        self.assertEqual(warm.memory.read_byte(0x0331F), 0x04)
+        self.assertEqual(self.link().cache.hits, 2)
+
+    def test_touched_file_hits(self):
+        self.link()
+        stat = os.stat(self.files[0])
+        os.utime(self.files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        warm = self.link()
+        self.assertEqual(warm.cache.hits, 2)
+
+    def test_same_size_and_mtime_edit_is_reparsed(self):
+        self.link()
+        stat = os.stat(self.files[1])
+        with open(self.files[1]) as file:
+            content = file.read()
+        with open(self.files[1], "w") as file:
+            file.write(content.replace("T0000000E03", "T0000000E04"))
+        os.utime(self.files[1], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        warm = self.link()
+        self.assertEqual((warm.cache.hits, warm.cache.misses), (1, 1))
+        self.assertEqual(warm.memory.read_byte(0x0331F), 0x04)
+
+
+if __name__ == '__main__':
+    unittest.main()
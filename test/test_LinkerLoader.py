@@ -0,0 +1,99 @@
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from io import StringIO
+
+repo_home_path = Path(__file__).resolve().parent.parent
+sys.path.append(str(repo_home_path))
+
+from Modules.LinkerLoader import LinkerLoader
+from Modules.LinkerPass1 import ParallelLinkerPass1
+from Modules.ErrorLogHandler import ErrorLogHandler
+from Modules.Memory import Memory
+
+LINKER_DIR = repo_home_path / "A5_Linker_Loader"
+
+
+class TestLinkerLoader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_file = os.path.join(self.temp_dir.name, "MEMORY.DAT")
+        self.logger = ErrorLogHandler()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def link(self, *names, parallel=False):
+        files = [str(LINKER_DIR / name) for name in names]
+        loader = LinkerLoader(files, output_file=self.output_file, logger=self.logger,
+                              parallel=parallel, max_workers=2)
+        with patch('sys.stdout', new_callable=StringIO):
+            loader.run()
+        return loader
+
+    def test_estab(self):
+        loader = self.link("prog.obj", "func.obj")
+        self.assertEqual(loader.estab.get("PROG"), 0x03300)
+        self.assertEqual(loader.estab.get("FIFT"), 0x03319)
+        self.assertEqual(loader.estab.get("SIXT"), 0x0331C)
+        self.assertEqual(loader.estab.get("FUNC"), 0x0331F)
+        self.assertEqual(loader.estab.get("TWO"), 0x0332A)
+        self.assertEqual(loader.estab.get("THRE"), 0x0332D)
+
+    def test_modifications_applied(self):
+        loader = self.link("prog.obj", "func.obj")
+        self.assertFalse(self.logger.has_errors())
+        # M00000E05+FUNC: 100000 -> 10331F
+        self.assertEqual(loader.memory.read_bytes(0x0330E, 3), [0x10, 0x33, 0x1F])
+        # M00001C06+TWO: FFFFE7 + 0332A wraps to 003311
+        self.assertEqual(loader.memory.read_bytes(0x0331C, 3), [0x00, 0x33, 0x11])
+        # M00000B06+SIXT and -FIFT cancel down to 000003
+        self.assertEqual(loader.memory.read_bytes(0x0332A, 3), [0x00, 0x00, 0x03])
+        self.assertEqual(loader.execution_address, 0x0330D)
+
+    def test_memory_file(self):
+        self.link("prog.obj", "func.obj")
+        with open(self.output_file) as file:
+            lines = file.read().splitlines()
+        self.assertTrue(lines[1].startswith("03300 ?? 4B 45 4E"))
+        self.assertEqual(lines[-1], "Execution begins at address 00330D.")
+
+    def test_binary_image(self):
+        loader = self.link("prog.obj", "func.obj")
+        image, execution_address = Memory.load_image(os.path.join(self.temp_dir.name, "MEMORY.IMG"))
+        self.assertEqual(execution_address, 0x0330D)
+        self.assertEqual(image.start_address, 0x03300)
+        self.assertEqual(image.data, loader.memory.data)
+        self.assertEqual(image.init_bitmap, loader.memory.init_bitmap)
+
+    def test_parallel_matches_sequential(self):
+        sequential = self.link("prog.obj", "func.obj", "t1.obj")
+        parallel = self.link("prog.obj", "func.obj", "t1.obj", parallel=True)
+        self.assertEqual(parallel.estab.symbols, sequential.estab.symbols)
+        self.assertEqual(parallel.memory.data, sequential.memory.data)
+        self.assertEqual(parallel.memory.init_bitmap, sequential.memory.init_bitmap)
+        self.assertEqual(parallel.execution_address, sequential.execution_address)
+
+    def test_parallel_pass1_duplicates(self):
+        files = [str(LINKER_DIR / "prog.obj"), str(LINKER_DIR / "prog.obj")]
+        with patch('sys.stdout', new_callable=StringIO):
+            estab = ParallelLinkerPass1(files, logger=self.logger, max_workers=2).run()
+        self.assertEqual(estab.get("PROG"), 0x03300)
+        self.assertEqual(len(self.logger.error_log), 3)   # PROG, FIFT, SIXT
+
+    def test_duplicate_and_undefined_symbols(self):
+        loader = LinkerLoader([], output_file=self.output_file, logger=self.logger)
+        with patch('sys.stdout', new_callable=StringIO):
+            loader.parse_object_lines(["HAAAA000000000006", "DSYM 000000", "T00000003000000",
+                                       "M00000005+NONE", "E000000"], "a.obj")
+            loader.parse_object_lines(["HBBBB000000000003", "DSYM 000001", "E"], "b.obj")
+            loader.run()
+        self.assertEqual(loader.estab.get("SYM"), 0x03300)
+        self.assertEqual(len(self.logger.error_log), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import sys
+from pathlib import Path
+
+repo_home_path = Path(__file__).resolve().parent.parent
+sys.path.append(str(repo_home_path))
+
+from Modules.LinkerParser import LinkerParser, TextRecord
+
+
+class TestLinkerParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = LinkerParser()
+
+    def test_fast_records_match_dict_records(self):
+        lines = ["HPROG00000000001F", "DFIFT000019SIXT00001C", "RFUNCTWO THRE",
+                 "T0000010B4B454E2047414D52414454", "M00001C06+TWO", "E00000D"]
+        for line in lines:
+            expected = self.parser.parse_line(line)
+            record = self.parser.parse_record(line)
+            self.assertEqual(record.record_type, expected["record_type"])
+            for key, value in expected.items():
+                self.assertEqual(getattr(record, key), value, key)
+
+    def test_refer_record_fixed_width(self):
+        record = self.parser.parse_record("RFUNCTWO THRE")
+        self.assertEqual(record.symbols, ["FUNC", "TWO", "THRE"])
+
+    def test_text_record_keeps_hex_code(self):
+        record = self.parser.parse_record("T00000003ABCDEF")
+        self.assertIsInstance(record, TextRecord)
+        self.assertEqual((record.hex_code, record.object_code), ("ABCDEF", b'\xAB\xCD\xEF'))
+
+    def test_iter_records_skips_blank_lines(self):
+        records = list(self.parser.iter_records(["HA   000000000000\n", "\n", "E\n"]))
+        self.assertEqual([record.record_type for record in records], ['H', 'E'])
+        self.assertIsNone(records[1].execution_address)
+
+    def test_unknown_record(self):
+        with self.assertRaises(ValueError):
+            self.parser.parse_record("X000000")
+
+
+if __name__ == '__main__':
+    unittest.main()
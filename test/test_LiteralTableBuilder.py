@@ -2,11 +2,13 @@ import unittest
 import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+from io import StringIO
 
 repo_home_path = Path(__file__).resolve().parent.parent
 sys.path.append(str(repo_home_path))
 
 from Modules.Literal_Table_Builder import *
+from Modules.Symbol_Table_Builder import SymbolTable, SymbolData, ConcurrentSymbolTable
 
 class TestLiteralTableBuilder(unittest.TestCase):
     def setUp(self):
@@ -113,5 +115,207 @@ class TestLiteralTableBuilder(unittest.TestCase):
         evaluator = ExpressionEvaluator(parsed_expressions, None, self.builder.literal_table, self.builder.log_handler)
         self.assertEqual(evaluator.parsed_expressions, parsed_expressions)
 
+class TestLiteralTableIndexes(unittest.TestCase):
+    def setUp(self):
+        self.table = LiteralTableList(ErrorLogHandler())
+
+    def test_insert_keeps_order_and_tail(self):
+        names = [f"=0X{i:04X}" for i in range(500)]
+        for name in names:
+            self.table.insert(LiteralData(name, name[3:], 2))
+        self.assertEqual([literal.name for literal in self.table.get_literals()], names)
+        self.assertIs(self.table.tail.literal_data, self.table.search(names[-1]))
+        self.table.update_addresses(start_address=0x100)
+        self.assertEqual(self.table.get_address_for_literal_from_name(names[3]), 0x103)
+        self.assertEqual(self.table.get_value_for_literal_from_name("=0X01F3"), "01F3")
+        self.assertEqual(self.table.get_length_for_literal_from_name("=0X01F3"), 2)
+        self.assertIsNone(self.table.get_literal_data_from_name("=0XFFFF"))
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_duplicates_are_rejected_by_index(self, mock_stdout):
+        self.table.insert(LiteralData("=0CEOF", "454f46", 3))
+        self.table.insert(LiteralData("=0CEOF", "454F46", 3))
+        self.table.insert(LiteralData("=0X454F46", "454F46", 3))
+        self.assertEqual([literal.name for literal in self.table.get_literals()], ["=0CEOF", "=0X454F46"])
+        self.assertTrue(self.table.exists_by_value("454F46", "=0ceof"))
+        self.assertFalse(self.table.exists_by_value("454F46", "=0X05"))
+        self.assertTrue(self.table.exists_by_value_alone("454f46"))
+        self.assertFalse(self.table.exists_by_value_alone("05"))
+
+    def test_assigning_head_and_sorted_insert_rebuild_indexes(self):
+        self.table.insert(LiteralData("=0X0B", "0B", 1))
+        node = LiteralNode(LiteralData("=0X0C", "0C", 1))
+        self.table.head = node
+        self.assertIsNone(self.table.search("=0X0B"))
+        self.assertIs(self.table.tail, node)
+        self.table.insert_sorted(LiteralData("=0X0A", "0A", 1))
+        self.table.insert(LiteralData("=0X0D", "0D", 1))
+        self.assertEqual([literal.name for literal in self.table.get_literals()], ["=0X0A", "=0X0C", "=0X0D"])
+        self.assertTrue(self.table.exists_by_value_alone("0A"))
+
+
+class TestLiteralPooling(unittest.TestCase):
+    def setUp(self):
+        self.table = LiteralTableList(ErrorLogHandler())
+
+    def test_value_is_stored_as_bytes(self):
+        literal = LiteralData("=0CEOF", encode_character_literal("EOF"), 3)
+        self.assertEqual(literal.data, b"EOF")
+        self.assertEqual(literal.value, "454F46")
+        self.assertEqual(literal.int_value, 0x454F46)
+        self.assertEqual(LiteralData("=0X0a", "0a", 1).data, b"\x0a")
+        self.assertIsNone(LiteralData("=0X0", "0", 1).data)
+        with self.assertRaises(ValueError):
+            encode_character_literal("\u20ac")
+
+    def test_same_bytes_share_one_slot(self):
+        self.table.insert(LiteralData("=0CEOF", b"EOF", 3))
+        self.table.insert(LiteralData("=0X05", b"\x05", 1))
+        self.table.insert(LiteralData("=0X454F46", "454f46", 3))
+        owner, alias = self.table.search("=0CEOF"), self.table.search("=0X454F46")
+        self.assertIs(alias.pool_owner, owner)
+        self.assertIs(alias.data, owner.data)
+        self.assertEqual([literal.name for literal in self.table.get_pooled_literals()], ["=0CEOF", "=0X05"])
+        self.assertEqual(len(self.table.get_literals()), 3)
+        self.assertEqual(self.table.get_total_size(), 4)
+
+        self.table.update_addresses(start_address=0x30)
+        self.assertEqual([literal.address for literal in self.table.get_literals()], [0x30, 0x31, 0x30])
+        owner.address = 0x1000
+        self.assertEqual(self.table.get_address_for_literal_from_name("=0X454F46"), 0x1000)
+
+
+    def test_ltorg_pools_only_place_pending_literals(self):
+        self.table.insert(LiteralData("=0X05", b"\x05", 1))
+        self.table.insert(LiteralData("=0CEOF", b"EOF", 3))
+        first = self.table.close_pool(0x10)
+        self.assertEqual([(literal.name, literal.address) for literal in first], [("=0X05", 0x10), ("=0CEOF", 0x11)])
+        self.assertEqual(self.table.get_unassigned_literals(), [])
+
+        self.table.insert(LiteralData("=0X0102", b"\x01\x02", 2))
+        self.table.insert(LiteralData("=0X454F46", b"EOF", 3))
+        self.assertEqual([literal.name for literal in self.table.get_unassigned_literals()], ["=0X0102"])
+        second = self.table.close_pool(0x40)
+        self.assertEqual([(literal.name, literal.address) for literal in second], [("=0X0102", 0x40)])
+        self.assertEqual(self.table.search("=0X05").address, 0x10)
+        self.assertEqual(self.table.search("=0X454F46").address, 0x11)
+        self.assertEqual(self.table.literal_pools, [first, second])
+        self.assertEqual(self.table.close_pool(0x42), [])
+
+    def test_take_pool_at_follows_pass_one_addresses(self):
+        self.table.insert(LiteralData("=0X05", "05", "1", "00010"))
+        self.table.insert(LiteralData("=0CEOF", "454F46", "3", "00011"))
+        self.table.insert(LiteralData("=0X0102", "0102", "2", "00040"))
+        self.assertEqual([literal.name for literal in self.table.take_pool_at(0x10)], ["=0X05", "=0CEOF"])
+        self.assertEqual(self.table.take_pool_at(0x14), [])
+        self.assertEqual([literal.name for literal in self.table.get_unassigned_literals()], ["=0X0102"])
+
+
+
+class TestCompiledExpressions(unittest.TestCase):
+    def setUp(self):
+        self.logger = ErrorLogHandler()
+        self.literal_table = LiteralTableList(self.logger)
+        self.symbol_table = SymbolTable(logger=self.logger)
+        self.symbol_table.insert(SymbolData("BUFF", 0x100, True))
+        self.symbol_table.insert(SymbolData("SIZE", 0x20, False))
+        self.parser = ExpressionParser(None, self.literal_table, self.logger)
+        self.evaluator = ExpressionEvaluator(None, self.symbol_table, self.literal_table, self.logger)
+
+    def evaluate(self, text):
+        return self.evaluator.evaluate_expression(self.parser.compile_line(text))
+
+    def test_same_text_is_parsed_once(self):
+        with patch.object(self.parser, 'parse_line', wraps=self.parser.parse_line) as parse_line:
+            first = self.parser.compile_line("@BUFF+SIZE")
+            self.assertIs(self.parser.compile_line("  @BUFF+SIZE "), first)
+            parse_line.assert_called_once()
+        self.assertEqual((first.n_bit, first.i_bit, first.x_bit), (1, 0, 0))
+        result = self.evaluate("@BUFF+SIZE")
+        self.assertEqual((result['value'], result['relocatable'], result['error']), (0x120, True, None))
+
+    def test_dictionary_input_matches_uncompiled_results(self):
+        parsed = self.parser.parse_line("BUFF-SIZE,X")
+        result = self.evaluator.evaluate_expression(parsed)
+        self.assertEqual(result, {'original_expression': "BUFF-SIZE,X", 'value': 0xE0, 'relocatable': True,
+                                  'n_bit': 1, 'i_bit': 1, 'x_bit': 1, 'external_references': [], 'error': None})
+        self.assertIs(self.evaluator.compile_expression(parsed), self.evaluator.compiled_expressions["BUFF-SIZE,X"])
+        recompiled = self.evaluator.compile_expression(dict(parsed))
+        self.assertIs(recompiled, self.evaluator.compiled_expressions["BUFF-SIZE,X"])
+        self.assertIsNot(recompiled.parsed_expr, parsed)
+        self.assertEqual(self.evaluate("SIZE-BUFF")['error'], "F  -  T ERROR")
+
+    def test_names_ending_in_x_are_looked_up_whole(self):
+        self.symbol_table.insert(SymbolData("MAX", 0x40, False))
+        self.symbol_table.insert(SymbolData("X", 2, False))
+        self.assertEqual(self.evaluate("MAX+1")['value'], 0x41)
+        self.assertEqual(self.evaluate("X+1")['value'], 3)
+        result = self.evaluate("MAX,X")
+        self.assertEqual((result['value'], result['x_bit']), (0x40, 1))
+
+    def test_external_symbols_are_zero_with_signed_references(self):
+        self.symbol_table.insert(SymbolData("TWO", 5, False))
+        self.symbol_table.insert(SymbolData("FOUR", 0, False))
+        self.symbol_table.insert(SymbolData("THREE", 0xC, True))
+        self.evaluator.add_external_symbol("TWO")
+        self.evaluator.add_external_symbol("FOUR")
+        result = self.evaluate("THREE-TWO")
+        self.assertEqual((result['value'], result['relocatable'], result['external_references']),
+                         (0xC, True, [('-', "TWO")]))
+        result = self.evaluate("-(TWO-FOUR)+6")
+        self.assertEqual((result['value'], result['relocatable'], result['external_references']),
+                         (6, False, [('-', "TWO"), ('+', "FOUR")]))
+        self.assertEqual(self.evaluate("TWO*2")['error'], "External symbol in multiplication or division.")
+        self.assertEqual(self.evaluate("THREE+3")['external_references'], [])
+
+    def test_symbol_changes_invalidate_bindings(self):
+        self.assertEqual(self.evaluate("BUFF+SIZE")['value'], 0x120)
+        self.symbol_table.insert_or_update(SymbolData("SIZE", 0x30, False))
+        self.assertEqual(self.evaluate("BUFF+SIZE")['value'], 0x130)
+        self.symbol_table.remove_symbol("SIZE")
+        self.assertEqual(self.evaluate("BUFF+SIZE")['error'], "Undefined symbol: SIZE")
+        self.symbol_table.insert(SymbolData("SIZE", 1, False))
+        self.assertEqual(self.evaluate("BUFF+SIZE")['value'], 0x101)
+
+    def test_replaced_records_are_rebound(self):
+        table = ConcurrentSymbolTable(logger=self.logger)
+        table.insert(SymbolData("SIZE", 4, False))
+        evaluator = ExpressionEvaluator(None, table, self.literal_table, self.logger)
+        compiled = self.parser.compile_line("SIZE+2")
+        self.assertEqual(evaluator.evaluate_expression(compiled)['value'], 6)
+        table.insert_or_update(SymbolData("SIZE", 10, False))
+        self.assertEqual(evaluator.evaluate_expression(compiled)['value'], 12)
+
+
+    def test_precedence_and_parentheses(self):
+        self.symbol_table.insert(SymbolData("BEND", 0x160, True))
+        self.symbol_table.insert(SymbolData("WSZ", 3, False))
+        self.assertEqual(self.evaluate("BEND-BUFF+3*WSZ")['value'], 0x60 + 9)
+        self.assertEqual(self.evaluate("(BEND-BUFF)/(WSZ+1)")['value'], 0x18)
+        self.assertEqual(self.evaluate("-WSZ*2+SIZE")['value'], 0x1A)
+        self.assertEqual(self.evaluate("7/-2")['value'], -3)
+        result = self.evaluate("BUFF+(BEND-BUFF)/2")
+        self.assertEqual((result['value'], result['relocatable']), (0x130, True))
+        self.assertEqual(self.parser.parse_line("A+(B")['error'], "Unbalanced parentheses.")
+        self.assertEqual(self.parser.parse_line("A*")['error'], "Missing second operand.")
+        self.assertEqual(self.parser.parse_line("A B")['error'], "Missing operator before 'B'.")
+
+    def test_relocatability_counts_terms(self):
+        self.symbol_table.insert(SymbolData("BEND", 0x160, True))
+        self.assertFalse(self.evaluate("BEND-BUFF")['relocatable'])
+        self.assertTrue(self.evaluate("BEND-BUFF+BUFF")['relocatable'])
+        self.assertEqual(self.evaluate("BEND+BUFF-SIZE")['error'], "T  +  T ERROR")
+        self.assertEqual(self.evaluate("SIZE-BEND-BUFF")['error'], "F  -  T ERROR")
+        self.assertEqual(self.evaluate("BUFF*2")['error'], "Relocatable operand in multiplication or division.")
+        self.assertEqual(self.evaluate("SIZE/0")['error'], "Division by zero.")
+
+    def test_location_counter_term(self):
+        compiled = self.parser.compile_line("*-BUFF")
+        result = self.evaluator.evaluate_expression(compiled, location=0x180)
+        self.assertEqual((result['value'], result['relocatable']), (0x80, False))
+        self.assertEqual(self.evaluator.evaluate_expression(self.parser.compile_line("*"), location=0x10)['value'], 0x10)
+        self.assertIsNotNone(self.evaluate("*+1")['error'])
+
+
 if __name__ == '__main__':
     unittest.main()
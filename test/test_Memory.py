@@ -1,13 +1,16 @@
 import unittest
+import io
+import tempfile
 import sys
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 # Add parent directory to path to import modules
 repo_home_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(repo_home_path)
 
-from Modules.Memory import Memory, MemoryUnit
+from Modules.Memory import Memory, MemoryDumpRenderer, MemoryUnit, PagedMemory, PAGE_SIZE
 from Modules.ErrorLogHandler import ErrorLogHandler
 
 class TestMemoryUnit(unittest.TestCase):
@@ -88,5 +91,117 @@ class TestMemory(unittest.TestCase):
         self.memory.write_byte(last_address, 0xFF)
         self.assertEqual(self.memory.read_byte(last_address), 0xFF)
 
+    def test_bulk_write_marks_only_written_bytes(self):
+        self.memory.write_bytes(0x1003, bytes(range(20)))
+        self.assertFalse(self.memory.is_initialized(0x1002))
+        self.assertTrue(self.memory.is_initialized(0x1003))
+        self.assertTrue(self.memory.is_initialized(0x1016))
+        self.assertFalse(self.memory.is_initialized(0x1017))
+        self.assertEqual(self.memory.read_bytes(0x1001, 4), [None, None, 0, 1])
+
+    def test_dump_masks_uninitialized_bytes(self):
+        self.memory.write_bytes(0x1002, b'\xAB\xCD')
+        dump = self.memory.get_dump(0x1000, 0x1008, width=8)
+        self.assertEqual(dump, "01000 ?? ?? AB CD ?? ?? ?? ??")
+
+    def test_write_dump_collapses_empty_rows(self):
+        self.memory.write_byte(0x1040, 0x01)
+        out = io.StringIO()
+        lines = self.memory.write_dump(out, collapse_empty=True)
+        rows = out.getvalue().splitlines()
+        self.assertEqual(lines, len(rows))
+        self.assertEqual(rows[0][:5], "01000")
+        self.assertEqual(rows[1], "*")
+        self.assertTrue(rows[2].startswith("01040 01 ??"))
+        self.assertEqual(rows[3], "01050 " + " ".join(["??"] * 16))
+        self.assertEqual(rows[4], "*")
+
+    def test_image_round_trip(self):
+        self.memory.write_bytes(0x1010, b'\xDE\xAD\xBE\xEF')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "MEMORY.IMG")
+            self.memory.save_image(path, 0x1012)
+            for use_mmap in (False, True):
+                loaded, execution_address = Memory.load_image(path, self.logger, use_mmap=use_mmap)
+                self.assertEqual(execution_address, 0x1012)
+                self.assertEqual((loaded.start_address, loaded.size), (0x1000, 256))
+                self.assertEqual(loaded.get_dump(0x1000, 0x1100), self.memory.get_dump(0x1000, 0x1100))
+                loaded.write_byte(0x1000, 0x01)
+                self.assertEqual(loaded.read_byte(0x1000), 0x01)
+                del loaded
+            reloaded, _ = Memory.load_image(path, self.logger)
+            self.assertIsNone(reloaded.read_byte(0x1000))
+
+    def test_load_image_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "MEMORY.DAT")
+            with open(path, "w") as file:
+                file.write("03300 ?? ?? ??\n")
+            with self.assertRaises(ValueError):
+                Memory.load_image(path, self.logger)
+
+    def test_bulk_write_out_of_range(self):
+        with self.assertRaises(ValueError):
+            self.memory.write_bytes(0x10FE, b'\x01\x02\x03')
+        self.assertFalse(self.memory.is_initialized(0x10FE))
+
+    def test_write_hex(self):
+        self.memory.write_hex(0x1001, "ABcdEF")
+        self.assertEqual(self.memory.read_bytes(0x1000, 5), [None, 0xAB, 0xCD, 0xEF, None])
+        with self.assertRaises(ValueError):
+            self.memory.write_hex(0x10FE, "010203")
+        with self.assertRaises(ValueError):
+            self.memory.write_hex(0x1010, "0G")
+        self.assertFalse(self.memory.is_initialized(0x1010))
+
+class TestPagedMemory(unittest.TestCase):
+    def setUp(self):
+        self.logger = ErrorLogHandler()
+        self.memory = PagedMemory(logger=self.logger)
+
+    def test_untouched_memory_allocates_nothing(self):
+        self.assertEqual(self.memory.allocated_bytes, 0)
+        self.assertIsNone(self.memory.read_byte(0xFFFFF))
+        self.assertFalse(self.memory.is_initialized(0x03300))
+        self.assertEqual(self.memory.allocated_bytes, 0)
+
+    def test_scattered_writes(self):
+        self.memory.write_bytes(0x03300, b'\x01\x02')
+        self.memory.write_byte(0xF0000, 0xAB)
+        self.assertEqual(self.memory.allocated_bytes, 2 * PAGE_SIZE)
+        self.assertEqual(self.memory.read_bytes(0x032FF, 4), [None, 0x01, 0x02, None])
+        self.assertEqual(self.memory.read_byte(0xF0000), 0xAB)
+
+    def test_write_across_page_boundary(self):
+        self.memory.write_bytes(0x00FFE, b'\xDE\xAD\xBE\xEF')
+        self.assertEqual(len(self.memory.pages), 2)
+        self.assertEqual(self.memory.read_bytes(0x00FFE, 4), [0xDE, 0xAD, 0xBE, 0xEF])
+
+    def test_write_hex_across_page_boundary(self):
+        self.memory.write_hex(0x00FFE, "DEADBEEF")
+        self.assertEqual(len(self.memory.pages), 2)
+        self.assertEqual(self.memory.read_bytes(0x00FFD, 6), [None, 0xDE, 0xAD, 0xBE, 0xEF, None])
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            self.memory.write_byte(0x100000, 0x00)
+        with self.assertRaises(ValueError):
+            self.memory.write_bytes(0xFFFFF, b'\x00\x00')
+
+    def test_dump_skips_untouched_pages(self):
+        self.memory.write_byte(0x03300, 0xFF)
+        self.memory.write_byte(0x80000, 0xEE)
+        dump = self.memory.get_dump(0x00000, 0x100000)
+        self.assertEqual(len(dump.splitlines()), 2 * PAGE_SIZE // 16)
+        self.assertIn("03300 FF", dump)
+        self.assertIn("80000 EE", dump)
+
+    def test_dump_reads_each_block_once(self):
+        self.memory.write_byte(0x00FFF, 0x11)
+        with patch.object(self.memory, '_read_row', wraps=self.memory._read_row) as read_row:
+            dump = self.memory.get_dump(0x00000, 0x04000)
+        self.assertEqual(read_row.call_count, 0x04000 // (16 * MemoryDumpRenderer.ROWS_PER_BLOCK))
+        self.assertEqual(len(dump.splitlines()), PAGE_SIZE // 16)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+repo_home_path = Path(__file__).resolve().parent.parent
+sys.path.append(str(repo_home_path))
+
+from Modules.ObjectFileReader import ObjectFileReader
+from Modules.LinkerParser import LinkerParser
+
+
+class TestObjectFileReader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, content: bytes) -> str:
+        path = os.path.join(self.temp_dir.name, "test.obj")
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def test_lines_without_endings(self):
+        path = self.write(b"HPROG00000000001F\r\n\r\nT00000003ABCDEF  \nE")
+        with ObjectFileReader(path) as reader:
+            lines = [bytes(line) for line in reader.iter_lines()]
+        self.assertEqual(lines, [b"HPROG00000000001F", b"", b"T00000003ABCDEF", b"E"])
+
+    def test_feeds_parser(self):
+        path = self.write(b"HPROG00000000001F\nT00000003ABCDEF\nE000000\n")
+        parser = LinkerParser()
+        with ObjectFileReader(path) as reader:
+            records = [parser.parse_record(line) for line in reader.iter_lines()]
+        self.assertEqual(records[0].program_name, "PROG")
+        self.assertEqual(records[1].object_code, b"\xAB\xCD\xEF")
+        self.assertEqual(records[2].execution_address, 0)
+
+    def test_close_with_unfinished_iterator(self):
+        path = self.write(b"HPROG00000000001F\nE\n")
+        reader = ObjectFileReader(path)
+        reader.open()
+        lines = reader.iter_lines()
+        self.assertEqual(bytes(next(lines)), b"HPROG00000000001F")
+        reader.close()
+
+    def test_empty_file(self):
+        path = self.write(b"")
+        with ObjectFileReader(path) as reader:
+            self.assertEqual(list(reader.iter_lines()), [])
+
+    def test_missing_file(self):
+        with self.assertRaises(OSError):
+            with ObjectFileReader(os.path.join(self.temp_dir.name, "missing.obj")):
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
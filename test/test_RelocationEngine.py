@@ -0,0 +1,57 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+from io import StringIO
+
+repo_home_path = Path(__file__).resolve().parent.parent
+sys.path.append(str(repo_home_path))
+
+from Modules.RelocationEngine import RelocationEngine
+from Modules.Memory import Memory, PagedMemory
+from Modules.ErrorLogHandler import ErrorLogHandler
+
+
+class TestRelocationEngine(unittest.TestCase):
+    def setUp(self):
+        self.logger = ErrorLogHandler()
+        self.memory = Memory(size=16, start_address=0x03300, logger=self.logger)
+        self.memory.write_bytes(0x03300, bytes.fromhex("4B100000FFFFE7000000"))
+        self.engine = RelocationEngine(self.memory, self.logger)
+
+    def test_twenty_bit_field_keeps_first_half_byte(self):
+        self.engine.add(0x03301, 5, 0xFFFFF)
+        self.engine.add(0x03301, 5, 0x00002)
+        self.assertEqual(self.engine.apply(), 1)
+        # 0x00000 + 0xFFFFF + 2 wraps to 0x00001 without touching the leading '1'
+        self.assertEqual(self.memory.read_bytes(0x03301, 3), [0x10, 0x00, 0x01])
+
+    def test_twenty_four_bit_field_wraps(self):
+        self.engine.add(0x03304, 6, 0x0332A)
+        self.engine.add(0x03307, 6, 0x03319)
+        self.engine.add(0x03307, 6, -0x0331C)
+        self.assertEqual(self.engine.apply(), 2)
+        self.assertEqual(self.memory.read_bytes(0x03304, 3), [0x00, 0x33, 0x11])
+        self.assertEqual(self.memory.read_bytes(0x03307, 3), [0xFF, 0xFF, 0xFD])
+
+    def test_problems_reported_once_each(self):
+        self.engine.add(0x03304, 6, 1)
+        self.engine.add(0x03305, 5, 1)      # overlaps the field above
+        self.engine.add(0x0330F, 6, 1)      # runs past the end of memory
+        self.engine.add(0x03340, 6, 1)      # out of range
+        self.engine.add(0x0330B, 6, 1)      # uninitialized
+        with patch('sys.stdout', new_callable=StringIO):
+            self.assertEqual(self.engine.apply(), 2)
+        self.assertEqual(len(self.logger.error_log), 3)
+
+    def test_paged_memory(self):
+        memory = PagedMemory(logger=self.logger)
+        memory.write_bytes(0x00FFF, bytes.fromhex("100000"))
+        engine = RelocationEngine(memory, self.logger)
+        engine.add(0x00FFF, 5, 0x0331F)
+        engine.apply()
+        self.assertEqual(memory.read_bytes(0x00FFF, 3), [0x10, 0x33, 0x1F])
+
+
+if __name__ == '__main__':
+    unittest.main()
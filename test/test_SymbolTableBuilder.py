@@ -1,8 +1,12 @@
 import unittest
+import tracemalloc
+import tempfile
 import sys
+import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
 
 repo_home_path = Path(__file__).resolve().parent.parent
 sys.path.append(str(repo_home_path))
@@ -74,6 +78,342 @@ class TestSymbolTableDriver(unittest.TestCase):
         self.assertIn("ALL_FALSE", output)
         self.assertIn("6000", output)
         self.assertIn("0", output)
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_load_syms_lines_prints_summary(self, mock_stdout):
+        lines = ["ALPHA: 10 true", "9BAD: 5 false", "BETA: 20 false", "ALPHAX: 30 true"]
+        result = self.symbol_table_builder.load_syms_lines(lines)
+        output = mock_stdout.getvalue()
+        self.assertEqual(result, (2, 1, 1))
+        self.assertNotIn("Inserted", output)
+        self.assertIn("Error in Line 2", output)
+        self.assertIn("- 2 valid symbols inserted", output)
+        self.assertTrue(self.symbol_table_builder.symbol_table.search("ALPH").mflag)
+
+
+    def test_parallel_syms_load_matches_sequential(self):
+        text = ("ALPHA: 10 true\r\n// comment line\n9BAD: 5 false\n\n"
+                + "".join(f"X{chr(65 + i // 26)}{chr(65 + i % 26)}: {i} {'true' if i % 2 else 'false'}  // sym {i}\n"
+                        for i in range(300))
+                + "ALPHAX: 30 true\nÉTÉ: 1 true\nBETA: 20 maybe\nXAH: 99 false")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "SYMS.DAT")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(text)
+
+            def load(loader):
+                driver = SymbolTableDriver(symbol_table=SymbolTable())
+                with patch('sys.stdout', new_callable=StringIO) as stdout:
+                    result = loader(driver)
+                rows = [(s.symbol, s.value, s.rflag, s.mflag) for s in driver.symbol_table]
+                return result, rows, stdout.getvalue()
+
+            explorer = FileExplorer()
+            sequential = load(lambda d: d.load_syms_lines(explorer.read_file(explorer.open_file(path))))
+            in_process = load(lambda d: d.load_syms_file_parallel(path, max_workers=1, chunk_bytes=64))
+            pooled = load(lambda d: d.load_syms_file_parallel(path, max_workers=2, chunk_bytes=512))
+
+        self.assertEqual(sequential[0], (302, 2, 2))
+        self.assertIn("Error in Line 2", sequential[2])
+        self.assertEqual(in_process, sequential)
+        self.assertEqual(pooled, sequential)
+
+    def test_syms_chunks_end_on_newlines(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "SYMS.DAT")
+            with open(path, "wb") as file:
+                file.write(b"AAAA: 1 true\nBB: 2 false\nC: 3 true")
+            chunks = split_syms_chunks(path, 4)
+            with open(path, "rb") as file:
+                data = file.read()
+        self.assertEqual(chunks, [(0, 13), (13, 25), (25, 34)])
+        self.assertEqual(b"".join(data[start:end] for start, end in chunks), data)
+
+
+class TestSymbolTableBackends(unittest.TestCase):
+    BACKENDS = ("avl", "hash", "bst", "columnar")
+
+    def build(self, backend, names):
+        table = SymbolTable(backend=backend)
+        for value, name in enumerate(names):
+            table.insert(SymbolData(name, value, True))
+        return table
+
+    def test_sorted_view_and_lookup(self):
+        names = [f"S{i:03d}" for i in range(300)]
+        for backend in self.BACKENDS:
+            table = self.build(backend, names)
+            self.assertEqual(table.size(), 300)
+            self.assertEqual([s.symbol for s in table.sorted_symbols()], sorted(n[:4] for n in names))
+            self.assertEqual(table.get("#S005"), (5, True, None))
+            self.assertIn("s010", table)
+
+    def test_duplicate_sets_mflag(self):
+        for backend in self.BACKENDS:
+            table = self.build(backend, ["ALPHA", "BETA", "ALPH"])
+            self.assertEqual(table.size(), 2)
+            alpha = table.search("ALPH")
+            self.assertTrue(alpha.mflag)
+            self.assertEqual(alpha.value, 0)
+            self.assertFalse(table.search("BETA").mflag)
+
+    def test_sorted_view_refreshes_after_mutation(self):
+        for backend in self.BACKENDS:
+            table = self.build(backend, ["MID", "ZED", "ABC"])
+            self.assertEqual([s.symbol for s in table], ["ABC", "MID", "ZED"])
+            table.insert(SymbolData("BB", 9, False))
+            table.remove_symbol("MID")
+            self.assertEqual([s.symbol for s in table], ["ABC", "BB", "ZED"])
+            table.insert_or_update(SymbolData("ZED", 42, False))
+            self.assertEqual(table.sorted_symbols()[-1].value, 42)
+            self.assertIn("0002A", str(table))
+            table.destroy()
+            self.assertEqual(table.size(), 0)
+            self.assertEqual(str(table), "Symbol table is empty.")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_remove_missing_symbol(self, mock_stdout):
+        table = self.build("hash", ["ONE"])
+        table.remove_symbol("TWO")
+        self.assertIn("Symbol 'TWO' not found.", mock_stdout.getvalue())
+        self.assertEqual(table.size(), 1)
+
+    def test_default_backend_is_balanced(self):
+        names = [f"{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(676)]
+        table = SymbolTable()
+        for value, name in enumerate(names):
+            table.insert(SymbolData(name, value, False))
+        self.assertEqual(table.backend, "avl")
+        # A sorted label stream must not degenerate into a list.
+        self.assertLessEqual(table.root.height, 14)
+        for name in names[::3]:
+            table.remove_symbol(name)
+        self.assertLessEqual(table.root.height, 12)
+        self.assertEqual([s.symbol for s in table], [n for i, n in enumerate(names) if i % 3])
+
+    def test_long_sorted_stream_without_recursion(self):
+        names = [f"{a}{b}{c}" for a in "ABCDEFGH" for b in "ABCDEFGHIJKLMNOP" for c in "ABCDEFGHIJKLMNOP"]
+        table = SymbolTable(backend="bst")
+        for value, name in enumerate(names):
+            table.insert(SymbolData(name, value, True))
+        self.assertEqual(table.search(names[-1]).value, len(names) - 1)
+        self.assertEqual(len(table.sorted_symbols()), len(names))
+        table.remove_symbol(names[-1])
+        self.assertNotIn(names[-1], table)
+
+    def test_symbols_between(self):
+        for backend in self.BACKENDS:
+            table = self.build(backend, ["ALPHA", "BETA", "CHAR", "DELT", "ECHO"])
+            self.assertEqual([s.symbol for s in table.symbols_between("b", "delta")], ["BETA", "CHAR", "DELT"])
+            self.assertEqual(table.symbols_between("F", "Z"), [])
+
+    def test_bulk_load_sorts_and_flags_duplicates(self):
+        for backend in self.BACKENDS:
+            table = self.build(backend, ["MID"])
+            batch = [SymbolData(name, value, False) for value, name in enumerate(["ZED", "ABC", "MID", "ABCD", "ZED"])]
+            added, duplicates = table.bulk_load(batch)
+            self.assertEqual((added, duplicates), (3, 2))
+            self.assertEqual([s.symbol for s in table], ["ABC", "ABCD", "MID", "ZED"])
+            # Earlier entries win, as they would with insert().
+            self.assertEqual(table.search("MID").value, 0)
+            self.assertTrue(table.search("MID").mflag)
+            self.assertEqual(table.search("ZED").value, 0)
+            self.assertTrue(table.search("ZED").mflag)
+            self.assertFalse(table.search("ABC").mflag)
+            table.insert(SymbolData("AAA", 7, True))
+            self.assertEqual(table.sorted_symbols()[0].symbol, "AAA")
+
+    def test_bulk_load_builds_balanced_tree(self):
+        names = [f"{a}{b}{c}" for a in "ABCD" for b in "ABCDEFGH" for c in "ABCDEFGHIJKLMNOP"]
+        for backend in ("avl", "bst"):
+            table = SymbolTable(backend=backend)
+            table.bulk_load(SymbolData(name, value, True) for value, name in enumerate(reversed(names)))
+            depth, stack = 0, [(table.root, 1)]
+            while stack:
+                node, level = stack.pop()
+                if node is not None:
+                    depth = max(depth, level)
+                    stack.extend(((node.left, level + 1), (node.right, level + 1)))
+            self.assertEqual(depth, len(names).bit_length())
+            if backend == "avl":
+                self.assertEqual(table.root.height, depth)
+                table.insert(SymbolData("ZZZ", 0, True))
+                table.remove_symbol("AAA")
+            self.assertEqual(table.search("DHP").value, 0)
+
+    def test_packed_keys_follow_name_order(self):
+        names = ["A", "AB", "ABC", "ABCD", "B", "B_1", "Z9", "ZZZZ"]
+        keys = [pack_symbol_name(name) for name in names]
+        self.assertEqual(keys, sorted(keys))
+        self.assertTrue(all(key < 1 << 32 for key in keys))
+        self.assertEqual([unpack_symbol_key(key) for key in keys], names)
+        self.assertEqual(normalize_symbol("buffer"), (pack_symbol_name("BUFF"), "BUFF"))
+
+    def test_lookup_accepts_raw_tokens(self):
+        for backend in self.BACKENDS:
+            table = self.build(backend, ["buffer", "LOOP"])
+            self.assertEqual(table.search("Buffer2").symbol, "BUFF")
+            self.assertEqual(table.get("@loop"), (1, True, None))
+            symbol_data = table.search("LOOP")
+            self.assertEqual(symbol_data.key, pack_symbol_name("LOOP"))
+
+    def test_search_many_matches_search(self):
+        names = [f"{a}{b}{c}" for a in "ACEG" for b in "ABCDEFGH" for c in "ABCDEFGH"]
+        probes = ["ghh", "AAA", "bzz", "CAB", "aaa", "ZZZZZ", "EDCBA", "GHH"]
+        for backend in self.BACKENDS:
+            table = self.build(backend, names)
+            for batch in (probes[:2], probes * 40):
+                found, missing = table.search_many(batch)
+                expected = [table.search(name) for name in batch]
+                self.assertEqual(found, [s for s in expected if s is not None])
+                self.assertEqual(missing, [name.upper()[:4] for name, s in zip(batch, expected) if s is None])
+            self.assertEqual(table.search_many([]), ([], []))
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_search_many_does_not_log_each_lookup(self, mock_stdout):
+        logger = MagicMock()
+        table = SymbolTable(logger=logger)
+        table.bulk_load([SymbolData("ONE", 1, True), SymbolData("TWO", 2, True)])
+        logger.reset_mock()
+        found, missing = table.search_many(["one", "six", "two", "ten"])
+        self.assertEqual([s.symbol for s in found], ["ONE", "TWO"])
+        self.assertEqual(missing, ["SIX", "TEN"])
+        logger.log_action.assert_called_once()
+
+    def test_address_reverse_index(self):
+        for backend in self.BACKENDS:
+            table = SymbolTable(backend=backend)
+            table.insert(SymbolData("FIRST", 0x0, True))
+            table.insert(SymbolData("LOOP", 0x10, True))
+            table.insert(SymbolData("AGAIN", 0x10, True))
+            table.insert(SymbolData("BUF", 0x40, True))
+            table.insert(SymbolData("MAXL", 0x20, False))   # absolute EQU constant
+            self.assertEqual(table.symbol_at(0x0).symbol, "FIRS")
+            self.assertEqual(table.symbol_at(0x1F).symbol, "AGAI")
+            self.assertEqual(table.symbol_at(0x20).symbol, "AGAI")
+            self.assertEqual(table.symbol_at(0x1000).symbol, "BUF")
+            self.assertIsNone(table.symbol_at(-1))
+            self.assertEqual([s.symbol for s in table.symbols_in_range(0x10, 0x40)], ["AGAI", "LOOP", "BUF"])
+
+            table.remove_symbol("AGAIN")
+            table.insert_or_update(SymbolData("BUF", 0x18, True))
+            table.insert(SymbolData("LOOP", 0x30, True))   # duplicate keeps the original address
+            self.assertEqual(table.symbol_at(0x17).symbol, "LOOP")
+            self.assertEqual(table.symbol_at(0x40).symbol, "BUF")
+            table.insert_or_update(SymbolData("BUF", 0x18, False))
+            self.assertEqual([s.symbol for s in table.symbols_in_range(0, 0x100)], ["FIRS", "LOOP"])
+
+    def test_reverse_index_after_bulk_load(self):
+        table = SymbolTable()
+        table.bulk_load(SymbolData(f"L{i}", i * 3, i % 2 == 0) for i in range(100))
+        self.assertEqual(table.symbol_at(7).symbol, "L2")
+        self.assertEqual(len(table.symbols_in_range(0, 297)), 50)
+        table.destroy()
+        self.assertIsNone(table.symbol_at(7))
+
+    def test_symbol_objects_have_no_instance_dict(self):
+        symbol = SymbolData("ALPHA", 1, True)
+        self.assertFalse(hasattr(symbol, "__dict__"))
+        with self.assertRaises(AttributeError):
+            symbol.comment = "not a field"
+
+    def test_columnar_views_write_through(self):
+        table = SymbolTable(backend="columnar")
+        table.insert(SymbolData("BIG", 1 << 40, True, address=-5))
+        table.insert(SymbolData("NONE", None, False, iflag=False))
+        table.insert(SymbolData("BIG", 3, True))
+        big, none = table.index.sorted_symbols()
+        self.assertIsInstance(big, SymbolData)
+        self.assertEqual((big.symbol, big.value, big.rflag, big.iflag, big.mflag, big.address),
+                         ("BIG", 1 << 40, True, True, True, -5))
+        self.assertEqual((none.value, none.rflag, none.iflag, none.mflag, none.address),
+                         (None, False, False, False, None))
+        none.value = 0x7F
+        self.assertEqual(table.get_value("NONE"), 0x7F)
+
+        table.remove_symbol("BIG")
+        table.insert(SymbolData("NEW", 9, False))
+        self.assertEqual([(s.symbol, s.value, s.mflag) for s in table], [("NEW", 9, False), ("NONE", 0x7F, False)])
+
+    def test_columnar_backend_uses_less_memory(self):
+        def allocated(backend):
+            normalize_symbol.cache_clear()
+            tracemalloc.start()
+            table = SymbolTable(backend=backend)
+            table.bulk_load([SymbolData(f"S{i:03d}", 0x1000 + i, True) for i in range(500)])
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            self.assertEqual(table.size(), 500)
+            return size
+
+        self.assertLess(allocated("columnar"), allocated("avl"))
+
+    def test_unknown_backend(self):
+        with patch('sys.stdout', new_callable=StringIO):
+            with self.assertRaises(ValueError):
+                SymbolTable(backend="btree")
+
+
+class TestConcurrentSymbolTable(unittest.TestCase):
+    NAMES = [f"{chr(65 + i // 676)}{chr(65 + i // 26 % 26)}{chr(65 + i % 26)}" for i in range(2000)]
+
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_concurrent_inserts_and_reads(self):
+        table = ConcurrentSymbolTable(stripes=8)
+        workers = 8
+        # Every name is inserted by exactly two workers, so each ends up with MFlag set once.
+        def writer(worker):
+            for position in range(worker, len(self.NAMES), workers // 2):
+                name = self.NAMES[position]
+                table.insert(SymbolData(name, position, True))
+            return 0
+
+        positions = {name: position for position, name in enumerate(self.NAMES)}
+
+        def reader(_):
+            misses = 0
+            for name in self.NAMES:
+                symbol = table.search(name)
+                if symbol is None:
+                    misses += 1
+                elif symbol.value != positions[symbol.symbol]:
+                    raise AssertionError(f"{name} has value {symbol.value}")
+            return misses
+
+        with ThreadPoolExecutor(max_workers=12) as executor:
+            writes = [executor.submit(writer, worker % (workers // 2)) for worker in range(workers)]
+            reads = [executor.submit(reader, None) for _ in range(4)]
+            for future in writes + reads:
+                future.result()
+
+        self.assertEqual(table.size(), len(self.NAMES))
+        self.assertEqual([s.symbol for s in table], sorted(self.NAMES))
+        self.assertTrue(all(s.mflag for s in table))
+        self.assertEqual(table.address_index, [(position, pack_symbol_name(name)) for position, name in enumerate(self.NAMES)])
+
+    def test_concurrent_updates_and_removals(self):
+        table = ConcurrentSymbolTable()
+        table.bulk_load(SymbolData(name, 0, True) for name in self.NAMES)
+
+        def updater(offset):
+            for position in range(offset, len(self.NAMES), 4):
+                table.insert_or_update(SymbolData(self.NAMES[position], 0x100 + position, True))
+                if position % 8 == offset:
+                    table.remove_symbol(self.NAMES[position])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(updater, range(4)))
+
+        expected = [(0x100 + position, name) for position, name in enumerate(self.NAMES) if position % 8 >= 4]
+        self.assertEqual([(s.value, s.symbol) for s in table.symbols_in_range(0, 1 << 20)], expected)
+        self.assertEqual(table.size(), len(expected))
+        self.assertEqual(table.symbol_at(0x100 + 5).symbol, self.NAMES[5])
+
 
 if __name__ == '__main__':
     unittest.main()
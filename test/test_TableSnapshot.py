@@ -0,0 +1,112 @@
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+repo_home_path = Path(__file__).resolve().parent.parent
+sys.path.append(str(repo_home_path))
+
+from Modules.TableSnapshot import TableSnapshot
+from Modules.Symbol_Table_Builder import SymbolTable, SymbolData
+from Modules.Literal_Table_Builder import LiteralTableList, LiteralData
+from Modules.IntermediateFileParser import IntermediateFileParser
+from Modules.ErrorLogHandler import ErrorLogHandler
+
+INT_LINES = [
+    "1          00000     PROG:       START      0",
+    "2          00000     FIRST:      LDA        =0X05",
+    "3          00003                 END        FIRST",
+    "===SYM_START===",
+    "Symbol     Value      RFlag  IFlag  MFlag",
+    "FIRST      00000      1      1      0",
+    "PROG       00000      1      1      0",
+    "===SYM_END===",
+    "===LIT_START===",
+    "Literal    Value      Length Address",
+    "=0X05      05         1      00006",
+    "===LIT_END===",
+]
+
+
+class TestTableSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = os.path.join(self.temp_dir.name, "prog")
+        self.logger = ErrorLogHandler()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_symbol_table_round_trip(self):
+        table = SymbolTable(logger=self.logger)
+        table.insert(SymbolData("LOOP", 0x1003, True))
+        table.insert(SymbolData("loop", 7, True))
+        table.insert(SymbolData("K", -12, False, iflag=False, address=0x300))
+        table.insert(SymbolData("NONE", None, False))
+        digest = TableSnapshot.digest_lines(["LOOP", "K"])
+        self.assertTrue(table.save_snapshot(self.base + ".sym", digest))
+
+        loaded = SymbolTable(logger=self.logger)
+        self.assertTrue(loaded.load_snapshot(self.base + ".sym", digest))
+        self.assertEqual(str(loaded), str(table))
+        self.assertEqual([(s.symbol, s.value, s.rflag, s.iflag, s.mflag, s.address) for s in loaded],
+                         [(s.symbol, s.value, s.rflag, s.iflag, s.mflag, s.address) for s in table])
+
+    def test_stale_or_corrupt_snapshot_is_rejected(self):
+        table = SymbolTable(logger=self.logger)
+        table.insert(SymbolData("A", 1, True))
+        path = self.base + ".sym"
+        table.save_snapshot(path, TableSnapshot.digest_lines(["A 1"]))
+
+        self.assertFalse(SymbolTable(logger=self.logger).load_snapshot(path, TableSnapshot.digest_lines(["A 2"])))
+        with open(path, "r+b") as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b"\xff")
+        self.assertFalse(SymbolTable(logger=self.logger).load_snapshot(path))
+        self.assertFalse(SymbolTable(logger=self.logger).load_snapshot(self.base + ".missing"))
+
+    def test_literal_table_round_trip_keeps_field_types(self):
+        table = LiteralTableList(self.logger)
+        table.insert(LiteralData("=0X05", "05", "1", "00006"))
+        table.insert(LiteralData("=0CEOF", "454F46", 3, 0x1020))
+        table.insert(LiteralData("=0X00", "00", 1))
+        self.assertTrue(table.save_snapshot(self.base + ".lit"))
+
+        loaded = LiteralTableList(self.logger)
+        self.assertTrue(loaded.load_snapshot(self.base + ".lit"))
+        self.assertEqual([(l.name, l.value, l.length, l.address) for l in loaded.get_literals()],
+                         [(l.name, l.value, l.length, l.address) for l in table.get_literals()])
+
+    def parse(self):
+        symbol_table = SymbolTable(logger=self.logger)
+        literal_table = LiteralTableList(self.logger)
+        parser = IntermediateFileParser(symbol_table, literal_table, logger=self.logger,
+                                        int_file_content=INT_LINES, snapshot_base=self.base)
+        parser.parse_intermediate_file_content()
+        return parser
+
+    def test_parser_reuses_snapshots_without_validation(self):
+        first = self.parse()
+        self.assertTrue(os.path.exists(self.base + ".sym"))
+        self.assertTrue(os.path.exists(self.base + ".lit"))
+
+        with patch('Modules.IntermediateFileParser.Validator.valid_label') as valid_label:
+            second = self.parse()
+            valid_label.assert_not_called()
+        self.assertEqual(str(second.symbol_table), str(first.symbol_table))
+        self.assertEqual(str(second.literal_table), str(first.literal_table))
+        self.assertEqual(len(second.parsed_code_lines), len(first.parsed_code_lines))
+
+    def test_parser_ignores_snapshot_of_other_text(self):
+        self.parse()
+        edited = [line.replace("FIRST      00000", "FIRST      00003") for line in INT_LINES]
+        parser = IntermediateFileParser(SymbolTable(logger=self.logger), LiteralTableList(self.logger),
+                                        logger=self.logger, int_file_content=edited, snapshot_base=self.base)
+        parser.parse_intermediate_file_content()
+        self.assertEqual(parser.symbol_table.search("FIRST").value, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()